@@ -0,0 +1,39 @@
+"""Indexes for list endpoint filters and foreign keys
+
+Revision ID: 3d8e5b1f6a27
+Revises: 7f3a9c2e5d14
+Create Date: 2026-10-18 16:42:09.318254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8e5b1f6a27'
+down_revision: Union[str, None] = '7f3a9c2e5d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_charging_station_types_plug_count_efficiency', 'charging_station_types', ['plug_count', 'efficiency']),
+    ('ix_charging_station_types_current_type_efficiency', 'charging_station_types', ['current_type', 'efficiency']),
+    ('ix_charging_stations_type_id', 'charging_stations', ['type_id']),
+    ('ix_charging_stations_firmware_version_id', 'charging_stations', ['firmware_version', 'id']),
+    ('ix_connectors_charging_station_id_priority', 'connectors', ['charging_station_id', 'priority']),
+    ('ix_connectors_priority_id', 'connectors', ['priority', 'id']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,33 @@
+"""Add connector_count to charging stations
+
+Revision ID: 5c1e7a3d2b90
+Revises: a9261ddf7ad5
+Create Date: 2026-10-18 10:12:41.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a3d2b90'
+down_revision: Union[str, None] = 'a9261ddf7ad5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('charging_stations',
+    sa.Column('connector_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.execute(
+        "UPDATE charging_stations SET connector_count = ("
+        "SELECT count(*) FROM connectors WHERE connectors.charging_station_id = charging_stations.id"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('charging_stations', 'connector_count')
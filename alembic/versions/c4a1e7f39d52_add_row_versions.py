@@ -0,0 +1,30 @@
+"""Add row versions to charging station types, charging stations and connectors
+
+Revision ID: c4a1e7f39d52
+Revises: b6c2d9e41f03
+Create Date: 2026-10-18 18:20:44.610392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a1e7f39d52'
+down_revision: Union[str, None] = 'b6c2d9e41f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('charging_station_types', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('charging_stations', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('connectors', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('connectors', 'version')
+    op.drop_column('charging_stations', 'version')
+    op.drop_column('charging_station_types', 'version')
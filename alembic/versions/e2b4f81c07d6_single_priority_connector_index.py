@@ -0,0 +1,35 @@
+"""Single priority connector per charging station index
+
+Revision ID: e2b4f81c07d6
+Revises: 5c1e7a3d2b90
+Create Date: 2026-10-18 11:03:27.540918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b4f81c07d6'
+down_revision: Union[str, None] = '5c1e7a3d2b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stations could end up with several priority connectors before the index existed, keep the first one by id.
+    op.execute(
+        "UPDATE connectors SET priority = false FROM ("
+        "SELECT id, row_number() OVER (PARTITION BY charging_station_id ORDER BY id) AS position "
+        "FROM connectors WHERE priority"
+        ") AS priority_connectors "
+        "WHERE connectors.id = priority_connectors.id AND priority_connectors.position > 1"
+    )
+    op.create_index('uq_connectors_charging_station_id_priority', 'connectors', ['charging_station_id'],
+                    unique=True, postgresql_where=sa.text('priority'))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_connectors_charging_station_id_priority', table_name='connectors')
@@ -0,0 +1,169 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from pydantic import UUID4
+from fastapi import HTTPException
+import logging
+from ..models import models
+from ..utils.helpers import check_connector_count_station_list
+from ..utils.pagination import apply_keyset
+from ..utils.etag import (make_etag,
+                          charging_station_type_etag_statement,
+                          charging_station_etag_statement,
+                          connector_etag_statement)
+
+logger = logging.getLogger(__name__)
+
+
+async def get_charging_station_type(db: AsyncSession, charging_station_type_id: UUID4):
+    db_charging_station_type = await db.scalar(
+        select(models.ChargingStationType)
+        .options(selectinload(models.ChargingStationType.charging_stations).load_only(models.ChargingStation.id))
+        .filter(models.ChargingStationType.id == charging_station_type_id)
+    )
+    if not db_charging_station_type:
+        logger.error("Charging station type with ID: %s not found.", charging_station_type_id)
+        raise HTTPException(status_code=404, detail="ChargingStationType instance not found.")
+    return db_charging_station_type
+
+
+async def get_charging_station_type_etag(db: AsyncSession, charging_station_type_id: UUID4):
+    versions = (await db.execute(charging_station_type_etag_statement(charging_station_type_id))).one_or_none()
+    return make_etag("charging_station_type", charging_station_type_id, *versions) if versions else None
+
+
+async def get_charging_station_type_list(
+        db: AsyncSession,
+        plug_count: int,
+        min_efficiency: float,
+        max_efficiency: float,
+        current_type: models.CurrentTypeEnum,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+):
+    query = select(models.ChargingStationType)\
+        .options(selectinload(models.ChargingStationType.charging_stations).load_only(models.ChargingStation.id))
+
+    if plug_count is not None:
+        query = query.filter(models.ChargingStationType.plug_count == plug_count)
+    if min_efficiency is not None:
+        query = query.filter(models.ChargingStationType.efficiency >= min_efficiency)
+    if max_efficiency is not None:
+        query = query.filter(models.ChargingStationType.efficiency <= max_efficiency)
+    if current_type is not None:
+        query = query.filter(models.ChargingStationType.current_type == current_type)
+
+    if cursor is not None:
+        query = apply_keyset(query, models.ChargingStationType.id, cursor).limit(limit)
+    else:
+        query = query.offset(skip).limit(limit)
+    return (await db.scalars(query)).all()
+
+
+async def get_charging_station(db: AsyncSession, charging_station_id: UUID4):
+    db_charging_station = await db.scalar(
+        select(models.ChargingStation)
+        .options(joinedload(models.ChargingStation.type),
+                 selectinload(models.ChargingStation.connectors))
+        .filter(models.ChargingStation.id == charging_station_id)
+    )
+    if not db_charging_station:
+        logger.error("Charging station with ID: %s not found.", charging_station_id)
+        raise HTTPException(status_code=404, detail="ChargingStation instance not found.")
+
+    logger.info("Checking connector count constraint...")
+    if db_charging_station.type.plug_count != db_charging_station.connector_count:
+        logger.error(
+            "Unable to retrieve specified charging station. It has %s connectors instead of %s.",
+            db_charging_station.connector_count, db_charging_station.type.plug_count
+        )
+        raise HTTPException(
+            status_code=400,
+            detail=f"This Charging Station has {db_charging_station.connector_count} "
+                   f"connectors instead of {db_charging_station.type.plug_count}."
+        )
+    logger.info("Connector count constraint not violated.")
+    return db_charging_station
+
+
+async def get_charging_station_etag(db: AsyncSession, charging_station_id: UUID4):
+    versions = (await db.execute(charging_station_etag_statement(charging_station_id))).one_or_none()
+    return make_etag("charging_station", charging_station_id, *versions) if versions else None
+
+
+async def get_charging_station_list(
+        db: AsyncSession,
+        plug_count: int,
+        min_efficiency: float,
+        max_efficiency: float,
+        current_type: models.CurrentTypeEnum,
+        firmware_version: str,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+):
+    charging_stations = select(models.ChargingStation)\
+        .join(models.ChargingStationType)\
+        .options(joinedload(models.ChargingStation.type),
+                 selectinload(models.ChargingStation.connectors))
+
+    if plug_count is not None:
+        charging_stations = charging_stations.filter(models.ChargingStationType.plug_count == plug_count)
+    if min_efficiency is not None:
+        charging_stations = charging_stations.filter(models.ChargingStationType.efficiency >= min_efficiency)
+    if max_efficiency is not None:
+        charging_stations = charging_stations.filter(models.ChargingStationType.efficiency <= max_efficiency)
+    if current_type is not None:
+        charging_stations = charging_stations.filter(models.ChargingStationType.current_type == current_type)
+    if firmware_version is not None:
+        charging_stations = charging_stations.filter(models.ChargingStation.firmware_version == firmware_version)
+
+    if cursor is not None:
+        charging_stations = apply_keyset(charging_stations, models.ChargingStation.id, cursor).limit(limit)
+    else:
+        charging_stations = charging_stations.offset(skip).limit(limit)
+    result = (await db.scalars(charging_stations)).all()
+
+    logger.info("Checking connector count constraint...")
+    check_connector_count_station_list(result)
+    logger.info("Connector count constraint not violated.")
+    return result
+
+
+async def get_connector(db: AsyncSession, connector_id: UUID4):
+    db_connector = await db.scalar(
+        select(models.Connector)
+        .filter(models.Connector.id == connector_id)
+    )
+    if not db_connector:
+        logger.error("Connector with ID: %s not found.", connector_id)
+        raise HTTPException(status_code=404, detail="Connector instance not found.")
+    return db_connector
+
+
+async def get_connector_etag(db: AsyncSession, connector_id: UUID4):
+    version = (await db.execute(connector_etag_statement(connector_id))).scalar_one_or_none()
+    return make_etag("connector", connector_id, version) if version else None
+
+
+async def get_connector_list(
+        db: AsyncSession,
+        priority: bool,
+        charging_station_id: UUID4,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+):
+    query = select(models.Connector)
+
+    if priority is not None:
+        query = query.filter(models.Connector.priority == priority)
+    if charging_station_id is not None:
+        query = query.filter(models.Connector.charging_station_id == charging_station_id)
+
+    if cursor is not None:
+        query = apply_keyset(query, models.Connector.id, cursor).limit(limit)
+    else:
+        query = query.offset(skip).limit(limit)
+    return (await db.scalars(query)).all()
@@ -1,26 +1,78 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import insert, select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
 from pydantic import UUID4
+from typing import List
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 import logging
+import uuid
 from ..models import models
 from ..schemas import schemas
-from ..utils.helpers import (check_priority_constraint_connector,
+from ..utils.helpers import (check_priority_constraint_violation,
                              check_priority_constraint_station,
                              check_connector_count_connector,
                              check_connector_count_station,
+                             check_connector_count_station_list,
                              check_connector_count_connector_update,
-                             check_priority_constraint_connector_update)
-from ..utils.auth import get_password_hash
+                             validate_charging_station_batch,
+                             check_priority_constraint_batch,
+                             check_charging_stations_exist,
+                             check_connector_count_station_batch)
+from ..utils.auth import get_password_hash, get_password_hash_async, invalidate_principal
+from ..utils.pagination import apply_keyset
+from ..utils.etag import (make_etag,
+                          charging_station_type_etag_statement,
+                          charging_station_etag_statement,
+                          connector_etag_statement)
+from ..utils.response_cache import response_cache, CHARGING_STATION_TYPES, CHARGING_STATIONS, CONNECTORS
 
 logger = logging.getLogger(__name__)
 
 
+def _bump_version(db: Session, instance):
+    # Incremented in SQL, so that concurrent updates of the same row each count.
+    if db.is_modified(instance):
+        instance.version = type(instance).version + 1
+
+
+def _bump_charging_station_type_versions(db: Session, charging_station_type_ids):
+    # The type responses list their charging stations, so the types' versions (and ETags) follow that list.
+    db.query(models.ChargingStationType)\
+        .filter(models.ChargingStationType.id.in_(charging_station_type_ids))\
+        .update(
+            {models.ChargingStationType.version: models.ChargingStationType.version + 1},
+            synchronize_session=False
+        )
+
+
+def _adjust_connector_count(db: Session, charging_station_id: UUID4, delta: int):
+    return db.query(models.ChargingStation)\
+        .filter(models.ChargingStation.id == charging_station_id)\
+        .update(
+            {models.ChargingStation.connector_count: models.ChargingStation.connector_count + delta},
+            synchronize_session=False
+        )
+
+
+def _recount_connectors(db: Session, charging_station_ids: set):
+    db.query(models.ChargingStation)\
+        .filter(models.ChargingStation.id.in_(charging_station_ids))\
+        .update(
+            {models.ChargingStation.connector_count: select(func.count(models.Connector.id))
+                .where(models.Connector.charging_station_id == models.ChargingStation.id)
+                .scalar_subquery()},
+            synchronize_session=False
+        )
+
+
 def create_charging_station_type(db: Session, charging_station_type_data: schemas.ChargingStationTypeCreate):
     try:
         db_charging_station_type = models.ChargingStationType(**charging_station_type_data.model_dump())
         db.add(db_charging_station_type)
         db.commit()
+        response_cache.invalidate(CHARGING_STATION_TYPES)
         db.refresh(db_charging_station_type)
         return db_charging_station_type
     except IntegrityError:
@@ -42,14 +94,20 @@ def create_charging_station_type(db: Session, charging_station_type_data: schema
 
 def get_charging_station_type(db: Session, charging_station_type_id: UUID4):
     db_charging_station_type = db.query(models.ChargingStationType)\
+        .options(selectinload(models.ChargingStationType.charging_stations).load_only(models.ChargingStation.id))\
         .filter(models.ChargingStationType.id == charging_station_type_id)\
         .first()
     if not db_charging_station_type:
-        logger.error(f"Charging station type with ID: {charging_station_type_id} not found.")
+        logger.error("Charging station type with ID: %s not found.", charging_station_type_id)
         raise HTTPException(status_code=404, detail="ChargingStationType instance not found.")
     return db_charging_station_type
 
 
+def get_charging_station_type_etag(db: Session, charging_station_type_id: UUID4):
+    versions = db.execute(charging_station_type_etag_statement(charging_station_type_id)).one_or_none()
+    return make_etag("charging_station_type", charging_station_type_id, *versions) if versions else None
+
+
 def get_charging_station_type_list(
         db: Session,
         plug_count: int,
@@ -58,8 +116,10 @@ def get_charging_station_type_list(
         current_type: models.CurrentTypeEnum,
         skip: int,
         limit: int,
+        cursor: str | None = None,
 ):
-    query = db.query(models.ChargingStationType)
+    query = db.query(models.ChargingStationType)\
+        .options(selectinload(models.ChargingStationType.charging_stations).load_only(models.ChargingStation.id))
 
     if plug_count is not None:
         query = query.filter(models.ChargingStationType.plug_count == plug_count)
@@ -70,6 +130,8 @@ def get_charging_station_type_list(
     if current_type is not None:
         query = query.filter(models.ChargingStationType.current_type == current_type)
 
+    if cursor is not None:
+        return apply_keyset(query, models.ChargingStationType.id, cursor).limit(limit).all()
     return query.offset(skip).limit(limit).all()
 
 
@@ -82,12 +144,14 @@ def update_charging_station_type(
         .filter(models.ChargingStationType.id == charging_station_type_id)\
         .first()
     if not db_charging_station_type:
-        logger.error(f"Charging station type with ID: {charging_station_type_id} not found.")
+        logger.error("Charging station type with ID: %s not found.", charging_station_type_id)
         raise HTTPException(status_code=404, detail="ChargingStationType instance not found.")
     for key, value in charging_station_type_data.model_dump().items():
         setattr(db_charging_station_type, key, value)
+    _bump_version(db, db_charging_station_type)
     try:
         db.commit()
+        response_cache.invalidate(CHARGING_STATION_TYPES)
         db.refresh(db_charging_station_type)
         return db_charging_station_type
     except IntegrityError:
@@ -112,11 +176,12 @@ def delete_charging_station_type(db: Session, charging_station_type_id: UUID4):
         .filter(models.ChargingStationType.id == charging_station_type_id)\
         .first()
     if not db_charging_station_type:
-        logger.error(f"Charging station type with ID: {charging_station_type_id} not found.")
+        logger.error("Charging station type with ID: %s not found.", charging_station_type_id)
         raise HTTPException(status_code=404, detail="ChargingStationType instance not found.")
     try:
         db.delete(db_charging_station_type)
         db.commit()
+        response_cache.invalidate(CHARGING_STATION_TYPES)
     except IntegrityError:
         logger.error("An integrity error occurred while deleting a charging station type.", exc_info=True)
         db.rollback()
@@ -143,7 +208,10 @@ def create_charging_station(db: Session, charging_station_data: schemas.Charging
     logger.info("Connector count constraint not violated.")
 
     try:
-        db_charging_station = models.ChargingStation(**charging_station_data.model_dump(exclude={'connectors'}))
+        db_charging_station = models.ChargingStation(
+            **charging_station_data.model_dump(exclude={'connectors'}),
+            connector_count=len(charging_station_data.connectors)
+        )
         db.add(db_charging_station)
         db.flush()
 
@@ -151,13 +219,16 @@ def create_charging_station(db: Session, charging_station_data: schemas.Charging
         for connector_data in connectors_data:
             connector = models.Connector(**connector_data.model_dump())
             db_charging_station.connectors.append(connector)
+        _bump_charging_station_type_versions(db, [charging_station_data.type_id])
 
         db.commit()
+        response_cache.invalidate(CHARGING_STATIONS, CONNECTORS)
         db.refresh(db_charging_station)
         return db_charging_station
-    except IntegrityError:
+    except IntegrityError as e:
         logger.error("An integrity error occurred while creating a charging station.", exc_info=True)
         db.rollback()
+        check_priority_constraint_violation(e)
         raise HTTPException(
             status_code=400,
             detail="Provided data violates the database's integrity. "
@@ -172,29 +243,85 @@ def create_charging_station(db: Session, charging_station_data: schemas.Charging
         )
 
 
+def create_charging_station_bulk(db: Session, charging_stations_data: List[schemas.ChargingStationCreate]):
+    logger.info("Validating a batch of %s charging stations...", len(charging_stations_data))
+    valid, errors = validate_charging_station_batch(db, charging_stations_data)
+    logger.info("%s charging stations passed validation, %s rejected.", len(valid), len(errors))
+
+    charging_station_rows, connector_rows = [], []
+    for _, charging_station_data in valid:
+        charging_station_id = uuid.uuid4()
+        charging_station_rows.append({
+            "id": charging_station_id,
+            **charging_station_data.model_dump(exclude={'connectors'}),
+            "connector_count": len(charging_station_data.connectors)
+        })
+        connector_rows.extend(
+            {"id": uuid.uuid4(), "charging_station_id": charging_station_id, **connector_data.model_dump()}
+            for connector_data in charging_station_data.connectors
+        )
+
+    if charging_station_rows:
+        try:
+            db.execute(insert(models.ChargingStation), charging_station_rows)
+            if connector_rows:
+                db.execute(insert(models.Connector), connector_rows)
+            _bump_charging_station_type_versions(db, {row["type_id"] for row in charging_station_rows})
+            db.commit()
+            response_cache.invalidate(CHARGING_STATIONS, CONNECTORS)
+        except IntegrityError as e:
+            logger.error("An integrity error occurred while creating charging stations in bulk.", exc_info=True)
+            db.rollback()
+            check_priority_constraint_violation(e)
+            raise HTTPException(
+                status_code=400,
+                detail="Provided data violates the database's integrity. "
+                       "Make sure that unique and not-null constraints aren't ignored."
+            )
+        except Exception:
+            logger.error("An error occurred while creating charging stations in bulk.", exc_info=True)
+            db.rollback()
+            raise HTTPException(
+                status_code=500,
+                detail="An unexpected error occurred."
+            )
+
+    return schemas.ChargingStationBulkResult(
+        created=[charging_station_row["id"] for charging_station_row in charging_station_rows],
+        errors=errors
+    )
+
+
 def get_charging_station(db: Session, charging_station_id: UUID4):
     db_charging_station = db.query(models.ChargingStation)\
+        .options(joinedload(models.ChargingStation.type),
+                 selectinload(models.ChargingStation.connectors))\
         .filter(models.ChargingStation.id == charging_station_id)\
         .first()
     if not db_charging_station:
-        logger.error(f"Charging station with ID: {charging_station_id} not found.")
+        logger.error("Charging station with ID: %s not found.", charging_station_id)
         raise HTTPException(status_code=404, detail="ChargingStation instance not found.")
 
     logger.info("Checking connector count constraint...")
-    if db_charging_station.type.plug_count != len(db_charging_station.connectors):
+    if db_charging_station.type.plug_count != db_charging_station.connector_count:
         logger.error(
-            f"Unable to retrieve specified charging station. It has {len(db_charging_station.connectors)} "
-            f"connectors instead of {db_charging_station.type.plug_count}."
+            "Unable to retrieve specified charging station. It has %s connectors instead of %s.",
+            db_charging_station.connector_count, db_charging_station.type.plug_count
         )
         raise HTTPException(
             status_code=400,
-            detail=f"This Charging Station has {len(db_charging_station.connectors)} "
+            detail=f"This Charging Station has {db_charging_station.connector_count} "
                    f"connectors instead of {db_charging_station.type.plug_count}."
         )
     logger.info("Connector count constraint not violated.")
     return db_charging_station
 
 
+def get_charging_station_etag(db: Session, charging_station_id: UUID4):
+    versions = db.execute(charging_station_etag_statement(charging_station_id)).one_or_none()
+    return make_etag("charging_station", charging_station_id, *versions) if versions else None
+
+
 def get_charging_station_list(
         db: Session,
         plug_count: int,
@@ -204,6 +331,7 @@ def get_charging_station_list(
         firmware_version: str,
         skip: int,
         limit: int,
+        cursor: str | None = None,
 ):
     charging_stations = db.query(models.ChargingStation)\
         .join(models.ChargingStationType)\
@@ -221,17 +349,24 @@ def get_charging_station_list(
     if firmware_version is not None:
         charging_stations = charging_stations.filter(models.ChargingStation.firmware_version == firmware_version)
 
+    if cursor is not None:
+        charging_stations = apply_keyset(charging_stations, models.ChargingStation.id, cursor).limit(limit)
+    else:
+        charging_stations = charging_stations.offset(skip).limit(limit)
+    result = charging_stations.all()
+
     logger.info("Checking connector count constraint...")
-    for station in charging_stations:
-        if len(station.connectors) != station.type.plug_count:
-            logger.error("Connector count constraint violation.")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Charging station with id={station.id} has {len(station.connectors)} "
-                       f"connectors instead of {station.type.plug_count}."
-            )
+    check_connector_count_station_list(result)
     logger.info("Connector count constraint not violated.")
-    return charging_stations.offset(skip).limit(limit).all()
+    return result
+
+
+def stream_charging_stations(db: Session, batch_size: int):
+    return db.query(models.ChargingStation)\
+        .options(joinedload(models.ChargingStation.type),
+                 selectinload(models.ChargingStation.connectors))\
+        .order_by(models.ChargingStation.id)\
+        .yield_per(batch_size)
 
 
 def update_charging_station(
@@ -245,34 +380,75 @@ def update_charging_station(
     logger.info("Checking connector count constraint...")
     check_connector_count_station(db, charging_station_data)
     logger.info("Connector count constraint not violated.")
+    connectors_data = {connector_data.name: connector_data for connector_data in charging_station_data.connectors}
+    if len(connectors_data) != len(charging_station_data.connectors):
+        logger.error("Duplicate connector names in the charging station data.")
+        raise HTTPException(status_code=400, detail="Connector names must be unique.")
 
     db_charging_station = db.query(models.ChargingStation)\
         .filter(models.ChargingStation.id == charging_station_id)\
         .first()
     if not db_charging_station:
-        logger.error(f"Charging station with ID: {charging_station_id} not found.")
+        logger.error("Charging station with ID: %s not found.", charging_station_id)
         raise HTTPException(status_code=404, detail="ChargingStation instance not found.")
 
+    previous_type_id = db_charging_station.type_id
     update_data = charging_station_data.model_dump(exclude={'connectors'})
     for key, value in update_data.items():
         setattr(db_charging_station, key, value)
+    db_charging_station.connector_count = len(charging_station_data.connectors)
+    _bump_version(db, db_charging_station)
+
     try:
-        existing_connectors = db_charging_station.connectors
-        for connector in existing_connectors:
-            db.delete(connector)
-            db.flush()
+        existing_connectors = {
+            name: (connector_id, priority) for connector_id, name, priority in
+            db.query(models.Connector.id, models.Connector.name, models.Connector.priority)
+            .filter(models.Connector.charging_station_id == charging_station_id)
+        }
+        removed_ids = [
+            connector_id for name, (connector_id, _) in existing_connectors.items() if name not in connectors_data
+        ]
+        changed = {
+            connector_id: connectors_data[name].priority
+            for name, (connector_id, priority) in existing_connectors.items()
+            if name in connectors_data and connectors_data[name].priority != priority
+        }
+        new_connectors = [
+            {"id": uuid.uuid4(), "charging_station_id": charging_station_id, **connector_data.model_dump()}
+            for name, connector_data in connectors_data.items() if name not in existing_connectors
+        ]
+        logger.debug(
+            "Connector diff: %s removed, %s changed, %s added.",
+            len(removed_ids), len(changed), len(new_connectors)
+        )
 
-        connectors_data = charging_station_data.connectors
-        for connector_data in connectors_data:
-            connector = models.Connector(**connector_data.model_dump())
-            db_charging_station.connectors.append(connector)
+        if removed_ids:
+            db.query(models.Connector)\
+                .filter(models.Connector.id.in_(removed_ids))\
+                .delete(synchronize_session=False)
+        # Priority is dropped before it is granted so the partial unique index never sees two holders.
+        for priority in (False, True):
+            changed_ids = [connector_id for connector_id, value in changed.items() if value is priority]
+            if changed_ids:
+                db.query(models.Connector)\
+                    .filter(models.Connector.id.in_(changed_ids))\
+                    .update(
+                        {models.Connector.priority: priority, models.Connector.version: models.Connector.version + 1},
+                        synchronize_session=False
+                    )
+        if new_connectors:
+            db.execute(insert(models.Connector), new_connectors)
+        if previous_type_id != charging_station_data.type_id:
+            _bump_charging_station_type_versions(db, [previous_type_id, charging_station_data.type_id])
 
         db.commit()
+        response_cache.invalidate(CHARGING_STATIONS, CONNECTORS)
         db.refresh(db_charging_station)
         return db_charging_station
-    except IntegrityError:
+    except IntegrityError as e:
         logger.error("An integrity error occurred while updating a charging station.", exc_info=True)
         db.rollback()
+        check_priority_constraint_violation(e)
         raise HTTPException(
             status_code=400,
             detail="Provided data violates the database's integrity. "
@@ -292,11 +468,20 @@ def delete_charging_station(db: Session, charging_station_id: UUID4):
         .filter(models.ChargingStation.id == charging_station_id)\
         .first()
     if not db_charging_station:
-        logger.error(f"Charging station with ID: {charging_station_id} not found.")
+        logger.error("Charging station with ID: %s not found.", charging_station_id)
         raise HTTPException(status_code=404, detail="ChargingStation instance not found.")
     try:
+        # Detach the connectors in one statement, bumping their versions so that their ETags change.
+        db.query(models.Connector)\
+            .filter(models.Connector.charging_station_id == charging_station_id)\
+            .update(
+                {models.Connector.charging_station_id: None, models.Connector.version: models.Connector.version + 1},
+                synchronize_session=False
+            )
+        _bump_charging_station_type_versions(db, [db_charging_station.type_id])
         db.delete(db_charging_station)
         db.commit()
+        response_cache.invalidate(CHARGING_STATIONS, CONNECTORS)
     except Exception:
         logger.error("An error occurred while deleting a charging station.", exc_info=True)
         db.rollback()
@@ -308,10 +493,6 @@ def delete_charging_station(db: Session, charging_station_id: UUID4):
 
 def create_connector(db: Session, connector_data: schemas.ConnectorCreate):
     if connector_data.model_dump().get('charging_station_id') is not None:
-        if connector_data.priority is True:
-            logger.info("Checking connector priority constraint...")
-            check_priority_constraint_connector(db, connector_data.charging_station_id)
-            logger.info("Connector priority constraint not violated.")
         logger.info("Checking connector count constraint...")
         check_connector_count_connector(db, connector_data.charging_station_id)
         logger.info("Connector count constraint not violated.")
@@ -319,12 +500,16 @@ def create_connector(db: Session, connector_data: schemas.ConnectorCreate):
     try:
         db_connector = models.Connector(**connector_data.model_dump())
         db.add(db_connector)
+        if db_connector.charging_station_id is not None:
+            _adjust_connector_count(db, db_connector.charging_station_id, 1)
         db.commit()
+        response_cache.invalidate(CONNECTORS, CHARGING_STATIONS)
         db.refresh(db_connector)
         return db_connector
-    except IntegrityError:
+    except IntegrityError as e:
         logger.error("An integrity error occurred while creating a connector.", exc_info=True)
         db.rollback()
+        check_priority_constraint_violation(e)
         raise HTTPException(
             status_code=400,
             detail="Provided data violates the database's integrity. "
@@ -344,17 +529,23 @@ def get_connector(db: Session, connector_id: UUID4):
         .filter(models.Connector.id == connector_id)\
         .first()
     if not db_connector:
-        logger.error(f"Connector with ID: {connector_id} not found.")
+        logger.error("Connector with ID: %s not found.", connector_id)
         raise HTTPException(status_code=404, detail="Connector instance not found.")
     return db_connector
 
 
+def get_connector_etag(db: Session, connector_id: UUID4):
+    version = db.execute(connector_etag_statement(connector_id)).scalar_one_or_none()
+    return make_etag("connector", connector_id, version) if version else None
+
+
 def get_connector_list(
         db: Session,
         priority: bool,
         charging_station_id: UUID4,
         skip: int,
         limit: int,
+        cursor: str | None = None,
 ):
     query = db.query(models.Connector)
 
@@ -363,6 +554,8 @@ def get_connector_list(
     if charging_station_id is not None:
         query = query.filter(models.Connector.charging_station_id == charging_station_id)
 
+    if cursor is not None:
+        return apply_keyset(query, models.Connector.id, cursor).limit(limit).all()
     return query.offset(skip).limit(limit).all()
 
 
@@ -375,15 +568,30 @@ def update_connector(
         .filter(models.Connector.id == connector_id)\
         .first()
     if not db_connector:
-        logger.error(f"Connector with ID: {connector_id} not found.")
+        logger.error("Connector with ID: %s not found.", connector_id)
         raise HTTPException(status_code=404, detail="Connector instance not found.")
+    previous_charging_station_id = db_connector.charging_station_id
     for key, value in connector_data.model_dump().items():
         setattr(db_connector, key, value)
+    _bump_version(db, db_connector)
+
+    if previous_charging_station_id != db_connector.charging_station_id:
+        with db.no_autoflush:
+            if previous_charging_station_id is not None:
+                _adjust_connector_count(db, previous_charging_station_id, -1)
+            if db_connector.charging_station_id is not None \
+                    and _adjust_connector_count(db, db_connector.charging_station_id, 1):
+                check_connector_count_connector_update(db, db_connector.charging_station_id)
+
     try:
-        db.flush()
-    except IntegrityError:
+        db.commit()
+        response_cache.invalidate(CONNECTORS, CHARGING_STATIONS)
+        db.refresh(db_connector)
+        return db_connector
+    except IntegrityError as e:
         logger.error("An integrity error occurred while updating a connector.", exc_info=True)
         db.rollback()
+        check_priority_constraint_violation(e)
         raise HTTPException(
             status_code=400,
             detail="Provided data violates database's integrity. "
@@ -397,13 +605,88 @@ def update_connector(
             detail="An unexpected error occurred."
         )
 
-    if connector_data.model_dump().get('charging_station_id') is not None:
-        check_connector_count_connector_update(db, connector_data.charging_station_id)
-        check_priority_constraint_connector_update(db, connector_data.charging_station_id)
 
-    db.commit()
-    db.refresh(db_connector)
-    return db_connector
+def upsert_connector_bulk(db: Session, connectors_data: List[schemas.ConnectorCreate]):
+    names = [connector_data.name for connector_data in connectors_data]
+    if len(names) != len(set(names)):
+        logger.error("Duplicate connector names in the batch.")
+        raise HTTPException(status_code=400, detail="Connector names must be unique.")
+    if not connectors_data:
+        return []
+
+    logger.info("Checking connector priority constraint...")
+    check_priority_constraint_batch(connectors_data)
+    logger.info("Connector priority constraint not violated.")
+
+    charging_station_ids = {
+        connector_data.charging_station_id for connector_data in connectors_data
+        if connector_data.charging_station_id is not None
+    }
+    check_charging_stations_exist(db, charging_station_ids)
+
+    try:
+        previous_charging_station_ids = {
+            charging_station_id for charging_station_id, in
+            db.query(models.Connector.charging_station_id)
+            .filter(models.Connector.name.in_(names), models.Connector.charging_station_id.isnot(None))
+            .distinct()
+        }
+        affected_charging_station_ids = charging_station_ids | previous_charging_station_ids
+
+        # Clear priority first so that moving it between connectors of one station
+        # doesn't trip the partial unique index halfway through the upsert.
+        db.query(models.Connector)\
+            .filter(models.Connector.name.in_(names), models.Connector.priority.is_(True))\
+            .update(
+                {models.Connector.priority: False, models.Connector.version: models.Connector.version + 1},
+                synchronize_session=False
+            )
+
+        statement = pg_insert(models.Connector).values([
+            {"id": uuid.uuid4(), **connector_data.model_dump()} for connector_data in connectors_data
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[models.Connector.name],
+            set_={
+                "priority": statement.excluded.priority,
+                "charging_station_id": statement.excluded.charging_station_id,
+                "version": models.Connector.version + 1
+            }
+        ).returning(models.Connector)
+        # Build the response from the RETURNING rows before the commit expires them,
+        # otherwise serialising it reloads every connector one query at a time.
+        result = [
+            schemas.Connector.model_validate(connector)
+            for connector in db.scalars(statement, execution_options={"populate_existing": True})
+        ]
+
+        if affected_charging_station_ids:
+            _recount_connectors(db, affected_charging_station_ids)
+            logger.info("Checking connector count constraint...")
+            check_connector_count_station_batch(db, affected_charging_station_ids)
+            logger.info("Connector count constraint not violated.")
+
+        db.commit()
+        response_cache.invalidate(CONNECTORS, CHARGING_STATIONS)
+        return result
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        logger.error("An integrity error occurred while upserting connectors in bulk.", exc_info=True)
+        db.rollback()
+        check_priority_constraint_violation(e)
+        raise HTTPException(
+            status_code=400,
+            detail="Provided data violates the database's integrity. "
+                   "Make sure that unique and not-null constraints aren't ignored."
+        )
+    except Exception:
+        logger.error("An error occurred while upserting connectors in bulk.", exc_info=True)
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred."
+        )
 
 
 def delete_connector(db: Session, connector_id: UUID4):
@@ -411,11 +694,14 @@ def delete_connector(db: Session, connector_id: UUID4):
         .filter(models.Connector.id == connector_id)\
         .first()
     if not db_connector:
-        logger.error(f"Connector with ID: {connector_id} not found.")
+        logger.error("Connector with ID: %s not found.", connector_id)
         raise HTTPException(status_code=404, detail="Connector instance not found.")
     try:
+        if db_connector.charging_station_id is not None:
+            _adjust_connector_count(db, db_connector.charging_station_id, -1)
         db.delete(db_connector)
         db.commit()
+        response_cache.invalidate(CONNECTORS, CHARGING_STATIONS)
     except Exception:
         logger.error("An error occurred while deleting a connector.", exc_info=True)
         db.rollback()
@@ -425,14 +711,15 @@ def delete_connector(db: Session, connector_id: UUID4):
         )
 
 
-def create_user(db: Session, user_data: schemas.UserCreate):
-    db_user = db.query(models.User).filter(models.User.username == user_data.username).first()
+def _check_username_available(db: Session, username: str):
+    db_user = db.query(models.User).filter(models.User.username == username).first()
     if db_user:
-        logger.error(f"Username '{user_data.username}' is already used.")
-        raise HTTPException(status_code=400, detail=f"Username '{user_data.username}' is already registered.")
+        logger.error("Username '%s' is already used.", username)
+        raise HTTPException(status_code=400, detail=f"Username '{username}' is already registered.")
+
 
-    hashed_password = get_password_hash(user_data.password)
-    new_user = models.User(username=user_data.username, hashed_password=hashed_password)
+def _insert_user(db: Session, username: str, hashed_password: str):
+    new_user = models.User(username=username, hashed_password=hashed_password)
     try:
         db.add(new_user)
         db.commit()
@@ -447,16 +734,33 @@ def create_user(db: Session, user_data: schemas.UserCreate):
         )
 
 
-def update_user(db: Session, username: str, user_data: schemas.UserCreate):
+def create_user(db: Session, user_data: schemas.UserCreate):
+    _check_username_available(db, user_data.username)
+    return _insert_user(db, user_data.username, get_password_hash(user_data.password))
+
+
+async def create_user_async(db: Session, user_data: schemas.UserCreate):
+    """Same as create_user, but awaits the bcrypt hash instead of holding a threadpool thread for it."""
+    await run_in_threadpool(_check_username_available, db, user_data.username)
+    hashed_password = await get_password_hash_async(user_data.password)
+    return await run_in_threadpool(_insert_user, db, user_data.username, hashed_password)
+
+
+def _get_user_or_404(db: Session, username: str):
     db_user = db.query(models.User).filter(models.User.username == username).first()
     if not db_user:
-        logger.error(f"User '{username}' not found.")
+        logger.error("User '%s' not found.", username)
         raise HTTPException(status_code=404, detail=f"User '{username}' not found.")
+    return db_user
+
 
-    db_user.username = user_data.username
-    db_user.hashed_password = get_password_hash(user_data.password)
+def _save_user_credentials(db: Session, db_user: models.User, new_username: str, hashed_password: str):
+    username = db_user.username
+    db_user.username = new_username
+    db_user.hashed_password = hashed_password
     try:
         db.commit()
+        invalidate_principal(username)
         db.refresh(db_user)
         return db_user
     except IntegrityError:
@@ -476,14 +780,27 @@ def update_user(db: Session, username: str, user_data: schemas.UserCreate):
         )
 
 
+def update_user(db: Session, username: str, user_data: schemas.UserCreate):
+    db_user = _get_user_or_404(db, username)
+    return _save_user_credentials(db, db_user, user_data.username, get_password_hash(user_data.password))
+
+
+async def update_user_async(db: Session, username: str, user_data: schemas.UserCreate):
+    """Same as update_user, but awaits the bcrypt hash instead of holding a threadpool thread for it."""
+    db_user = await run_in_threadpool(_get_user_or_404, db, username)
+    hashed_password = await get_password_hash_async(user_data.password)
+    return await run_in_threadpool(_save_user_credentials, db, db_user, user_data.username, hashed_password)
+
+
 def delete_user(db: Session, username: str):
     db_user = db.query(models.User).filter(models.User.username == username).first()
     if not db_user:
-        logger.error(f"User '{username}' not found.")
+        logger.error("User '%s' not found.", username)
         raise HTTPException(status_code=404, detail=f"User {username} not found.")
     try:
         db.delete(db_user)
         db.commit()
+        invalidate_principal(username)
     except Exception:
         logger.error("An error occurred while deleting a user.", exc_info=True)
         db.rollback()
@@ -0,0 +1,37 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from .database import SQLALCHEMY_DATABASE_URL, POOL_SETTINGS
+from .pool_metrics import PoolMetrics, instrument_pool_class
+from ..utils.metrics import instrument_engine
+from ..utils.query_counter import count_request_queries
+import os
+from dotenv import load_dotenv
+import logging
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def to_async_url(database_url: str) -> str:
+    return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(SQLALCHEMY_DATABASE_URL)
+
+async_pool_metrics = PoolMetrics()
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    poolclass=instrument_pool_class(AsyncAdaptedQueuePool, async_pool_metrics),
+    **POOL_SETTINGS
+)
+instrument_engine(async_engine.sync_engine, "async", async_pool_metrics)
+count_request_queries(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
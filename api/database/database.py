@@ -1,7 +1,11 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from .base import Base
 from .seed import seed_charging_station_types
+from .pool_metrics import PoolMetrics, instrument_pool_class
+from ..utils.metrics import instrument_engine
+from ..utils.query_counter import count_request_queries
 import os
 from dotenv import load_dotenv
 import logging
@@ -11,8 +15,30 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_MODE = os.getenv("DATABASE_MODE", "sync")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+POOL_SETTINGS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+    "pool_recycle": DB_POOL_RECYCLE,
+}
+
+pool_metrics = PoolMetrics()
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=instrument_pool_class(QueuePool, pool_metrics),
+    **POOL_SETTINGS
+)
+instrument_engine(engine, "sync", pool_metrics)
+count_request_queries(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -38,3 +64,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_session_factory():
+    return SessionLocal
@@ -0,0 +1,88 @@
+import threading
+import time
+from bisect import bisect_left
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """Histogram of how long connection checkouts waited on the pool queue, plus checkout timeouts.
+
+    Opening a new connection when the pool has spare capacity is not counted as waiting.
+
+    Observers are called with every wait time and timeout observers on every timeout, so that other metric
+    backends can record the same values.
+    """
+
+    def __init__(self, buckets: tuple = CHECKOUT_WAIT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.timeouts = 0
+        self.lock = threading.Lock()
+        self.observers = []
+        self.timeout_observers = []
+
+    def observe(self, seconds: float):
+        with self.lock:
+            self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+        for observer in self.observers:
+            observer(seconds)
+
+    def observe_timeout(self):
+        with self.lock:
+            self.timeouts += 1
+        for observer in self.timeout_observers:
+            observer()
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), self.bucket_counts):
+                cumulative += bucket_count
+                buckets[str(bound)] = cumulative
+            return {"count": self.count, "sum": self.total, "timeouts": self.timeouts, "buckets": buckets}
+
+
+def instrument_pool_class(pool_class: type, metrics: PoolMetrics) -> type:
+    class InstrumentedPool(pool_class):
+        def _create_connection(self):
+            start = time.perf_counter()
+            connection = super()._create_connection()
+            connection.connect_seconds = time.perf_counter() - start
+            return connection
+
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.observe_timeout()
+                raise
+            wait = time.perf_counter() - start
+            # A fresh connection was opened by this checkout because the pool had spare capacity; the time spent
+            # connecting is setup latency, not queueing, so it is left out of the wait.
+            if connection.fresh:
+                wait = max(wait - connection.connect_seconds, 0.0)
+            metrics.observe(wait)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+def pool_stats(engine: Engine, metrics: PoolMetrics) -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkout_wait_seconds": metrics.snapshot(),
+    }
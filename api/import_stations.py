@@ -0,0 +1,36 @@
+import argparse
+import logging
+from .database.database import SessionLocal
+from .utils.export import ExportFormatEnum
+from .utils.importer import import_charging_stations, IMPORT_BATCH_SIZE
+from .utils.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import charging stations from an NDJSON or CSV file.")
+    parser.add_argument("path", help="File to import.")
+    parser.add_argument(
+        "--format",
+        choices=[export_format.value for export_format in ExportFormatEnum],
+        help="Format of the file. Guessed from its extension if not provided."
+    )
+    parser.add_argument("--rejects", help="Where to write rejected records. Defaults to <path>.rejects.csv.")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Records copied per COPY batch.")
+    args = parser.parse_args(argv)
+
+    import_format = ExportFormatEnum(args.format or ("csv" if args.path.endswith(".csv") else "ndjson"))
+    rejects_path = args.rejects or f"{args.path}.rejects.csv"
+
+    with open(args.path, "rb") as source, open(rejects_path, "w", newline="") as rejects_file, SessionLocal() as db:
+        result = import_charging_stations(db, source, import_format, rejects_file, args.batch_size)
+
+    logger.info("Imported %s charging stations, rejected %s.", result["imported"], result["rejected"])
+    if result["rejected"]:
+        logger.info("Rejected records were written to %s.", rejects_path)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    main()
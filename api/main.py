@@ -1,23 +1,38 @@
 from fastapi import FastAPI
-from .database.database import init_db
-from .routers import charging_station_type_router, charging_station_router, connector_router, token_router, user_router
+from fastapi.responses import ORJSONResponse
+from .database.database import init_db, DATABASE_MODE
+from .routers import (charging_station_type_router, charging_station_router, connector_router, token_router, user_router,
+                      internal_router)
 from .utils.logging_config import setup_logging
+from .utils.metrics import MetricsMiddleware
+from .utils.query_counter import QueryCounterMiddleware
 
 setup_logging()
 
-app = FastAPI(
-    title="EVChargingStation",
-    description="This API allows you to manage EV charging stations, their types and connectors."
-)
 
+def create_app(database_mode: str = DATABASE_MODE) -> FastAPI:
+    app = FastAPI(
+        title="EVChargingStation",
+        description="This API allows you to manage EV charging stations, their types and connectors.",
+        default_response_class=ORJSONResponse
+    )
+    app.add_middleware(QueryCounterMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_event_handler("startup", init_db)
 
-@app.on_event("startup")
-def startup_event():
-    init_db()
+    app.include_router(charging_station_router.export_router, tags=["Charging Stations"])
+    if database_mode == "async":
+        # Registered first so that its GET routes take precedence over the synchronous ones with the same paths.
+        from .routers import async_read_router
+        app.include_router(async_read_router.router)
 
+    app.include_router(user_router.router, tags=["Users"])
+    app.include_router(charging_station_type_router.router, tags=["Charging Station Types"])
+    app.include_router(charging_station_router.router, tags=["Charging Stations"])
+    app.include_router(connector_router.router, tags=["Connectors"])
+    app.include_router(token_router.router, tags=["Token"])
+    app.include_router(internal_router.router, tags=["Internal"])
+    return app
 
-app.include_router(user_router.router, tags=["Users"])
-app.include_router(charging_station_type_router.router, tags=["Charging Station Types"])
-app.include_router(charging_station_router.router, tags=["Charging Stations"])
-app.include_router(connector_router.router, tags=["Connectors"])
-app.include_router(token_router.router, tags=["Token"])
+
+app = create_app()
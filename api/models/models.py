@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, BigInteger, Float, Boolean, ForeignKey, Enum, Index, DateTime
 from sqlalchemy.dialects.postgresql import UUID, INET
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,6 +6,9 @@ import enum
 from ..database.base import Base
 
 
+CONNECTOR_PRIORITY_INDEX = "uq_connectors_charging_station_id_priority"
+
+
 class CurrentTypeEnum(enum.Enum):
     AC = "AC"
     DC = "DC"
@@ -19,8 +22,14 @@ class ChargingStationType(Base):
     plug_count = Column(Integer, nullable=False)
     efficiency = Column(Float, nullable=False)
     current_type = Column(Enum(CurrentTypeEnum), nullable=False)
+    version = Column(Integer, nullable=False, server_default="1")
     charging_stations = relationship("ChargingStation", back_populates="type")
 
+    __table_args__ = (
+        Index("ix_charging_station_types_plug_count_efficiency", plug_count, efficiency),
+        Index("ix_charging_station_types_current_type_efficiency", current_type, efficiency),
+    )
+
 
 class ChargingStation(Base):
     __tablename__ = "charging_stations"
@@ -31,9 +40,16 @@ class ChargingStation(Base):
     ip_address = Column(INET, unique=True, nullable=False)
     firmware_version = Column(String, nullable=False)
     type_id = Column(UUID(as_uuid=True), ForeignKey("charging_station_types.id"), nullable=False)
+    connector_count = Column(Integer, nullable=False, default=0, server_default="0")
+    version = Column(Integer, nullable=False, server_default="1")
     type = relationship("ChargingStationType", back_populates="charging_stations")
     connectors = relationship("Connector", back_populates="charging_station")
 
+    __table_args__ = (
+        Index("ix_charging_stations_type_id", type_id),
+        Index("ix_charging_stations_firmware_version_id", firmware_version, id),
+    )
+
 
 class Connector(Base):
     __tablename__ = "connectors"
@@ -42,8 +58,15 @@ class Connector(Base):
     name = Column(String, unique=True, nullable=False)
     priority = Column(Boolean, default=False, nullable=False)
     charging_station_id = Column(UUID(as_uuid=True), ForeignKey("charging_stations.id"))
+    version = Column(Integer, nullable=False, server_default="1")
     charging_station = relationship("ChargingStation", back_populates="connectors")
 
+    __table_args__ = (
+        Index(CONNECTOR_PRIORITY_INDEX, charging_station_id, unique=True, postgresql_where=priority),
+        Index("ix_connectors_charging_station_id_priority", charging_station_id, priority),
+        Index("ix_connectors_priority_id", priority, id),
+    )
+
 
 class User(Base):
     __tablename__ = "users"
@@ -51,3 +74,17 @@ class User(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String, unique=True)
     hashed_password = Column(String)
+
+
+class IssuedToken(Base):
+    __tablename__ = "issued_tokens"
+
+    token = Column(String, primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    kind = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,309 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from pydantic import UUID4
+import logging
+from ..crud import async_crud
+from ..schemas import schemas
+from ..database.async_database import get_async_db
+from ..models.models import CurrentTypeEnum
+from ..utils.async_auth import get_current_user_async
+from ..utils.pagination import set_next_cursor
+from ..utils.etag import conditional_response, etag_matches, not_modified, with_etag
+from ..utils.responses import list_response, model_response
+from ..utils.response_cache import response_cache, CHARGING_STATION_TYPE_READS, CHARGING_STATION_READS, CONNECTOR_READS
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/charging_station_types/{charging_station_type_id}",
+    response_model=schemas.ChargingStationType,
+    status_code=200,
+    tags=["Charging Station Types"],
+    summary="Read a specific charging station type providing its UUID"
+)
+async def read_charging_station_type_async(
+        charging_station_type_id: UUID4,
+        if_none_match: str | None = Header(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: schemas.User = Depends(get_current_user_async)
+):
+    logger.info("Fetching a charging station type with ID: %s.", charging_station_type_id)
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve a charging station type.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve a charging station type.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    etag = await async_crud.get_charging_station_type_etag(db=db, charging_station_type_id=charging_station_type_id)
+    if etag_matches(if_none_match, etag):
+        logger.info("Charging station type with ID: %s not modified.", charging_station_type_id)
+        return not_modified(etag)
+    cache_key = await response_cache.key_async(
+        "charging_station_type",
+        (charging_station_type_id,),
+        CHARGING_STATION_TYPE_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached charging station type with ID: %s.", charging_station_type_id)
+        return with_etag(cached, etag)
+    result = await async_crud.get_charging_station_type(db=db, charging_station_type_id=charging_station_type_id)
+    logger.info("Successfully retrieved a charging station type with ID: %s.", charging_station_type_id)
+    return response_cache.set(cache_key, with_etag(model_response(schemas.ChargingStationType, result), etag))
+
+
+@router.get(
+    "/charging_station_types/",
+    response_model=List[schemas.ChargingStationType],
+    status_code=200,
+    tags=["Charging Station Types"],
+    summary="Read a list of all charging station types. Provide limit and skip or cursor values for pagination"
+)
+async def read_charging_station_type_list_async(
+        response: Response,
+        plug_count: int | None = None,
+        min_efficiency: float | None = None,
+        max_efficiency: float | None = None,
+        current_type: CurrentTypeEnum | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        if_none_match: str | None = Header(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: schemas.User = Depends(get_current_user_async)
+):
+    logger.info(
+        "Fetching a list of charging station types with filters: plug_count=%s, "
+        "min_efficiency=%s, max_efficiency=%s, current_type=%s, skip=%s, limit=%s, cursor=%s.",
+        plug_count, min_efficiency, max_efficiency, current_type, skip, limit, cursor
+    )
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve charging station types.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve charging station types.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    cache_key = await response_cache.key_async(
+        "charging_station_type_list",
+        (plug_count, min_efficiency, max_efficiency, current_type, skip, limit, cursor),
+        CHARGING_STATION_TYPE_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached list of charging station types.")
+        return conditional_response(cached, if_none_match)
+    result = await async_crud.get_charging_station_type_list(
+        plug_count=plug_count,
+        min_efficiency=min_efficiency,
+        max_efficiency=max_efficiency,
+        current_type=current_type,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        db=db
+    )
+    if cursor is not None:
+        set_next_cursor(response, result, limit)
+    logger.info("Successfully retrieved %s charging station types.", len(result))
+    return conditional_response(
+        response_cache.set(cache_key, list_response(schemas.ChargingStationTypeList, result, response)),
+        if_none_match
+    )
+
+
+@router.get(
+    "/charging_stations/{charging_station_id}",
+    response_model=schemas.ChargingStation,
+    status_code=200,
+    tags=["Charging Stations"],
+    summary="Read a specific charging station providing its UUID"
+)
+async def read_charging_station_async(
+        charging_station_id: UUID4,
+        if_none_match: str | None = Header(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: schemas.User = Depends(get_current_user_async)
+):
+    logger.info("Fetching a charging station with ID: %s", charging_station_id)
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve a charging station.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve a charging station.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    etag = await async_crud.get_charging_station_etag(db=db, charging_station_id=charging_station_id)
+    if etag_matches(if_none_match, etag):
+        logger.info("Charging station with ID: %s not modified.", charging_station_id)
+        return not_modified(etag)
+    cache_key = await response_cache.key_async("charging_station", (charging_station_id,), CHARGING_STATION_READS, db)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached charging station with ID: %s.", charging_station_id)
+        return with_etag(cached, etag)
+    result = await async_crud.get_charging_station(db=db, charging_station_id=charging_station_id)
+    logger.info("Successfully retrieved a charging station with ID: %s", charging_station_id)
+    return response_cache.set(cache_key, with_etag(model_response(schemas.ChargingStation, result), etag))
+
+
+@router.get(
+    "/charging_stations/",
+    response_model=List[schemas.ChargingStation],
+    status_code=200,
+    tags=["Charging Stations"],
+    summary="Read a list of all charging stations. Provide limit and skip or cursor values for pagination"
+)
+async def read_charging_station_list_async(
+        response: Response,
+        plug_count: int | None = None,
+        min_efficiency: float | None = None,
+        max_efficiency: float | None = None,
+        current_type: CurrentTypeEnum | None = None,
+        firmware_version: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        if_none_match: str | None = Header(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: schemas.User = Depends(get_current_user_async)
+):
+    logger.info(
+        "Fetching a list of charging stations with filters: plug_count=%s, min_efficiency=%s, "
+        "max_efficiency=%s, current_type=%s, firmware_version=%s, skip=%s, limit=%s, cursor=%s.",
+        plug_count, min_efficiency, max_efficiency, current_type, firmware_version, skip, limit, cursor
+    )
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve charging stations.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve charging stations.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    cache_key = await response_cache.key_async(
+        "charging_station_list",
+        (plug_count, min_efficiency, max_efficiency, current_type, firmware_version, skip, limit, cursor),
+        CHARGING_STATION_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached list of charging stations.")
+        return conditional_response(cached, if_none_match)
+    result = await async_crud.get_charging_station_list(
+        plug_count=plug_count,
+        min_efficiency=min_efficiency,
+        max_efficiency=max_efficiency,
+        current_type=current_type,
+        firmware_version=firmware_version,
+        db=db,
+        skip=skip,
+        limit=limit,
+        cursor=cursor
+    )
+    if cursor is not None:
+        set_next_cursor(response, result, limit)
+    logger.info("Successfully retrieved %s charging stations.", len(result))
+    return conditional_response(
+        response_cache.set(cache_key, list_response(schemas.ChargingStationList, result, response)),
+        if_none_match
+    )
+
+
+@router.get(
+    "/connectors/{connector_id}",
+    response_model=schemas.Connector,
+    status_code=200,
+    tags=["Connectors"],
+    summary="Read a specific connector providing its UUID"
+)
+async def read_connector_async(
+        connector_id: UUID4,
+        if_none_match: str | None = Header(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: schemas.User = Depends(get_current_user_async)
+):
+    logger.info("Fetching a connector with ID: %s.", connector_id)
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve a connector.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve a connector.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    etag = await async_crud.get_connector_etag(db=db, connector_id=connector_id)
+    if etag_matches(if_none_match, etag):
+        logger.info("Connector with ID: %s not modified.", connector_id)
+        return not_modified(etag)
+    cache_key = await response_cache.key_async("connector", (connector_id,), CONNECTOR_READS, db)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached connector with ID: %s.", connector_id)
+        return with_etag(cached, etag)
+    result = await async_crud.get_connector(db=db, connector_id=connector_id)
+    logger.info("Successfully retrieved a connector with ID: %s.", connector_id)
+    return response_cache.set(cache_key, with_etag(model_response(schemas.Connector, result), etag))
+
+
+@router.get(
+    "/connectors/",
+    response_model=List[schemas.Connector],
+    status_code=200,
+    tags=["Connectors"],
+    summary="Read a list of all connectors. Provide limit and skip or cursor values for pagination"
+)
+async def read_connector_list_async(
+        response: Response,
+        priority: bool | None = None,
+        charging_station_id: UUID4 | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        if_none_match: str | None = Header(None),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: schemas.User = Depends(get_current_user_async),
+):
+    logger.info(
+        "Fetching a list of connectors with filters: priority=%s, charging_station_id=%s, "
+        "skip=%s, limit=%s, cursor=%s.",
+        priority, charging_station_id, skip, limit, cursor
+    )
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve connectors.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve connectors.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    cache_key = await response_cache.key_async(
+        "connector_list",
+        (priority, charging_station_id, skip, limit, cursor),
+        CONNECTOR_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached list of connectors.")
+        return conditional_response(cached, if_none_match)
+    result = await async_crud.get_connector_list(
+        priority=priority,
+        charging_station_id=charging_station_id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        db=db,
+    )
+    if cursor is not None:
+        set_next_cursor(response, result, limit)
+    logger.info("Successfully retrieved %s connectors.", len(result))
+    return conditional_response(
+        response_cache.set(cache_key, list_response(schemas.ConnectorList, result, response)),
+        if_none_match
+    )
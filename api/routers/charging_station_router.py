@@ -1,17 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 from typing import List
 from pydantic import UUID4
 import logging
+import tempfile
 from ..crud import crud
 from ..schemas import schemas
-from ..database.database import get_db
+from ..database.database import get_db, get_session_factory
 from ..models.models import CurrentTypeEnum
 from ..utils.auth import get_current_user
+from ..utils.pagination import set_next_cursor
+from ..utils.etag import conditional_response, etag_matches, not_modified, with_etag
+from ..utils.responses import list_response, model_response
+from ..utils.response_cache import response_cache, CHARGING_STATION_READS
+from ..utils.export import ExportFormatEnum, MEDIA_TYPES, export_charging_stations
+from ..utils.importer import (import_charging_stations,
+                              stream_rejects,
+                              IMPORTED_COUNT_HEADER,
+                              REJECTED_COUNT_HEADER)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
+# Kept apart so that it can be registered ahead of the routes matching /charging_stations/{charging_station_id}.
+export_router = APIRouter()
 
 
 @router.post(
@@ -26,7 +39,7 @@ def create_charging_station(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to create a new charging station with data: {charging_station_data}")
+    logger.info("Attempting to create a new charging station with data: %s", charging_station_data)
     if not current_user:
         logger.error("Unauthorized attempt to create a charging station.")
         raise HTTPException(
@@ -35,10 +48,106 @@ def create_charging_station(
             headers={"WWW-Authenticate": "Bearer"}
         )
     result = crud.create_charging_station(db=db, charging_station_data=charging_station_data)
-    logger.info(f"Successfully created a charging station with ID: {result.id}")
+    logger.info("Successfully created a charging station with ID: %s", result.id)
     return result
 
 
+@router.post(
+    "/charging_stations/bulk",
+    response_model=schemas.ChargingStationBulkResult,
+    status_code=201,
+    tags=["Charging Stations"],
+    summary="Create many charging stations at once. Invalid items are skipped and reported by their index"
+)
+def create_charging_station_bulk(
+        charging_stations_data: List[schemas.ChargingStationCreate],
+        db: Session = Depends(get_db),
+        current_user: schemas.User = Depends(get_current_user)
+):
+    logger.info("Attempting to create %s charging stations in bulk.", len(charging_stations_data))
+    if not current_user:
+        logger.error("Unauthorized attempt to create charging stations.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to create charging stations.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    result = crud.create_charging_station_bulk(db=db, charging_stations_data=charging_stations_data)
+    logger.info("Successfully created %s charging stations, %s rejected.", len(result.created), len(result.errors))
+    return result
+
+
+@router.post(
+    "/charging_stations/import",
+    response_class=StreamingResponse,
+    status_code=200,
+    tags=["Charging Stations"],
+    summary="Import charging stations from an NDJSON or CSV file. Rejected records are returned as a CSV file"
+)
+def import_charging_station_list(
+        file: UploadFile,
+        import_format: ExportFormatEnum = Query(ExportFormatEnum.ndjson, alias="format"),
+        db: Session = Depends(get_db),
+        current_user: schemas.User = Depends(get_current_user)
+):
+    logger.info("Importing charging stations from %s as %s.", file.filename, import_format.value)
+    if not current_user:
+        logger.error("Unauthorized attempt to import charging stations.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to import charging stations.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    # The rejects are spooled to an anonymous temporary file, streamed back as the response body
+    # and removed when the stream closes it.
+    rejects_file = tempfile.TemporaryFile("w+", newline="")
+    try:
+        result = import_charging_stations(db, file.file, import_format, rejects_file)
+    except HTTPException:
+        rejects_file.close()
+        raise
+    except Exception as e:
+        rejects_file.close()
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.") from e
+    logger.info("Imported %s charging stations, rejected %s.", result["imported"], result["rejected"])
+    return StreamingResponse(
+        stream_rejects(rejects_file),
+        media_type=MEDIA_TYPES[ExportFormatEnum.csv],
+        headers={
+            IMPORTED_COUNT_HEADER: str(result["imported"]),
+            REJECTED_COUNT_HEADER: str(result["rejected"]),
+            "Content-Disposition": "attachment; filename=rejects.csv"
+        }
+    )
+
+
+@export_router.get(
+    "/charging_stations/export",
+    response_class=StreamingResponse,
+    status_code=200,
+    tags=["Charging Stations"],
+    summary="Export all charging stations as NDJSON or CSV"
+)
+def export_charging_station_list(
+        export_format: ExportFormatEnum = Query(ExportFormatEnum.ndjson, alias="format"),
+        session_factory: sessionmaker = Depends(get_session_factory),
+        current_user: schemas.User = Depends(get_current_user)
+):
+    logger.info("Exporting charging stations as %s.", export_format.value)
+    if not current_user:
+        logger.error("Unauthorized attempt to export charging stations.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to export charging stations.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return StreamingResponse(
+        export_charging_stations(session_factory, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f"attachment; filename=charging_stations.{export_format.value}"}
+    )
+
+
 @router.get(
     "/charging_stations/{charging_station_id}",
     response_model=schemas.ChargingStation,
@@ -48,10 +157,11 @@ def create_charging_station(
 )
 def read_charging_station(
         charging_station_id: UUID4,
+        if_none_match: str | None = Header(None),
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Fetching a charging station with ID: {charging_station_id}")
+    logger.info("Fetching a charging station with ID: %s", charging_station_id)
     if not current_user:
         logger.error("Unauthorized attempt to retrieve a charging station.")
         raise HTTPException(
@@ -59,9 +169,18 @@ def read_charging_station(
             detail="Not authorized to retrieve a charging station.",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    etag = crud.get_charging_station_etag(db=db, charging_station_id=charging_station_id)
+    if etag_matches(if_none_match, etag):
+        logger.info("Charging station with ID: %s not modified.", charging_station_id)
+        return not_modified(etag)
+    cache_key = response_cache.key("charging_station", (charging_station_id,), CHARGING_STATION_READS, db)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached charging station with ID: %s.", charging_station_id)
+        return with_etag(cached, etag)
     result = crud.get_charging_station(db=db, charging_station_id=charging_station_id)
-    logger.info(f"Successfully retrieved a charging station with ID: {charging_station_id}")
-    return result
+    logger.info("Successfully retrieved a charging station with ID: %s", charging_station_id)
+    return response_cache.set(cache_key, with_etag(model_response(schemas.ChargingStation, result), etag))
 
 
 @router.get(
@@ -69,9 +188,10 @@ def read_charging_station(
     response_model=List[schemas.ChargingStation],
     status_code=200,
     tags=["Charging Stations"],
-    summary="Read a list of all charging stations. Provide limit or skip values for pagination"
+    summary="Read a list of all charging stations. Provide limit and skip or cursor values for pagination"
 )
 def read_charging_station_list(
+        response: Response,
         plug_count: int | None = None,
         min_efficiency: float | None = None,
         max_efficiency: float | None = None,
@@ -79,13 +199,15 @@ def read_charging_station_list(
         firmware_version: str | None = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        if_none_match: str | None = Header(None),
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
     logger.info(
-        f"Fetching a list of charging stations with filters: plug_count={plug_count}, min_efficiency={min_efficiency}, "
-        f"max_efficiency={max_efficiency}, current_type={current_type}, firmware_version={firmware_version}, "
-        f"skip={skip}, limit={limit}."
+        "Fetching a list of charging stations with filters: plug_count=%s, min_efficiency=%s, "
+        "max_efficiency=%s, current_type=%s, firmware_version=%s, skip=%s, limit=%s, cursor=%s.",
+        plug_count, min_efficiency, max_efficiency, current_type, firmware_version, skip, limit, cursor
     )
     if not current_user:
         logger.error("Unauthorized attempt to retrieve charging stations.")
@@ -94,6 +216,16 @@ def read_charging_station_list(
             detail="Not authorized to retrieve charging stations.",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    cache_key = response_cache.key(
+        "charging_station_list",
+        (plug_count, min_efficiency, max_efficiency, current_type, firmware_version, skip, limit, cursor),
+        CHARGING_STATION_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached list of charging stations.")
+        return conditional_response(cached, if_none_match)
     result = crud.get_charging_station_list(
         plug_count=plug_count,
         min_efficiency=min_efficiency,
@@ -102,10 +234,16 @@ def read_charging_station_list(
         firmware_version=firmware_version,
         db=db,
         skip=skip,
-        limit=limit
+        limit=limit,
+        cursor=cursor
+    )
+    if cursor is not None:
+        set_next_cursor(response, result, limit)
+    logger.info("Successfully retrieved %s charging stations.", len(result))
+    return conditional_response(
+        response_cache.set(cache_key, list_response(schemas.ChargingStationList, result, response)),
+        if_none_match
     )
-    logger.info(f"Successfully retrieved {len(result)} charging stations.")
-    return result
 
 
 @router.put(
@@ -122,8 +260,9 @@ def update_charging_station(
         current_user: schemas.User = Depends(get_current_user)
 ):
     logger.info(
-        f"Attempting to update a charging station with ID: {charging_station_id} with data: "
-        f"{charging_station_data}."
+        "Attempting to update a charging station with ID: %s with data: %s.",
+        charging_station_id,
+        charging_station_data
     )
     if not current_user:
         logger.error("Unauthorized attempt to update a charging station.")
@@ -137,7 +276,7 @@ def update_charging_station(
         charging_station_id=charging_station_id,
         charging_station_data=charging_station_data
     )
-    logger.info(f"Successfully updated a charging station with ID: {charging_station_id}.")
+    logger.info("Successfully updated a charging station with ID: %s.", charging_station_id)
     return result
 
 
@@ -152,7 +291,7 @@ def delete_charging_station(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Trying to delete a charging station with ID: {charging_station_id}.")
+    logger.info("Trying to delete a charging station with ID: %s.", charging_station_id)
     if not current_user:
         logger.error("Unauthorized attempt to delete a charging station.")
         raise HTTPException(
@@ -161,5 +300,5 @@ def delete_charging_station(
             headers={"WWW-Authenticate": "Bearer"}
         )
     result = crud.delete_charging_station(db=db, charging_station_id=charging_station_id)
-    logger.info(f"Successfully deleted a charging station with ID: {charging_station_id}.")
+    logger.info("Successfully deleted a charging station with ID: %s.", charging_station_id)
     return result
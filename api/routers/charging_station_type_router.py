@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 from pydantic import UUID4
@@ -8,6 +8,10 @@ from ..schemas import schemas
 from ..database.database import get_db
 from ..models.models import CurrentTypeEnum
 from ..utils.auth import get_current_user
+from ..utils.pagination import set_next_cursor
+from ..utils.etag import conditional_response, etag_matches, not_modified, with_etag
+from ..utils.responses import list_response, model_response
+from ..utils.response_cache import response_cache, CHARGING_STATION_TYPE_READS
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +30,7 @@ def create_charging_station_type(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to create a charging station type with data: {charging_station_type_data}.")
+    logger.info("Attempting to create a charging station type with data: %s.", charging_station_type_data)
     if not current_user:
         logger.error("Unauthorized attempt to create a charging station type.")
         raise HTTPException(
@@ -35,7 +39,7 @@ def create_charging_station_type(
             headers={"WWW-Authenticate": "Bearer"}
         )
     result = crud.create_charging_station_type(db=db, charging_station_type_data=charging_station_type_data)
-    logger.info(f"Successfully created a charging station type with ID: {result.id}.")
+    logger.info("Successfully created a charging station type with ID: %s.", result.id)
     return result
 
 
@@ -48,10 +52,11 @@ def create_charging_station_type(
 )
 def read_charging_station_type(
         charging_station_type_id: UUID4,
+        if_none_match: str | None = Header(None),
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Fetching a charging station type with ID: {charging_station_type_id}.")
+    logger.info("Fetching a charging station type with ID: %s.", charging_station_type_id)
     if not current_user:
         logger.error("Unauthorized attempt to retrieve a charging station type.")
         raise HTTPException(
@@ -59,9 +64,23 @@ def read_charging_station_type(
             detail="Not authorized to retrieve a charging station type.",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    etag = crud.get_charging_station_type_etag(db=db, charging_station_type_id=charging_station_type_id)
+    if etag_matches(if_none_match, etag):
+        logger.info("Charging station type with ID: %s not modified.", charging_station_type_id)
+        return not_modified(etag)
+    cache_key = response_cache.key(
+        "charging_station_type",
+        (charging_station_type_id,),
+        CHARGING_STATION_TYPE_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached charging station type with ID: %s.", charging_station_type_id)
+        return with_etag(cached, etag)
     result = crud.get_charging_station_type(db=db, charging_station_type_id=charging_station_type_id)
-    logger.info(f"Successfully retrieved a charging station type with ID: {charging_station_type_id}.")
-    return result
+    logger.info("Successfully retrieved a charging station type with ID: %s.", charging_station_type_id)
+    return response_cache.set(cache_key, with_etag(model_response(schemas.ChargingStationType, result), etag))
 
 
 @router.get(
@@ -69,22 +88,25 @@ def read_charging_station_type(
     response_model=List[schemas.ChargingStationType],
     status_code=200,
     tags=["Charging Station Types"],
-    summary="Read a list of all charging station types. Provide limit or skip values for pagination"
+    summary="Read a list of all charging station types. Provide limit and skip or cursor values for pagination"
 )
 def read_charging_station_type_list(
+        response: Response,
         plug_count: int | None = None,
         min_efficiency: float | None = None,
         max_efficiency: float | None = None,
         current_type: CurrentTypeEnum | None = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        if_none_match: str | None = Header(None),
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
     logger.info(
-        f"Fetching a list of charging station types with filters: plug_count={plug_count}, "
-        f"min_efficiency={min_efficiency}, max_efficiency={max_efficiency}, current_type={current_type}, "
-        f"skip={skip}, limit={limit}."
+        "Fetching a list of charging station types with filters: plug_count=%s, "
+        "min_efficiency=%s, max_efficiency=%s, current_type=%s, skip=%s, limit=%s, cursor=%s.",
+        plug_count, min_efficiency, max_efficiency, current_type, skip, limit, cursor
     )
     if not current_user:
         logger.error("Unauthorized attempt to retrieve charging station types.")
@@ -93,6 +115,16 @@ def read_charging_station_type_list(
             detail="Not authorized to retrieve charging station types.",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    cache_key = response_cache.key(
+        "charging_station_type_list",
+        (plug_count, min_efficiency, max_efficiency, current_type, skip, limit, cursor),
+        CHARGING_STATION_TYPE_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached list of charging station types.")
+        return conditional_response(cached, if_none_match)
     result = crud.get_charging_station_type_list(
         plug_count=plug_count,
         min_efficiency=min_efficiency,
@@ -100,10 +132,16 @@ def read_charging_station_type_list(
         current_type=current_type,
         skip=skip,
         limit=limit,
+        cursor=cursor,
         db=db
     )
-    logger.info(f"Successfully retrieved {len(result)} charging station types.")
-    return result
+    if cursor is not None:
+        set_next_cursor(response, result, limit)
+    logger.info("Successfully retrieved %s charging station types.", len(result))
+    return conditional_response(
+        response_cache.set(cache_key, list_response(schemas.ChargingStationTypeList, result, response)),
+        if_none_match
+    )
 
 
 @router.put(
@@ -120,8 +158,9 @@ def update_charging_station_type(
         current_user: schemas.User = Depends(get_current_user)
 ):
     logger.info(
-        f"Attempting to update a charging station type with ID: {charging_station_type_id} "
-        f"with data: {charging_station_type_data}."
+        "Attempting to update a charging station type with ID: %s with data: %s.",
+        charging_station_type_id,
+        charging_station_type_data
     )
     if not current_user:
         logger.error("Unauthorized attempt to update a charging station type.")
@@ -135,7 +174,7 @@ def update_charging_station_type(
         charging_station_type_id=charging_station_type_id,
         charging_station_type_data=charging_station_type_data
     )
-    logger.info(f"Successfully updated a charging station type with ID: {charging_station_type_id}.")
+    logger.info("Successfully updated a charging station type with ID: %s.", charging_station_type_id)
     return result
 
 
@@ -150,7 +189,7 @@ def delete_charging_station_type(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to delete a charging station type with ID: {charging_station_type_id}.")
+    logger.info("Attempting to delete a charging station type with ID: %s.", charging_station_type_id)
     if not current_user:
         logger.error("Unauthorized attempt to delete a charging station type.")
         raise HTTPException(
@@ -159,5 +198,5 @@ def delete_charging_station_type(
             headers={"WWW-Authenticate": "Bearer"}
         )
     result = crud.delete_charging_station_type(db=db, charging_station_type_id=charging_station_type_id)
-    logger.info(f"Successfully deleted a charging station type with ID: {charging_station_type_id}.")
+    logger.info("Successfully deleted a charging station type with ID: %s.", charging_station_type_id)
     return result
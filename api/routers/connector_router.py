@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 from pydantic import UUID4
@@ -7,6 +7,10 @@ from ..crud import crud
 from ..schemas import schemas
 from ..database.database import get_db
 from ..utils.auth import get_current_user
+from ..utils.pagination import set_next_cursor
+from ..utils.etag import conditional_response, etag_matches, not_modified, with_etag
+from ..utils.responses import list_response, model_response
+from ..utils.response_cache import response_cache, CONNECTOR_READS
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +29,7 @@ def create_connector(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to create a connector with data: {connector_data}.")
+    logger.info("Attempting to create a connector with data: %s.", connector_data)
     if not current_user:
         logger.error("Unauthorized attempt to create a connector.")
         raise HTTPException(
@@ -34,7 +38,32 @@ def create_connector(
             headers={"WWW-Authenticate": "Bearer"}
         )
     result = crud.create_connector(db=db, connector_data=connector_data)
-    logger.info(f"Successfully created a connector with ID: {result.id}.")
+    logger.info("Successfully created a connector with ID: %s.", result.id)
+    return result
+
+
+@router.post(
+    "/connectors/bulk",
+    response_model=List[schemas.Connector],
+    status_code=200,
+    tags=["Connectors"],
+    summary="Create or update many connectors at once, matching existing connectors by name"
+)
+def upsert_connector_bulk(
+        connectors_data: List[schemas.ConnectorCreate],
+        db: Session = Depends(get_db),
+        current_user: schemas.User = Depends(get_current_user)
+):
+    logger.info("Attempting to upsert %s connectors in bulk.", len(connectors_data))
+    if not current_user:
+        logger.error("Unauthorized attempt to upsert connectors.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to upsert connectors.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    result = crud.upsert_connector_bulk(db=db, connectors_data=connectors_data)
+    logger.info("Successfully upserted %s connectors.", len(result))
     return result
 
 
@@ -47,10 +76,11 @@ def create_connector(
 )
 def read_connector(
         connector_id: UUID4,
+        if_none_match: str | None = Header(None),
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Fetching a connector with ID: {connector_id}.")
+    logger.info("Fetching a connector with ID: %s.", connector_id)
     if not current_user:
         logger.error("Unauthorized attempt to retrieve a connector.")
         raise HTTPException(
@@ -58,9 +88,18 @@ def read_connector(
             detail="Not authorized to retrieve a connector.",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    etag = crud.get_connector_etag(db=db, connector_id=connector_id)
+    if etag_matches(if_none_match, etag):
+        logger.info("Connector with ID: %s not modified.", connector_id)
+        return not_modified(etag)
+    cache_key = response_cache.key("connector", (connector_id,), CONNECTOR_READS, db)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached connector with ID: %s.", connector_id)
+        return with_etag(cached, etag)
     result = crud.get_connector(db=db, connector_id=connector_id)
-    logger.info(f"Successfully retrieved a connector with ID: {connector_id}.")
-    return result
+    logger.info("Successfully retrieved a connector with ID: %s.", connector_id)
+    return response_cache.set(cache_key, with_etag(model_response(schemas.Connector, result), etag))
 
 
 @router.get(
@@ -68,19 +107,23 @@ def read_connector(
     response_model=List[schemas.Connector],
     status_code=200,
     tags=["Connectors"],
-    summary="Read a list of all connectors. Provide limit or skip values for pagination"
+    summary="Read a list of all connectors. Provide limit and skip or cursor values for pagination"
 )
 def read_connector_list(
+        response: Response,
         priority: bool | None = None,
         charging_station_id: UUID4 | None = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        if_none_match: str | None = Header(None),
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user),
 ):
     logger.info(
-        f"Fetching a list of connectors with filters: priority={priority}, charging_station_id={charging_station_id}, "
-        f"skip={skip}, limit={limit}."
+        "Fetching a list of connectors with filters: priority=%s, charging_station_id=%s, "
+        "skip=%s, limit=%s, cursor=%s.",
+        priority, charging_station_id, skip, limit, cursor
     )
     if not current_user:
         logger.error("Unauthorized attempt to retrieve connectors.")
@@ -89,15 +132,31 @@ def read_connector_list(
             detail="Not authorized to retrieve connectors.",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    cache_key = response_cache.key(
+        "connector_list",
+        (priority, charging_station_id, skip, limit, cursor),
+        CONNECTOR_READS,
+        db
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Returning a cached list of connectors.")
+        return conditional_response(cached, if_none_match)
     result = crud.get_connector_list(
         priority=priority,
         charging_station_id=charging_station_id,
         skip=skip,
         limit=limit,
+        cursor=cursor,
         db=db,
     )
-    logger.info(f"Successfully retrieved {len(result)} connectors.")
-    return result
+    if cursor is not None:
+        set_next_cursor(response, result, limit)
+    logger.info("Successfully retrieved %s connectors.", len(result))
+    return conditional_response(
+        response_cache.set(cache_key, list_response(schemas.ConnectorList, result, response)),
+        if_none_match
+    )
 
 
 @router.put(
@@ -113,7 +172,7 @@ def update_connector(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user),
 ):
-    logger.info(f"Attempting to update a connector with ID: {connector_id} with data: {connector_data}.")
+    logger.info("Attempting to update a connector with ID: %s with data: %s.", connector_id, connector_data)
     if not current_user:
         logger.error("Unauthorized attempt to update a connector.")
         raise HTTPException(
@@ -126,7 +185,7 @@ def update_connector(
         connector_id=connector_id,
         connector_data=connector_data
     )
-    logger.info(f"Succesfully updated a connector with ID: {connector_id}.")
+    logger.info("Succesfully updated a connector with ID: %s.", connector_id)
     return result
 
 
@@ -141,7 +200,7 @@ def delete_connector(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to delete a connector with ID: {connector_id}.")
+    logger.info("Attempting to delete a connector with ID: %s.", connector_id)
     if not current_user:
         logger.error("Unauthorized attempt to delete a connector.")
         raise HTTPException(
@@ -150,5 +209,5 @@ def delete_connector(
             headers={"WWW-Authenticate": "Bearer"}
         )
     result = crud.delete_connector(db=db, connector_id=connector_id)
-    logger.info(f"Successfully deleted a connector with ID: {connector_id}.")
+    logger.info("Successfully deleted a connector with ID: %s.", connector_id)
     return result
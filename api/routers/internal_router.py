@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+import logging
+from ..schemas import schemas
+from ..database.database import engine, pool_metrics, DATABASE_MODE
+from ..database.pool_metrics import pool_stats
+from ..utils.auth import get_current_user, principal_cache
+from ..utils.hashing import password_hasher
+from ..utils.metrics import render_metrics
+from ..utils.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/internal/password_hashing",
+    status_code=200,
+    tags=["Internal"],
+    summary="Read password hashing executor statistics"
+)
+def read_password_hashing_stats(current_user: schemas.User = Depends(get_current_user)):
+    logger.info("Fetching password hashing executor statistics.")
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve password hashing statistics.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve password hashing statistics.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return password_hasher.stats()
+
+
+@router.get(
+    "/internal/database_pool",
+    status_code=200,
+    tags=["Internal"],
+    summary="Read database connection pool statistics"
+)
+def read_database_pool_stats(current_user: schemas.User = Depends(get_current_user)):
+    logger.info("Fetching database connection pool statistics.")
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve database connection pool statistics.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve database connection pool statistics.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    result = {"sync": pool_stats(engine, pool_metrics)}
+    if DATABASE_MODE == "async":
+        from ..database.async_database import async_engine, async_pool_metrics
+        result["async"] = pool_stats(async_engine.sync_engine, async_pool_metrics)
+    return result
+
+
+@router.get(
+    "/internal/caches",
+    status_code=200,
+    tags=["Internal"],
+    summary="Read response and principal cache statistics"
+)
+def read_cache_stats(current_user: schemas.User = Depends(get_current_user)):
+    logger.info("Fetching cache statistics.")
+    if not current_user:
+        logger.error("Unauthorized attempt to retrieve cache statistics.")
+        raise HTTPException(
+            status_code=401,
+            detail="Not authorized to retrieve cache statistics.",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return {"responses": response_cache.stats(), "principals": principal_cache.stats()}
+
+
+@router.get(
+    "/metrics",
+    status_code=200,
+    response_class=Response,
+    tags=["Internal"],
+    summary="Read request, database and threadpool metrics in the Prometheus text format"
+)
+def read_metrics():
+    # Left unauthenticated for Prometheus scrapers, like health checks; don't route it through a public proxy.
+    logger.info("Rendering metrics.")
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
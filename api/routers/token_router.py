@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from typing import Annotated
 import logging
 from ..schemas import schemas
 from ..database.database import get_db
-from ..utils.auth import authenticate_user, create_access_token
+from ..utils.auth import authenticate_user_async, create_access_token
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +19,10 @@ router = APIRouter()
     tags=["Token"],
     summary="Access a token by logging in"
 )
-def login_for_access_token(
+async def login_for_access_token(
         form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
         db: Session = Depends(get_db)
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
-    access_token = create_access_token(data={"sub": user.username})
+    user = await authenticate_user_async(db, form_data.username, form_data.password)
+    access_token = await run_in_threadpool(create_access_token, {"sub": user.username})
     return schemas.Token(access_token=access_token, token_type="bearer")
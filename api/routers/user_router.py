@@ -18,13 +18,13 @@ router = APIRouter()
     tags=["Users"],
     summary="Create a new user"
 )
-def create_user(
+async def create_user(
         user_data: schemas.UserCreate,
         db: Session = Depends(get_db)
 ):
-    logger.info(f"Attempting to create a new user with username: {user_data.username}.")
-    result = crud.create_user(db=db, user_data=user_data)
-    logger.info(f"Successfully created a new user with username: {user_data.username}.")
+    logger.info("Attempting to create a new user with username: %s.", user_data.username)
+    result = await crud.create_user_async(db=db, user_data=user_data)
+    logger.info("Successfully created a new user with username: %s.", user_data.username)
     return result
 
 
@@ -35,13 +35,13 @@ def create_user(
     tags=["Users"],
     summary="Update your user credentials"
 )
-def update_user(
+async def update_user(
         username: str,
         user_data: schemas.UserCreate,
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to update user '{username}' credentials.")
+    logger.info("Attempting to update user '%s' credentials.", username)
     if not current_user:
         logger.error("Unauthorized attempt to update user credentials.")
         raise HTTPException(
@@ -51,8 +51,8 @@ def update_user(
         )
     if current_user.username != username:
         raise HTTPException(status_code=403, detail="Cannot update other user's credentials.")
-    result = crud.update_user(db=db, username=username, user_data=user_data)
-    logger.info(f"Successfully updated user '{username}' credentials.")
+    result = await crud.update_user_async(db=db, username=username, user_data=user_data)
+    logger.info("Successfully updated user '%s' credentials.", username)
     return result
 
 
@@ -67,7 +67,7 @@ def delete_user(
         db: Session = Depends(get_db),
         current_user: schemas.User = Depends(get_current_user)
 ):
-    logger.info(f"Attempting to delete user '{username}'.")
+    logger.info("Attempting to delete user '%s'.", username)
     if not current_user:
         logger.error("Unauthorized attempt to delete a user.")
         raise HTTPException(
@@ -78,5 +78,5 @@ def delete_user(
     if current_user.username != username:
         raise HTTPException(status_code=403, detail="Cannot delete other user's credentials.")
     result = crud.delete_user(db=db, username=username)
-    logger.info(f"Successfully deleted user '{username}'.")
+    logger.info("Successfully deleted user '%s'.", username)
     return result
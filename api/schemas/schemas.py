@@ -1,4 +1,4 @@
-from pydantic import BaseModel, UUID4, Field, conint, confloat, field_validator, ConfigDict
+from pydantic import BaseModel, UUID4, Field, conint, confloat, field_validator, ConfigDict, TypeAdapter
 from typing import List, Optional
 from uuid import uuid4
 from ipaddress import IPv4Address, IPv6Address
@@ -81,6 +81,21 @@ class ChargingStation(ChargingStationBase):
     type: ChargingStationTypeNoList
     connectors: List[Connector] = []
 
+    @field_validator("ip_address", mode="before")
+    def format_ip_address(cls, v):
+        # asyncpg loads INET columns as ipaddress objects, psycopg2 as strings.
+        return str(v)
+
+
+class BulkItemError(BaseModel):
+    index: int
+    detail: str
+
+
+class ChargingStationBulkResult(BaseModel):
+    created: List[UUID4] = []
+    errors: List[BulkItemError] = []
+
 
 class UserBase(BaseModel):
     username: str
@@ -97,3 +112,8 @@ class User(UserBase):
 class Token(BaseModel):
     access_token: str
     token_type: str
+
+
+ChargingStationTypeList = TypeAdapter(List[ChargingStationType])
+ChargingStationList = TypeAdapter(List[ChargingStation])
+ConnectorList = TypeAdapter(List[Connector])
@@ -1,11 +1,17 @@
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from ..main import app
+from sqlalchemy.pool import NullPool
+from ..main import app, create_app
 from ..database.base import Base
 from ..models import models
-from ..database.database import get_db
+from ..database.database import get_db, get_session_factory
+from ..database.async_database import to_async_url, get_async_db
+from ..utils.response_cache import response_cache
+from ..utils.query_counter import QueryCounter
 import os
 from dotenv import load_dotenv
 
@@ -27,14 +33,54 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def async_session_factory(db_session):
+    engine = create_async_engine(to_async_url(TEST_DATABASE_URL), poolclass=NullPool)
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
 @pytest.fixture
 def client(db_session):
+    response_cache.clear()
     app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_session_factory] = lambda: sessionmaker(bind=db_session.get_bind())
     with TestClient(app) as client:
         yield client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def async_app():
+    return create_app("async")
+
+
+@pytest.fixture
+def async_client(db_session, async_session_factory, async_app):
+    async def get_test_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    response_cache.clear()
+    async_app.dependency_overrides[get_db] = lambda: db_session
+    async_app.dependency_overrides[get_session_factory] = lambda: sessionmaker(bind=db_session.get_bind())
+    async_app.dependency_overrides[get_async_db] = get_test_async_db
+    with TestClient(async_app) as client:
+        yield client
+    async_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def assert_query_count(db_session):
+    """Asserts that the block executes exactly the expected number of SQL statements on the test database."""
+    @contextmanager
+    def assert_query_count(expected: int):
+        with QueryCounter(db_session.get_bind()) as counter:
+            yield counter
+        assert counter.count == expected, f"Expected {expected} queries, got {counter.count}:\n" + \
+            "\n".join(counter.statements)
+    return assert_query_count
+
+
 @pytest.fixture
 def create_station_type(db_session):
     charging_station_type = models.ChargingStationType(
@@ -94,6 +140,7 @@ def create_second_station(db_session, create_second_station_type):
 @pytest.fixture
 def create_connector(db_session, create_station):
     connector = models.Connector(name="Test Connector", priority=True, charging_station_id=create_station.id)
+    create_station.connector_count += 1
     db_session.add(connector)
     db_session.commit()
     db_session.refresh(connector)
@@ -103,6 +150,7 @@ def create_connector(db_session, create_station):
 @pytest.fixture
 def create_second_connector(db_session, create_second_station):
     connector = models.Connector(name="Test Connector 2", priority=False, charging_station_id=create_second_station.id)
+    create_second_station.connector_count += 1
     db_session.add(connector)
     db_session.commit()
     db_session.refresh(connector)
@@ -112,6 +160,7 @@ def create_second_connector(db_session, create_second_station):
 @pytest.fixture
 def create_third_connector(db_session, create_second_station):
     connector = models.Connector(name="Test Connector 3", priority=True, charging_station_id=create_second_station.id)
+    create_second_station.connector_count += 1
     db_session.add(connector)
     db_session.commit()
     db_session.refresh(connector)
@@ -1268,6 +1268,39 @@ class TestChargingStation:
         assert response.status_code == 200
         assert len(response.json()) == 1
 
+    def test_read_charging_station_list_success_query_cursor(
+            self,
+            client,
+            create_station,
+            create_connector,
+            create_second_station,
+            create_second_connector,
+            create_third_connector
+    ):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        first_page = client.get("/charging_stations/?limit=1&cursor=")
+        next_cursor = first_page.headers["X-Next-Cursor"]
+        second_page = client.get(f"/charging_stations/?limit=1&cursor={next_cursor}")
+
+        assert first_page.status_code == 200
+        assert second_page.status_code == 200
+        assert len(first_page.json()) == 1
+        assert len(second_page.json()) == 1
+        assert first_page.json()[0]["id"] != second_page.json()[0]["id"]
+
+    def test_read_charging_station_list_wrong_cursor(self, client):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.get("/charging_stations/?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+        assert "Invalid cursor." in response.json()["detail"]
+
     def test_read_charging_station_list_wrong_connector_count(self, client, create_station):
         app.dependency_overrides[get_current_user] = lambda: schemas.User(
             id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from ..crud import async_crud
+from ..utils.pagination import encode_cursor
+
+
+def run(async_session_factory, crud_function, **kwargs):
+    async def call():
+        async with async_session_factory() as db:
+            return await crud_function(db=db, **kwargs)
+    return asyncio.run(call())
+
+
+class TestChargingStationTypeAsyncCrud:
+    def test_get_charging_station_type_success(self, async_session_factory, create_station_type, create_station):
+        charging_station_type = run(
+            async_session_factory,
+            async_crud.get_charging_station_type,
+            charging_station_type_id=create_station_type.id
+        )
+
+        assert charging_station_type.name == create_station_type.name
+        assert [station.id for station in charging_station_type.charging_stations] == [create_station.id]
+
+    def test_get_charging_station_type_wrong_id(self, async_session_factory, create_station_type):
+        with pytest.raises(HTTPException) as exc_info:
+            run(
+                async_session_factory,
+                async_crud.get_charging_station_type,
+                charging_station_type_id="a73ee835-1201-4888-9d3a-911f48958b42"
+            )
+
+        assert exc_info.value.status_code == 404
+        assert "ChargingStationType instance not found." in exc_info.value.detail
+
+    def test_get_charging_station_type_list(self, async_session_factory, create_station_type, create_second_station_type):
+        charging_station_type_list = run(
+            async_session_factory,
+            async_crud.get_charging_station_type_list,
+            plug_count=None,
+            min_efficiency=80,
+            max_efficiency=None,
+            current_type=None,
+            skip=None,
+            limit=None
+        )
+
+        assert len(charging_station_type_list) == 1
+
+
+class TestChargingStationAsyncCrud:
+    def test_get_charging_station_success(self, async_session_factory, create_station, create_connector):
+        charging_station = run(
+            async_session_factory,
+            async_crud.get_charging_station,
+            charging_station_id=create_station.id
+        )
+
+        assert charging_station.name == create_station.name
+        assert [connector.id for connector in charging_station.connectors] == [create_connector.id]
+
+    def test_get_charging_station_wrong_connector_count(self, async_session_factory, create_station):
+        with pytest.raises(HTTPException) as exc_info:
+            run(async_session_factory, async_crud.get_charging_station, charging_station_id=create_station.id)
+
+        assert exc_info.value.status_code == 400
+        assert "connectors instead of" in exc_info.value.detail
+
+    def test_get_charging_station_list(
+            self,
+            async_session_factory,
+            create_station,
+            create_second_station,
+            create_connector,
+            create_second_connector,
+            create_third_connector
+    ):
+        charging_station_list = run(
+            async_session_factory,
+            async_crud.get_charging_station_list,
+            plug_count=None,
+            min_efficiency=None,
+            max_efficiency=None,
+            current_type=None,
+            firmware_version=None,
+            skip=None,
+            limit=None
+        )
+
+        assert len(charging_station_list) == 2
+        assert sum(len(station.connectors) for station in charging_station_list) == 3
+
+
+class TestConnectorAsyncCrud:
+    def test_get_connector_success(self, async_session_factory, create_connector):
+        connector = run(async_session_factory, async_crud.get_connector, connector_id=create_connector.id)
+
+        assert connector.name == create_connector.name
+
+    def test_get_connector_list_cursor(
+            self,
+            async_session_factory,
+            create_station,
+            create_connector,
+            create_second_connector
+    ):
+        connector_ids = sorted([create_connector.id, create_second_connector.id])
+        connector_list = run(
+            async_session_factory,
+            async_crud.get_connector_list,
+            priority=None,
+            charging_station_id=None,
+            skip=None,
+            limit=None,
+            cursor=encode_cursor(connector_ids[0])
+        )
+
+        assert [connector.id for connector in connector_list] == connector_ids[1:]
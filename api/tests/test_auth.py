@@ -14,7 +14,9 @@ from ..utils.auth import (
     clear_expired_tokens,
     validate_token,
     get_current_user,
-    token_cache,
+    invalidate_principal,
+    token_store,
+    principal_cache,
     SECRET_KEY,
     ALGORITHM
 )
@@ -92,62 +94,63 @@ def test_create_access_token(mocker):
 
 
 def test_clear_expired_tokens():
-    token_cache.clear()
+    token_store.clear()
     current_time = datetime.now(timezone.utc)
-    token_cache["token1"] = datetime(2020, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    token_cache["token2"] = current_time + timedelta(minutes=5)
+    token_store.add("token1", datetime(2020, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+    token_store.add("token2", current_time + timedelta(minutes=5))
     clear_expired_tokens()
-    assert "token1" not in token_cache
-    assert "token2" in token_cache
+    assert token_store.get("token1") is None
+    assert token_store.get("token2") is not None
 
 
 def test_validate_token_valid():
-    token_cache.clear()
+    token_store.clear()
     expiration_time = int((datetime.now(timezone.utc) + timedelta(minutes=30)).timestamp())
     payload = {"sub": "testuser", "exp": expiration_time}
     token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-    token_cache[token] = datetime.fromtimestamp(expiration_time, timezone.utc)
+    token_store.add(token, datetime.fromtimestamp(expiration_time, timezone.utc))
     assert validate_token(token) == "testuser"
-    token_cache.clear()
+    token_store.clear()
 
 
 def test_validate_token_expired():
-    token_cache.clear()
+    token_store.clear()
     expiration_time = int((datetime.now(timezone.utc) - timedelta(minutes=30)).timestamp())
     payload = {"sub": "testuser", "exp": expiration_time}
     token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-    token_cache[token] = datetime.fromtimestamp(expiration_time, timezone.utc)
+    token_store.add(token, datetime.fromtimestamp(expiration_time, timezone.utc))
     with pytest.raises(HTTPException) as exc_info:
         validate_token(token)
     assert exc_info.value.status_code == 401
     assert "Invalid token." in exc_info.value.detail
-    token_cache.clear()
+    token_store.clear()
 
 
 def test_validate_token_invalid_jwt(mocker):
-    token_cache.clear()
+    token_store.clear()
     mocker.patch("api.utils.auth.jwt.decode", side_effect=JWTError)
     with pytest.raises(HTTPException) as exc_info:
         validate_token("invalid_token")
     assert exc_info.value.status_code == 401
     assert "Invalid token" in exc_info.value.detail
-    token_cache.clear()
+    token_store.clear()
 
 
 def test_validate_token_no_username():
-    token_cache.clear()
+    token_store.clear()
     expiration_time = int((datetime.now(timezone.utc) - timedelta(minutes=30)).timestamp())
     payload = {"exp": expiration_time}
     token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-    token_cache[token] = datetime.fromtimestamp(expiration_time, timezone.utc)
+    token_store.add(token, datetime.fromtimestamp(expiration_time, timezone.utc))
     with pytest.raises(HTTPException) as exc_info:
         validate_token(token)
     assert exc_info.value.status_code == 401
     assert "Invalid token" in exc_info.value.detail
-    token_cache.clear()
+    token_store.clear()
 
 
 def test_get_current_user_success(db_session, mocker):
+    principal_cache.clear()
     user = schemas.User(username="testuser")
     mocker.patch("api.utils.auth.get_user").return_value = user
     mocker.patch("api.utils.auth.validate_token", return_value="testuser")
@@ -156,6 +159,7 @@ def test_get_current_user_success(db_session, mocker):
 
 
 def test_get_current_user_not_found(db_session, mocker):
+    principal_cache.clear()
     mocker.patch("api.utils.auth.get_user").return_value = None
     mocker.patch("api.utils.auth.validate_token", return_value="testuser")
     with pytest.raises(HTTPException) as exc_info:
@@ -163,3 +167,29 @@ def test_get_current_user_not_found(db_session, mocker):
 
     assert exc_info.value.status_code == 404
     assert "User 'testuser' not found" in exc_info.value.detail
+
+
+def test_get_current_user_cached(db_session, mocker):
+    principal_cache.clear()
+    get_user_mock = mocker.patch("api.utils.auth.get_user")
+    get_user_mock.return_value = schemas.User(username="testuser")
+    mocker.patch("api.utils.auth.validate_token", return_value="testuser")
+    get_current_user(db_session, "valid_token")
+    result = get_current_user(db_session, "valid_token")
+
+    assert result.username == "testuser"
+    assert get_user_mock.call_count == 1
+    principal_cache.clear()
+
+
+def test_get_current_user_invalidated(db_session, create_user, mocker):
+    principal_cache.clear()
+    mocker.patch("api.utils.auth.validate_token", return_value=create_user.username)
+    get_current_user(db_session, "valid_token")
+    invalidate_principal(create_user.username)
+    db_session.delete(create_user)
+    db_session.commit()
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(db_session, "valid_token")
+
+    assert exc_info.value.status_code == 404
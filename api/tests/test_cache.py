@@ -0,0 +1,39 @@
+from ..utils.cache import TTLCache
+
+
+def test_cache_get_set():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("key1", 1)
+    cache.set("key2", 2)
+    cache.get("key1")
+    cache.set("key3", 3)
+
+    assert cache.get("key1") == 1
+    assert cache.get("key2") is None
+    assert cache.get("key3") == 3
+
+
+def test_cache_ttl_expiry():
+    cache = TTLCache(maxsize=2, ttl=-1)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_delete():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("key", "value")
+    cache.delete("key")
+
+    assert cache.get("key") is None
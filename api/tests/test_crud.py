@@ -1,8 +1,12 @@
+import asyncio
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import inspect, update
 from ..crud import crud
 from ..schemas import schemas
-from ..models.models import CurrentTypeEnum, User
+from ..models.models import Connector, CurrentTypeEnum, User
+from ..utils.pagination import encode_cursor
+from ..utils.hashing import password_hasher
 
 
 class TestChargingStationTypeCrud:
@@ -45,6 +49,15 @@ class TestChargingStationTypeCrud:
         assert charging_station_type.current_type == create_station_type.current_type
         assert charging_station_type.charging_stations == create_station_type.charging_stations
 
+    def test_get_charging_station_type_eager_loads_station_ids(self, db_session, create_station_type, create_station):
+        charging_station_type_id = create_station_type.id
+        db_session.expunge_all()
+
+        charging_station_type = crud.get_charging_station_type(db_session, charging_station_type_id)
+
+        assert "charging_stations" not in inspect(charging_station_type).unloaded
+        assert inspect(charging_station_type.charging_stations[0]).unloaded >= {"name", "ip_address"}
+
     def test_get_charging_station_type_wrong_id(self, db_session, create_station_type):
         with pytest.raises(HTTPException) as exc_info:
             crud.get_charging_station_type(db_session, "a73ee835-1201-4888-9d3a-911f48958b42")
@@ -143,6 +156,32 @@ class TestChargingStationTypeCrud:
 
         assert len(charging_station_type_list) == 1
 
+    def test_get_charging_station_type_list_cursor(self, db_session, create_station_type, create_second_station_type):
+        first_page = crud.get_charging_station_type_list(
+            db=db_session,
+            plug_count=None,
+            min_efficiency=None,
+            max_efficiency=None,
+            current_type=None,
+            skip=None,
+            limit=1,
+            cursor=""
+        )
+        second_page = crud.get_charging_station_type_list(
+            db=db_session,
+            plug_count=None,
+            min_efficiency=None,
+            max_efficiency=None,
+            current_type=None,
+            skip=None,
+            limit=1,
+            cursor=encode_cursor(first_page[0].id)
+        )
+
+        assert len(first_page) == 1
+        assert len(second_page) == 1
+        assert first_page[0].id < second_page[0].id
+
     def test_update_charging_station_type_success(self, db_session, create_station_type):
         data = schemas.ChargingStationTypeCreate(
             name="Test Station Type Updated",
@@ -251,6 +290,104 @@ class TestChargingStationCrud:
         assert exc_info.value.status_code == 400
         assert "violates the database's integrity" in exc_info.value.detail
 
+    def test_create_charging_station_bulk_success(self, db_session, create_station_type, create_second_station_type):
+        data = [
+            schemas.ChargingStationCreate(
+                name="Bulk Station 1",
+                ip_address="10.0.0.1",
+                firmware_version="1.0",
+                type_id=create_station_type.id,
+                connectors=[schemas.ConnectorCreateWithStation(name="Bulk Connector 1", priority=True)]
+            ),
+            schemas.ChargingStationCreate(
+                name="Bulk Station 2",
+                ip_address="10.0.0.2",
+                firmware_version="1.0",
+                type_id=create_second_station_type.id,
+                connectors=[
+                    schemas.ConnectorCreateWithStation(name="Bulk Connector 2", priority=True),
+                    schemas.ConnectorCreateWithStation(name="Bulk Connector 3", priority=False)
+                ]
+            )
+        ]
+
+        result = crud.create_charging_station_bulk(db_session, data)
+
+        assert len(result.created) == 2
+        assert result.errors == []
+        charging_station = crud.get_charging_station(db_session, result.created[1])
+        assert charging_station.connector_count == 2
+        assert {connector.name for connector in charging_station.connectors} == {"Bulk Connector 2", "Bulk Connector 3"}
+
+    def test_create_charging_station_bulk_reports_invalid_items(self, db_session, create_station_type, create_station):
+        data = [
+            schemas.ChargingStationCreate(
+                name="Test Station",
+                ip_address="10.0.0.1",
+                firmware_version="1.0",
+                type_id=create_station_type.id,
+                connectors=[schemas.ConnectorCreateWithStation(name="Bulk Connector 1", priority=True)]
+            ),
+            schemas.ChargingStationCreate(
+                name="Bulk Station 2",
+                ip_address="10.0.0.2",
+                firmware_version="1.0",
+                type_id=create_station_type.id,
+                connectors=[]
+            ),
+            schemas.ChargingStationCreate(
+                name="Bulk Station 3",
+                ip_address="10.0.0.3",
+                firmware_version="1.0",
+                type_id=create_station_type.id,
+                connectors=[schemas.ConnectorCreateWithStation(name="Bulk Connector 3", priority=True)]
+            ),
+            schemas.ChargingStationCreate(
+                name="Bulk Station 4",
+                ip_address="10.0.0.3",
+                firmware_version="1.0",
+                type_id=create_station_type.id,
+                connectors=[schemas.ConnectorCreateWithStation(name="Bulk Connector 4", priority=True)]
+            )
+        ]
+
+        result = crud.create_charging_station_bulk(db_session, data)
+
+        assert len(result.created) == 1
+        assert [error.index for error in result.errors] == [0, 1, 3]
+        assert "already taken" in result.errors[0].detail
+        assert "must equal 1" in result.errors[1].detail
+        assert "already taken" in result.errors[2].detail
+
+    def test_create_charging_station_bulk_reports_shared_rule_errors(self, db_session, create_second_station_type):
+        data = [
+            schemas.ChargingStationCreate(
+                name="Bulk Station 1",
+                ip_address="10.0.0.1",
+                firmware_version="1.0",
+                type_id="a73ee835-1201-4888-9d3a-911f48958b42",
+                connectors=[schemas.ConnectorCreateWithStation(name="Bulk Connector 1", priority=True)]
+            ),
+            schemas.ChargingStationCreate(
+                name="Bulk Station 2",
+                ip_address="10.0.0.2",
+                firmware_version="1.0",
+                type_id=create_second_station_type.id,
+                connectors=[
+                    schemas.ConnectorCreateWithStation(name="Bulk Connector 2", priority=True),
+                    schemas.ConnectorCreateWithStation(name="Bulk Connector 3", priority=True)
+                ]
+            )
+        ]
+
+        result = crud.create_charging_station_bulk(db_session, data)
+
+        assert result.created == []
+        assert [error.detail for error in result.errors] == [
+            "ChargingStationType not found.",
+            "Only one connector in each Charging Station can have priority."
+        ]
+
     def test_create_charging_station_connector_count_constraint(self, db_session, create_station_type):
         data = schemas.ChargingStationCreate(
             name="Test Station",
@@ -297,6 +434,14 @@ class TestChargingStationCrud:
         assert charging_station.firmware_version == create_station.firmware_version
         assert charging_station.connectors == create_station.connectors
 
+    def test_get_charging_station_eager_loads_relationships(self, db_session, create_station, create_connector):
+        charging_station_id = create_station.id
+        db_session.expunge_all()
+
+        charging_station = crud.get_charging_station(db_session, charging_station_id)
+
+        assert not {"type", "connectors"} & inspect(charging_station).unloaded
+
     def test_get_charging_station_wrong_id(self, db_session, create_station, create_connector):
         with pytest.raises(HTTPException) as exc_info:
             crud.get_charging_station(db_session, "a73ee835-1201-4888-9d3a-911f48958b42")
@@ -530,6 +675,100 @@ class TestChargingStationCrud:
         assert charging_station.type_id == create_station_type.id
         assert len(charging_station.connectors) == 1
 
+    def test_charging_station_type_etag_follows_charging_stations(self, db_session, create_station_type):
+        charging_station_type_id = create_station_type.id
+        data = schemas.ChargingStationCreate(
+            name="Test Station",
+            ip_address="179.148.235.118",
+            firmware_version="1.0",
+            type_id=charging_station_type_id,
+            connectors=[schemas.ConnectorCreateWithStation(name="Test Connector", priority=True)]
+        )
+
+        etag = crud.get_charging_station_type_etag(db_session, charging_station_type_id)
+        charging_station = crud.create_charging_station(db_session, data)
+        created_etag = crud.get_charging_station_type_etag(db_session, charging_station_type_id)
+        crud.delete_charging_station(db_session, charging_station.id)
+        deleted_etag = crud.get_charging_station_type_etag(db_session, charging_station_type_id)
+
+        assert len({etag, created_etag, deleted_etag}) == 3
+
+    def test_update_charging_station_type_change_changes_type_etags(
+            self,
+            db_session,
+            create_station_type,
+            create_second_station_type,
+            create_station
+    ):
+        data = schemas.ChargingStationCreate(
+            name="Test Station",
+            ip_address="179.148.235.118",
+            firmware_version="1.0",
+            type_id=create_second_station_type.id,
+            connectors=[
+                schemas.ConnectorCreateWithStation(name="Test Connector", priority=True),
+                schemas.ConnectorCreateWithStation(name="Test Connector 2", priority=False)
+            ]
+        )
+        type_ids = [create_station_type.id, create_second_station_type.id]
+        etags = [crud.get_charging_station_type_etag(db_session, type_id) for type_id in type_ids]
+
+        crud.update_charging_station(db_session, create_station.id, data)
+
+        for type_id, etag in zip(type_ids, etags):
+            assert crud.get_charging_station_type_etag(db_session, type_id) != etag
+
+    def test_update_charging_station_connector_diff(
+            self,
+            db_session,
+            create_second_station_type,
+            create_second_station,
+            create_second_connector,
+            create_third_connector
+    ):
+        kept_connector_id = create_second_connector.id
+        data = schemas.ChargingStationCreate(
+            name="Test Station 2",
+            ip_address="53.72.164.8",
+            firmware_version="1.3",
+            type_id=create_second_station_type.id,
+            connectors=[
+                schemas.ConnectorCreateWithStation(name="Test Connector 2", priority=True),
+                schemas.ConnectorCreateWithStation(name="Test Connector 4", priority=False)
+            ]
+        )
+
+        charging_station = crud.update_charging_station(db_session, create_second_station.id, data)
+
+        connectors = {connector.name: connector for connector in charging_station.connectors}
+        assert set(connectors) == {"Test Connector 2", "Test Connector 4"}
+        assert connectors["Test Connector 2"].id == kept_connector_id
+        assert connectors["Test Connector 2"].priority is True
+        assert charging_station.connector_count == 2
+
+    def test_update_charging_station_duplicate_connector_names(
+            self,
+            db_session,
+            create_second_station_type,
+            create_second_station
+    ):
+        data = schemas.ChargingStationCreate(
+            name="Test Station 2",
+            ip_address="53.72.164.8",
+            firmware_version="1.3",
+            type_id=create_second_station_type.id,
+            connectors=[
+                schemas.ConnectorCreateWithStation(name="Test Connector", priority=True),
+                schemas.ConnectorCreateWithStation(name="Test Connector", priority=False)
+            ]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.update_charging_station(db_session, create_second_station.id, data)
+
+        assert exc_info.value.status_code == 400
+        assert "Connector names must be unique." in exc_info.value.detail
+
     def test_update_charging_station_wrong_id(self, db_session, create_station_type, create_station):
         data = schemas.ChargingStationCreate(
             name="Test Station Updated",
@@ -775,6 +1014,33 @@ class TestConnectorCrud:
 
         assert len(connector_list) == 1
 
+    def test_get_connector_list_cursor(self, db_session, create_station, create_connector, create_second_connector):
+        connector_ids = sorted([create_connector.id, create_second_connector.id])
+        connector_list = crud.get_connector_list(
+            db=db_session,
+            priority=None,
+            charging_station_id=None,
+            skip=None,
+            limit=None,
+            cursor=encode_cursor(connector_ids[0])
+        )
+
+        assert [connector.id for connector in connector_list] == connector_ids[1:]
+
+    def test_get_connector_list_invalid_cursor(self, db_session, create_connector):
+        with pytest.raises(HTTPException) as exc_info:
+            crud.get_connector_list(
+                db=db_session,
+                priority=None,
+                charging_station_id=None,
+                skip=None,
+                limit=None,
+                cursor="not-a-cursor"
+            )
+
+        assert exc_info.value.status_code == 400
+        assert "Invalid cursor." in exc_info.value.detail
+
     def test_update_connector_success(self, db_session, create_station, create_connector):
         data = schemas.ConnectorCreate(
             name="Test Connector Updated",
@@ -800,6 +1066,45 @@ class TestConnectorCrud:
         assert connector.priority is True
         assert connector.charging_station_id is None
 
+    def test_update_connector_after_concurrent_update(self, db_session, create_connector):
+        data = schemas.ConnectorCreate(
+            name="Test Connector Updated",
+            priority=True,
+        )
+        db_session.execute(
+            update(Connector)
+            .where(Connector.id == create_connector.id)
+            .values(version=Connector.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+        connector = crud.update_connector(db_session, create_connector.id, data)
+
+        assert connector.name == "Test Connector Updated"
+        assert connector.version == 3
+
+    def test_get_connector_etag_changes_on_update(self, db_session, create_connector):
+        data = schemas.ConnectorCreate(
+            name="Test Connector Updated",
+            priority=True,
+        )
+
+        etag = crud.get_connector_etag(db_session, create_connector.id)
+        crud.update_connector(db_session, create_connector.id, data)
+
+        assert crud.get_connector_etag(db_session, create_connector.id) != etag
+
+    def test_get_connector_etag_changes_on_charging_station_delete(self, db_session, create_station, create_connector):
+        connector_id = create_connector.id
+        etag = crud.get_connector_etag(db_session, connector_id)
+        crud.delete_charging_station(db_session, create_station.id)
+
+        assert crud.get_connector_etag(db_session, connector_id) != etag
+        assert crud.get_connector(db_session, connector_id).charging_station_id is None
+
+    def test_get_connector_etag_wrong_id(self, db_session):
+        assert crud.get_connector_etag(db_session, "7fe5e5c4-1b0f-4f5e-9a43-96b2b2a1c7e1") is None
+
     def test_update_connector_wrong_id(self, db_session, create_connector):
         data = schemas.ConnectorCreate(
             name="Test Connector Updated",
@@ -863,6 +1168,88 @@ class TestConnectorCrud:
         assert exc_info.value.status_code == 400
         assert "The number of connectors cannot exceed" in exc_info.value.detail
 
+    def test_connector_count_maintained(self, db_session, create_station, create_second_station):
+        data = schemas.ConnectorCreate(
+            name="Test Connector",
+            priority=False,
+            charging_station_id=create_station.id
+        )
+
+        connector = crud.create_connector(db_session, data)
+        assert create_station.connector_count == 1
+
+        data.charging_station_id = create_second_station.id
+        crud.update_connector(db_session, connector.id, data)
+        assert create_station.connector_count == 0
+        assert create_second_station.connector_count == 1
+
+        crud.delete_connector(db_session, connector.id)
+        assert create_second_station.connector_count == 0
+
+    def test_upsert_connector_bulk_success(
+            self,
+            db_session,
+            create_station,
+            create_second_station,
+            create_second_connector,
+            create_third_connector
+    ):
+        data = [
+            schemas.ConnectorCreate(
+                name="Test Connector 2",
+                priority=True,
+                charging_station_id=create_second_station.id
+            ),
+            schemas.ConnectorCreate(name="Test Connector 3", priority=False, charging_station_id=create_station.id),
+            schemas.ConnectorCreate(name="Bulk Connector", priority=False, charging_station_id=create_second_station.id)
+        ]
+
+        result = crud.upsert_connector_bulk(db_session, data)
+
+        assert {connector.name for connector in result} == {"Test Connector 2", "Test Connector 3", "Bulk Connector"}
+        assert next(connector for connector in result if connector.name == "Test Connector 2").id \
+            == create_second_connector.id
+        db_session.refresh(create_station)
+        db_session.refresh(create_second_station)
+        assert create_station.connector_count == 1
+        assert create_second_station.connector_count == 2
+
+    def test_upsert_connector_bulk_count_violation(self, db_session, create_station, create_connector):
+        data = [schemas.ConnectorCreate(name="Bulk Connector", priority=False, charging_station_id=create_station.id)]
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.upsert_connector_bulk(db_session, data)
+
+        assert exc_info.value.status_code == 400
+        assert "cannot exceed 1" in exc_info.value.detail
+        db_session.refresh(create_station)
+        assert create_station.connector_count == 1
+
+    def test_upsert_connector_bulk_priority_violation(self, db_session, create_second_station, create_third_connector):
+        data = [
+            schemas.ConnectorCreate(name="Bulk Connector", priority=True, charging_station_id=create_second_station.id)
+        ]
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.upsert_connector_bulk(db_session, data)
+
+        assert exc_info.value.status_code == 400
+        assert "already has a connector with priority" in exc_info.value.detail
+
+    def test_upsert_connector_bulk_station_not_found(self, db_session):
+        data = [
+            schemas.ConnectorCreate(
+                name="Bulk Connector",
+                priority=False,
+                charging_station_id="a73ee835-1201-4888-9d3a-911f48958b42"
+            )
+        ]
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.upsert_connector_bulk(db_session, data)
+
+        assert exc_info.value.status_code == 404
+
     def test_delete_connector_success(self, db_session, create_connector):
         crud.delete_connector(db_session, create_connector.id)
 
@@ -902,6 +1289,27 @@ class TestUserCrud:
         assert exc_info.value.status_code == 400
         assert "is already registered." in exc_info.value.detail
 
+    def test_create_user_async_success(self, db_session, mocker):
+        data = schemas.UserCreate(username="admin", password="admin")
+        blocking_run = mocker.spy(password_hasher, "run")
+
+        user = asyncio.run(crud.create_user_async(db_session, data))
+
+        assert user.username == "admin"
+        assert user.hashed_password != "admin"
+        assert blocking_run.call_count == 0
+
+    def test_create_user_async_not_unique(self, db_session, create_user, mocker):
+        data = schemas.UserCreate(username="admin", password="admin")
+        run_async = mocker.spy(password_hasher, "run_async")
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(crud.create_user_async(db_session, data))
+
+        assert exc_info.value.status_code == 400
+        assert "is already registered." in exc_info.value.detail
+        assert run_async.call_count == 0
+
     def test_update_user_success(self, db_session, create_user):
         data = schemas.UserCreate(username="admin update", password="admin")
 
@@ -910,6 +1318,25 @@ class TestUserCrud:
         assert user.username == "admin update"
         assert user.hashed_password != "admin"
 
+    def test_update_user_async_success(self, db_session, create_user, mocker):
+        data = schemas.UserCreate(username="admin update", password="admin")
+        blocking_run = mocker.spy(password_hasher, "run")
+
+        user = asyncio.run(crud.update_user_async(db_session, create_user.username, data))
+
+        assert user.username == "admin update"
+        assert user.hashed_password != "admin"
+        assert blocking_run.call_count == 0
+
+    def test_update_user_async_not_unique(self, db_session, create_user, create_second_user):
+        data = schemas.UserCreate(username="admin2", password="admin")
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(crud.update_user_async(db_session, create_user.username, data))
+
+        assert exc_info.value.status_code == 400
+        assert "violates the database's integrity" in exc_info.value.detail
+
     def test_update_user_wrong_username(self, db_session):
         data = schemas.UserCreate(username="admin update", password="admin")
 
@@ -0,0 +1,26 @@
+import orjson
+from ..utils.export import CSV_COLUMNS, iter_csv, iter_ndjson
+
+
+def test_iter_ndjson(create_station, create_connector):
+    lines = b"".join(iter_ndjson([create_station, create_station], chunk_size=1)).splitlines()
+
+    assert len(lines) == 2
+    row = orjson.loads(lines[0])
+    assert row["id"] == str(create_station.id)
+    assert row["type"]["plug_count"] == 1
+    assert row["connectors"] == [{"id": str(create_connector.id), "name": "Test Connector", "priority": True}]
+
+
+def test_iter_csv(create_station, create_connector):
+    chunks = list(iter_csv([create_station, create_station], chunk_size=1))
+    lines = "".join(chunks).splitlines()
+
+    assert len(chunks) == 2
+    assert lines[0] == ",".join(CSV_COLUMNS)
+    assert lines[1].startswith(f"{create_station.id},Test Station,")
+    assert lines[1].endswith("Test Connector,Test Connector")
+
+
+def test_iter_csv_empty():
+    assert "".join(iter_csv([], chunk_size=10)) == ",".join(CSV_COLUMNS) + "\r\n"
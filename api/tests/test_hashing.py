@@ -0,0 +1,36 @@
+import pytest
+import threading
+from fastapi import HTTPException
+from ..utils.hashing import PasswordHashExecutor
+
+
+def test_password_hash_executor_run():
+    executor = PasswordHashExecutor(max_workers=1, max_queue=1)
+
+    assert executor.run(sum, [1, 2]) == 3
+    assert executor.stats()["completed"] == 1
+    assert executor.stats()["in_flight"] == 0
+
+
+def test_password_hash_executor_back_to_back():
+    executor = PasswordHashExecutor(max_workers=1, max_queue=0)
+
+    for _ in range(100):
+        executor.run(sum, [1, 2])
+
+    assert executor.stats()["completed"] == 100
+    assert executor.stats()["rejected"] == 0
+
+
+def test_password_hash_executor_rejects_when_full():
+    executor = PasswordHashExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+    future = executor.submit(release.wait)
+
+    with pytest.raises(HTTPException) as exc_info:
+        executor.submit(release.wait)
+    release.set()
+    future.result()
+
+    assert exc_info.value.status_code == 503
+    assert executor.stats()["rejected"] == 1
@@ -1,48 +1,40 @@
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from ..utils.helpers import (
-    check_priority_constraint_connector_update,
+    check_priority_constraint_violation,
     check_connector_count_connector_update,
     check_connector_count_station,
     check_priority_constraint_station,
     check_connector_count_connector,
-    check_priority_constraint_connector
+    check_connector_count_station_list
 )
 from ..models.models import Connector
 from ..schemas import schemas
 
 
 class TestPriorityConstraint:
-    def test_priority_constraint_connector(self, db_session, create_station, create_connector):
-        with pytest.raises(HTTPException) as exc_info:
-            check_priority_constraint_connector(db_session, create_station.id)
-
-        assert exc_info.value.status_code == 400
-        assert "This charging station already has a connector with priority" in exc_info.value.detail
-
-    def test_priority_constraint_connector_not_raised(self, db_session, create_station):
-        check_priority_constraint_connector(db_session, create_station.id)
-
-    def test_priority_constraint_connector_update(self, db_session, create_second_station, create_third_connector):
+    def test_priority_constraint_violation(self, db_session, create_second_station, create_third_connector):
         connector = Connector(name="Test Connector", priority=True, charging_station_id=create_second_station.id)
         db_session.add(connector)
-        db_session.commit()
+        with pytest.raises(IntegrityError) as integrity_error:
+            db_session.commit()
+        db_session.rollback()
+
         with pytest.raises(HTTPException) as exc_info:
-            check_priority_constraint_connector_update(db_session, create_second_station.id)
+            check_priority_constraint_violation(integrity_error.value)
 
         assert exc_info.value.status_code == 400
         assert "This charging station already has a connector with priority" in exc_info.value.detail
 
-    def test_priority_constraint_connector_update_not_raised(
-            self,
-            db_session,
-            create_second_station,
-            create_third_connector
-    ):
-        connector = Connector(name="Test Connector", priority=False, charging_station_id=create_second_station.id)
+    def test_priority_constraint_violation_not_raised(self, db_session, create_connector):
+        connector = Connector(name="Test Connector", priority=False)
         db_session.add(connector)
-        db_session.commit()
-        check_priority_constraint_connector_update(db_session, create_second_station.id)
+        with pytest.raises(IntegrityError) as integrity_error:
+            db_session.commit()
+        db_session.rollback()
+
+        check_priority_constraint_violation(integrity_error.value)
 
     def test_priority_constraint_station(self):
         connector_data = [
@@ -90,6 +82,7 @@ class TestCountConstraint:
 
     def test_count_constraint_connector_update(self, db_session, create_station, create_connector):
         connector = Connector(name="Test Connector 2", priority=False, charging_station_id=create_station.id)
+        create_station.connector_count += 1
         db_session.add(connector)
         db_session.commit()
         with pytest.raises(HTTPException) as exc_info:
@@ -149,3 +142,20 @@ class TestCountConstraint:
             connectors=connectors
         )
         check_connector_count_station(db_session, station_data)
+
+    def test_count_constraint_station_list(self, db_session, create_station, create_second_station, create_connector):
+        with pytest.raises(HTTPException) as exc_info:
+            check_connector_count_station_list([create_station, create_second_station])
+
+        assert exc_info.value.status_code == 400
+        assert f"Charging station with id={create_second_station.id} has 0 connectors instead of 2." \
+               in exc_info.value.detail
+
+    def test_count_constraint_station_list_not_raised(
+            self,
+            db_session,
+            create_station,
+            create_second_station,
+            create_connector
+    ):
+        check_connector_count_station_list([create_station])
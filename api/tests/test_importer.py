@@ -0,0 +1,78 @@
+import io
+import orjson
+from ..models import models
+from ..utils.export import ExportFormatEnum
+from ..utils.importer import import_charging_stations
+
+
+def _ndjson(*records):
+    return io.BytesIO(b"".join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records))
+
+
+def test_import_ndjson(db_session, create_station_type, create_station, create_connector):
+    source = _ndjson(
+        {
+            "name": "Imported Station",
+            "ip_address": "10.0.0.1",
+            "firmware_version": "1.0",
+            "type_id": str(create_station_type.id),
+            "connectors": [{"name": "Imported Connector", "priority": True}]
+        },
+        {
+            "name": "Test Station",
+            "ip_address": "10.0.0.2",
+            "firmware_version": "1.0",
+            "type_id": str(create_station_type.id),
+            "connectors": [{"name": "Imported Connector 2", "priority": True}]
+        },
+        {
+            "name": "Imported Station 3",
+            "ip_address": "10.0.0.1",
+            "firmware_version": "1.0",
+            "type_id": str(create_station_type.id),
+            "connectors": [{"name": "Imported Connector 3", "priority": True}]
+        },
+        {
+            "name": "Imported Station 4",
+            "ip_address": "10.0.0.4",
+            "firmware_version": "1.0",
+            "type_id": str(create_station_type.id),
+            "connectors": []
+        },
+        {
+            "name": "Imported Station 5",
+            "ip_address": "not an ip",
+            "firmware_version": "1.0",
+            "type_id": str(create_station_type.id),
+            "connectors": [{"name": "Imported Connector 5", "priority": True}]
+        }
+    )
+    rejects_file = io.StringIO()
+
+    result = import_charging_stations(db_session, source, ExportFormatEnum.ndjson, rejects_file)
+
+    assert result == {"imported": 1, "rejected": 4}
+    db_session.refresh(create_station_type)
+    assert create_station_type.version == 2
+    rejects = rejects_file.getvalue().splitlines()
+    assert rejects[0] == "line,name,detail"
+    assert sorted(int(reject.split(",")[0]) for reject in rejects[1:]) == [2, 3, 4, 5]
+    charging_station = db_session.query(models.ChargingStation).filter_by(name="Imported Station").one()
+    assert charging_station.connector_count == 1
+    assert [connector.name for connector in charging_station.connectors] == ["Imported Connector"]
+
+
+def test_import_csv(db_session, create_second_station_type):
+    source = io.BytesIO(
+        "name,ip_address,firmware_version,type_id,connectors,priority_connector\n"
+        f"Imported Station,10.0.0.1,1.0,{create_second_station_type.id},Connector A;Connector B,Connector B\n"
+        f"Imported Station 2,10.0.0.2,1.0,{create_second_station_type.id},Connector B;Connector C,\n".encode()
+    )
+    rejects_file = io.StringIO()
+
+    result = import_charging_stations(db_session, source, ExportFormatEnum.csv, rejects_file)
+
+    assert result == {"imported": 1, "rejected": 1}
+    assert "Connector names must be unique." in rejects_file.getvalue()
+    priority_connector = db_session.query(models.Connector).filter_by(priority=True).one()
+    assert priority_connector.name == "Connector B"
@@ -0,0 +1,64 @@
+import logging
+import sys
+import orjson
+from ..utils.logging_config import JsonFormatter, LazyQueueHandler, SamplingFilter
+
+
+def make_record(level: int = logging.INFO, function: str = "read_connector", msg: str = "Fetching %s.", args=("x",)):
+    record = logging.LogRecord("api.routers.connector_router", level, __file__, 1, msg, args, None)
+    record.funcName = function
+    return record
+
+
+def test_json_formatter():
+    entry = orjson.loads(JsonFormatter().format(make_record()))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "api.routers.connector_router"
+    assert entry["function"] == "read_connector"
+    assert entry["message"] == "Fetching x."
+
+
+def test_json_formatter_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("api", logging.ERROR, __file__, 1, "Failed.", None, sys.exc_info())
+
+    entry = orjson.loads(JsonFormatter().format(record))
+
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_sampling_filter_keeps_one_in_interval():
+    sampling_filter = SamplingFilter(0.25)
+
+    kept = [sampling_filter.filter(make_record()) for _ in range(8)]
+
+    assert kept.count(True) == 2
+
+
+def test_sampling_filter_counts_each_function_separately():
+    sampling_filter = SamplingFilter(0.5)
+
+    assert sampling_filter.filter(make_record(function="read_connector")) is True
+    assert sampling_filter.filter(make_record(function="read_connector_list")) is True
+    assert sampling_filter.filter(make_record(function="read_connector")) is False
+
+
+def test_sampling_filter_keeps_warnings():
+    sampling_filter = SamplingFilter(0)
+
+    assert sampling_filter.filter(make_record()) is False
+    assert sampling_filter.filter(make_record(level=logging.WARNING)) is True
+    assert sampling_filter.filter(make_record(level=logging.ERROR)) is True
+
+
+def test_lazy_queue_handler_does_not_format():
+    handler = LazyQueueHandler(None)
+    record = make_record()
+
+    prepared = handler.prepare(record)
+
+    assert prepared is record
+    assert prepared.args == ("x",)
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+from ..database.pool_metrics import PoolMetrics, instrument_pool_class
+from ..utils.metrics import instrument_engine, metrics_registry, route_label, DB_POOL_CHECKED_OUT, NO_REQUEST, NO_ROUTE
+
+
+def sample_value(name: str, labels: dict) -> float:
+    return metrics_registry().get_sample_value(name, labels) or 0
+
+
+def test_route_label_unmatched():
+    assert route_label({"path": "/unknown"}) == NO_ROUTE
+
+
+def test_instrumented_engine_records_statements_and_pool_usage():
+    metrics = PoolMetrics()
+    engine = create_engine("sqlite://", poolclass=instrument_pool_class(QueuePool, metrics), pool_size=1)
+    instrument_engine(engine, "test", metrics)
+    statements = sample_value("db_statement_duration_seconds_count", {"route": NO_REQUEST})
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert DB_POOL_CHECKED_OUT.labels("test")._value.get() == 1
+
+    assert DB_POOL_CHECKED_OUT.labels("test")._value.get() == 0
+    assert sample_value("db_statement_duration_seconds_count", {"route": NO_REQUEST}) == statements + 1
+    assert sample_value("db_pool_checkout_wait_seconds_count", {"pool": "test"}) == 1
+
+
+def test_instrumented_engine_failed_statement_leaves_nothing_on_connection():
+    metrics = PoolMetrics()
+    engine = create_engine("sqlite://", poolclass=instrument_pool_class(QueuePool, metrics), pool_size=1)
+    instrument_engine(engine, "failing", metrics)
+    statements = sample_value("db_statement_duration_seconds_count", {"route": NO_REQUEST})
+
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+        assert "statement_start" not in connection.info
+
+    assert sample_value("db_statement_duration_seconds_count", {"route": NO_REQUEST}) == statements + 1
@@ -1,6 +1,17 @@
+from sqlalchemy import text
 from ..models import models
 
 
+def explain(db_session, query):
+    statement = query.statement.compile(
+        dialect=db_session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True}
+    )
+    # The test tables are tiny, so the planner would pick sequential scans unless told otherwise.
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    return "\n".join(db_session.execute(text(f"EXPLAIN {statement}")).scalars())
+
+
 class TestChargingStationTypeModel:
     def test_create_and_fetch_charging_station_type(self, db_session, create_station_type):
         fetched = db_session.query(models.ChargingStationType).filter_by(name=create_station_type.name).first()
@@ -107,3 +118,64 @@ class TestModelsRelationships:
         fetched = db_session.query(models.Connector).filter_by(name=create_connector.name).first()
 
         assert fetched.charging_station.name == create_station.name
+
+
+class TestIndexes:
+    def test_charging_station_firmware_version_uses_index(self, db_session, create_station):
+        plan = explain(
+            db_session,
+            db_session.query(models.ChargingStation)
+            .filter(models.ChargingStation.firmware_version == "1.0")
+            .order_by(models.ChargingStation.id)
+        )
+
+        assert "ix_charging_stations_firmware_version_id" in plan
+
+    def test_charging_station_type_id_uses_index(self, db_session, create_station_type, create_station):
+        plan = explain(
+            db_session,
+            db_session.query(models.ChargingStation).filter(models.ChargingStation.type_id == create_station_type.id)
+        )
+
+        assert "ix_charging_stations_type_id" in plan
+
+    def test_charging_station_type_plug_count_uses_index(self, db_session, create_station_type):
+        plan = explain(
+            db_session,
+            db_session.query(models.ChargingStationType)
+            .filter(models.ChargingStationType.plug_count == 1, models.ChargingStationType.efficiency >= 1)
+        )
+
+        assert "ix_charging_station_types_plug_count_efficiency" in plan
+
+    def test_connector_charging_station_id_uses_index(self, db_session, create_station, create_connector):
+        plan = explain(
+            db_session,
+            db_session.query(models.Connector).filter(models.Connector.charging_station_id == create_station.id)
+        )
+
+        assert "ix_connectors_charging_station_id_priority" in plan
+
+    def test_charging_station_type_current_type_uses_index(self, db_session, create_station_type):
+        plan = explain(
+            db_session,
+            db_session.query(models.ChargingStationType)
+            .filter(
+                models.ChargingStationType.current_type == models.CurrentTypeEnum.AC,
+                models.ChargingStationType.efficiency >= 1
+            )
+        )
+
+        assert "ix_charging_station_types_current_type_efficiency" in plan
+
+    def test_connector_priority_uses_index(self, db_session, create_connector):
+        priority = False
+        plan = explain(
+            db_session,
+            db_session.query(models.Connector)
+            .filter(models.Connector.priority == priority)
+            .order_by(models.Connector.id)
+            .limit(10)
+        )
+
+        assert "ix_connectors_priority_id" in plan
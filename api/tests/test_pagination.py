@@ -0,0 +1,34 @@
+import pytest
+from uuid import uuid4
+from fastapi import HTTPException, Response
+from ..utils.pagination import encode_cursor, decode_cursor, set_next_cursor, NEXT_CURSOR_HEADER
+from ..models.models import Connector
+
+
+def test_cursor_round_trip():
+    last_id = uuid4()
+
+    assert decode_cursor(encode_cursor(last_id)) == last_id
+
+
+def test_decode_cursor_invalid():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+    assert "Invalid cursor." in exc_info.value.detail
+
+
+def test_set_next_cursor_full_page():
+    response = Response()
+    result = [Connector(id=uuid4()), Connector(id=uuid4())]
+    set_next_cursor(response, result, 2)
+
+    assert decode_cursor(response.headers[NEXT_CURSOR_HEADER]) == result[-1].id
+
+
+def test_set_next_cursor_last_page():
+    response = Response()
+    set_next_cursor(response, [Connector(id=uuid4())], 2)
+
+    assert NEXT_CURSOR_HEADER not in response.headers
@@ -0,0 +1,66 @@
+import sqlite3
+import time
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from ..database.pool_metrics import PoolMetrics, instrument_pool_class, pool_stats
+
+
+def test_pool_metrics_histogram():
+    metrics = PoolMetrics(buckets=(0.01, 0.1))
+    metrics.observe(0.005)
+    metrics.observe(0.05)
+    metrics.observe(1)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["count"] == 3
+    assert snapshot["buckets"] == {"0.01": 1, "0.1": 2, "+Inf": 3}
+
+
+def test_instrumented_pool_records_checkouts():
+    metrics = PoolMetrics()
+    engine = create_engine("sqlite://", poolclass=instrument_pool_class(QueuePool, metrics), pool_size=1)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert pool_stats(engine, metrics)["checked_out"] == 1
+
+    stats = pool_stats(engine, metrics)
+    assert stats["checked_out"] == 0
+    assert stats["checkout_wait_seconds"]["count"] == 1
+
+
+def test_instrumented_pool_excludes_connection_setup():
+    def slow_connect():
+        time.sleep(0.2)
+        return sqlite3.connect(":memory:")
+
+    metrics = PoolMetrics(buckets=(0.1,))
+    engine = create_engine("sqlite://", creator=slow_connect, poolclass=instrument_pool_class(QueuePool, metrics))
+
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+
+    snapshot = metrics.snapshot()
+    assert snapshot["count"] == 2
+    assert snapshot["buckets"]["0.1"] == 2
+
+
+def test_instrumented_pool_records_timeouts():
+    metrics = PoolMetrics()
+    engine = create_engine(
+        "sqlite://",
+        poolclass=instrument_pool_class(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01
+    )
+
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    assert metrics.snapshot()["timeouts"] == 1
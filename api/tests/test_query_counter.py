@@ -0,0 +1,67 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from ..utils.query_counter import QueryBudgetExceeded, QueryCounter, QueryCounterMiddleware, count_request_queries
+
+
+def create_app(budget: int, mode: str) -> FastAPI:
+    engine = create_engine("sqlite://")
+    count_request_queries(engine, budget=budget, mode=mode)
+    app = FastAPI()
+    app.add_middleware(QueryCounterMiddleware, budget=budget, header=True)
+
+    @app.get("/queries/{count}")
+    def run_queries(count: int):
+        with engine.connect() as connection:
+            for _ in range(count):
+                connection.execute(text("SELECT 1"))
+        return {"count": count}
+
+    return app
+
+
+def test_query_counter_records_statements():
+    engine = create_engine("sqlite://")
+
+    with QueryCounter(engine) as counter:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 3"))
+
+    assert counter.count == 2
+    assert counter.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_query_count_header():
+    client = TestClient(create_app(budget=5, mode="log"))
+
+    response = client.get("/queries/3")
+
+    assert response.status_code == 200
+    assert response.headers["x-query-count"] == "3"
+
+
+def test_query_budget_log_mode(caplog):
+    client = TestClient(create_app(budget=2, mode="log"))
+
+    with caplog.at_level(logging.WARNING):
+        response = client.get("/queries/3")
+
+    assert response.status_code == 200
+    assert "executed 3 queries, over the budget of 2" in caplog.text
+
+
+def test_query_budget_raise_mode():
+    client = TestClient(create_app(budget=2, mode="raise"))
+
+    with pytest.raises(QueryBudgetExceeded):
+        client.get("/queries/3")
+
+
+def test_query_budget_unknown_mode():
+    with pytest.raises(RuntimeError):
+        count_request_queries(create_engine("sqlite://"), budget=1, mode="ignore")
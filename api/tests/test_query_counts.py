@@ -0,0 +1,370 @@
+from ..main import app
+from ..models import models
+from ..schemas import schemas
+from ..utils.auth import get_current_user, get_password_hash
+
+
+class TestQueryCounts:
+    """Query budgets of the router endpoints. List and bulk endpoints are called with two rows so that per-row queries
+    show up as extra queries."""
+
+    def test_create_charging_station_type(self, client, assert_query_count):
+        test_data = {
+            "name": "Test Station Type",
+            "plug_count": 2,
+            "efficiency": 80.1,
+            "current_type": "AC"
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(3):
+            response = client.post("/charging_station_types/", json=test_data)
+
+        assert response.status_code == 201
+
+    def test_read_charging_station_type(self, client, assert_query_count, create_station):
+        charging_station_type_id = create_station.type_id
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(3):
+            response = client.get(f"/charging_station_types/{charging_station_type_id}")
+
+        assert response.status_code == 200
+
+    def test_read_charging_station_type_not_modified(self, client, assert_query_count, create_station_type):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        etag = client.get(f"/charging_station_types/{create_station_type.id}").headers["etag"]
+
+        with assert_query_count(1):
+            response = client.get(f"/charging_station_types/{create_station_type.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_read_charging_station_type_list(
+            self,
+            client,
+            assert_query_count,
+            create_station,
+            create_second_station
+    ):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(2):
+            response = client.get("/charging_station_types/")
+
+        assert response.status_code == 200
+
+    def test_update_charging_station_type(self, client, assert_query_count, create_station_type):
+        charging_station_type_id = create_station_type.id
+        test_data = {
+            "name": "Test Station Type Updated",
+            "plug_count": 1,
+            "efficiency": 80.1,
+            "current_type": "AC"
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(4):
+            response = client.put(f"/charging_station_types/{charging_station_type_id}", json=test_data)
+
+        assert response.status_code == 200
+
+    def test_delete_charging_station_type(self, client, assert_query_count, create_station_type):
+        charging_station_type_id = create_station_type.id
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(3):
+            response = client.delete(f"/charging_station_types/{charging_station_type_id}")
+
+        assert response.status_code == 204
+
+    def test_create_charging_station(self, client, assert_query_count, create_second_station_type):
+        test_data = {
+            "name": "Test Station",
+            "ip_address": "192.168.1.2",
+            "firmware_version": "v1.2.4",
+            "type_id": str(create_second_station_type.id),
+            "connectors": [
+                {"name": "Test Connector", "priority": True},
+                {"name": "Test Connector 2", "priority": False}
+            ]
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(8):
+            response = client.post("/charging_stations/", json=test_data)
+
+        assert response.status_code == 201
+
+    def test_create_charging_station_bulk(self, client, assert_query_count, create_second_station_type):
+        test_data = [
+            {
+                "name": f"Test Station {i}",
+                "ip_address": f"192.168.1.{i}",
+                "firmware_version": "v1.2.4",
+                "type_id": str(create_second_station_type.id),
+                "connectors": [
+                    {"name": f"Test Connector {i}", "priority": True},
+                    {"name": f"Test Connector {i}-2", "priority": False}
+                ]
+            }
+            for i in range(2)
+        ]
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(6):
+            response = client.post("/charging_stations/bulk", json=test_data)
+
+        assert response.status_code == 201
+        assert len(response.json()["created"]) == 2
+
+    def test_export_charging_station_list(
+            self,
+            client,
+            assert_query_count,
+            create_connector,
+            create_second_connector,
+            create_third_connector
+    ):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(2):
+            response = client.get("/charging_stations/export")
+
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == 2
+
+    def test_read_charging_station(self, client, assert_query_count, create_station, create_connector):
+        charging_station_id = create_station.id
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(3):
+            response = client.get(f"/charging_stations/{charging_station_id}")
+
+        assert response.status_code == 200
+
+    def test_read_charging_station_list(
+            self,
+            client,
+            assert_query_count,
+            create_connector,
+            create_second_connector,
+            create_third_connector
+    ):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(1):
+            response = client.get("/charging_stations/")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+
+    def test_update_charging_station(
+            self,
+            client,
+            assert_query_count,
+            create_second_station,
+            create_second_connector,
+            create_third_connector
+    ):
+        charging_station_id = create_second_station.id
+        test_data = {
+            "name": "Test Station 2 Updated",
+            "ip_address": "53.72.164.8",
+            "firmware_version": "1.3",
+            "type_id": str(create_second_station.type_id),
+            "connectors": [
+                {"name": "Test Connector 2", "priority": True},
+                {"name": "Test Connector 4", "priority": False}
+            ]
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(10):
+            response = client.put(f"/charging_stations/{charging_station_id}", json=test_data)
+
+        assert response.status_code == 200
+
+    def test_delete_charging_station(
+            self,
+            client,
+            assert_query_count,
+            create_second_station,
+            create_second_connector,
+            create_third_connector
+    ):
+        charging_station_id = create_second_station.id
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(5):
+            response = client.delete(f"/charging_stations/{charging_station_id}")
+
+        assert response.status_code == 204
+
+    def test_create_connector(self, client, assert_query_count):
+        test_data = {
+            "name": "Test Connector",
+            "priority": True
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(2):
+            response = client.post("/connectors/", json=test_data)
+
+        assert response.status_code == 201
+
+    def test_upsert_connector_bulk(
+            self,
+            client,
+            assert_query_count,
+            create_second_station,
+            create_second_connector,
+            create_third_connector
+    ):
+        charging_station_id = str(create_second_station.id)
+        test_data = [
+            {"name": "Test Connector 2", "priority": False, "charging_station_id": charging_station_id},
+            {"name": "Test Connector 3", "priority": True, "charging_station_id": charging_station_id}
+        ]
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(6):
+            response = client.post("/connectors/bulk", json=test_data)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+
+    def test_read_connector(self, client, assert_query_count, create_connector):
+        connector_id = create_connector.id
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(2):
+            response = client.get(f"/connectors/{connector_id}")
+
+        assert response.status_code == 200
+
+    def test_read_connector_list(self, client, assert_query_count, create_connector, create_second_connector):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(1):
+            response = client.get("/connectors/")
+
+        assert response.status_code == 200
+
+    def test_update_connector(self, client, assert_query_count, create_station, create_connector):
+        connector_id = create_connector.id
+        test_data = {
+            "name": "Test Connector Updated",
+            "priority": True,
+            "charging_station_id": str(create_station.id)
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        with assert_query_count(3):
+            response = client.put(f"/connectors/{connector_id}", json=test_data)
+
+        assert response.status_code == 200
+
+    def test_delete_connector(self, client, assert_query_count):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        connector_id = client.post("/connectors/", json={"name": "Test Connector", "priority": False}).json()["id"]
+
+        with assert_query_count(2):
+            response = client.delete(f"/connectors/{connector_id}")
+
+        assert response.status_code == 204
+
+    def test_create_user(self, client, assert_query_count):
+        test_data = {
+            "username": "Test User",
+            "password": "SuperSafePassword"
+        }
+
+        with assert_query_count(3):
+            response = client.post("/users/", json=test_data)
+
+        assert response.status_code == 201
+
+    def test_update_user(self, client, assert_query_count, create_user):
+        user_id, username = create_user.id, create_user.username
+        test_data = {
+            "username": "TestUser",
+            "password": "SuperSafePassword"
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(id=user_id, username=username)
+        with assert_query_count(3):
+            response = client.put(f"/users/{username}", json=test_data)
+
+        assert response.status_code == 200
+
+    def test_delete_user(self, client, assert_query_count, create_user):
+        user_id, username = create_user.id, create_user.username
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(id=user_id, username=username)
+        with assert_query_count(2):
+            response = client.delete(f"/users/{username}")
+
+        assert response.status_code == 204
+
+    def test_login_for_access_token(self, client, assert_query_count, db_session):
+        db_session.add(models.User(username="admin", hashed_password=get_password_hash("admin")))
+        db_session.commit()
+
+        with assert_query_count(1):
+            response = client.post("/token/", data={"username": "admin", "password": "admin"})
+
+        assert response.status_code == 200
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from fastapi import Response
+from sqlalchemy.orm import sessionmaker
+from ..utils.response_cache import ResponseCache, VersionStore, InMemoryVersionStore, DatabaseVersionStore
+
+
+def test_response_cache_hit_and_miss(db_session):
+    cache = ResponseCache(InMemoryVersionStore(), maxsize=8, ttl=60)
+    key = cache.key("connector", (1,), ("connectors",), db_session)
+
+    assert cache.get(key) is None
+    cache.set(key, Response(content=b"[]", media_type="application/json", headers={"X-Next-Cursor": "abc"}))
+    cached = cache.get(key)
+
+    assert cached.body == b"[]"
+    assert cached.headers["X-Next-Cursor"] == "abc"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_response_cache_invalidate(db_session):
+    cache = ResponseCache(InMemoryVersionStore(), maxsize=8, ttl=60)
+    connector_key = cache.key("connector", (1,), ("connectors",), db_session)
+    type_key = cache.key("charging_station_type", (1,), ("charging_station_types",), db_session)
+    cache.set(connector_key, Response(content=b"{}"))
+    cache.set(type_key, Response(content=b"{}"))
+
+    cache.invalidate("connectors")
+
+    assert cache.get(cache.key("connector", (1,), ("connectors",), db_session)) is None
+    assert cache.get(cache.key("charging_station_type", (1,), ("charging_station_types",), db_session)) is not None
+
+
+def test_database_version_store(db_session):
+    store = DatabaseVersionStore(sessionmaker(bind=db_session.get_bind()))
+
+    assert store.get(("connectors", "charging_stations"), db_session) == (0, 0)
+    store.bump(("connectors",))
+    store.bump(("connectors", "charging_stations"))
+
+    assert store.get(("connectors", "charging_stations"), db_session) == (2, 1)
+
+
+def test_database_version_store_reads_through_request_session(db_session, mocker):
+    session_factory = mocker.Mock(side_effect=AssertionError("Opened a second session."))
+    store = DatabaseVersionStore(session_factory)
+
+    assert store.get(("connectors",), db_session) == (0,)
+    session_factory.assert_not_called()
+
+
+def test_database_version_store_async(db_session, async_session_factory):
+    store = DatabaseVersionStore(sessionmaker(bind=db_session.get_bind()))
+    store.bump(("connectors",))
+
+    async def get():
+        async with async_session_factory() as db:
+            return await store.get_async(("connectors", "charging_stations"), db)
+
+    assert asyncio.run(get()) == (1, 0)
+
+
+def test_version_store_missing_method():
+    class IncompleteVersionStore(VersionStore):
+        def get(self, kinds, db):
+            return tuple(0 for _ in kinds)
+
+    with pytest.raises(TypeError):
+        IncompleteVersionStore()
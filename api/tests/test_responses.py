@@ -0,0 +1,28 @@
+import orjson
+from types import SimpleNamespace
+from uuid import uuid4
+from fastapi import Response
+from ..schemas import schemas
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..utils.responses import list_response
+
+
+def test_list_response_serializes_rows():
+    connector = SimpleNamespace(id=uuid4(), name="Test Connector", priority=True, charging_station_id=None)
+
+    response = list_response(schemas.ConnectorList, [connector], Response())
+
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == [
+        {"id": str(connector.id), "name": "Test Connector", "priority": True, "charging_station_id": None}
+    ]
+
+
+def test_list_response_keeps_headers():
+    endpoint_response = Response()
+    endpoint_response.headers[NEXT_CURSOR_HEADER] = "cursor"
+
+    response = list_response(schemas.ConnectorList, [], endpoint_response)
+
+    assert response.headers[NEXT_CURSOR_HEADER] == "cursor"
+    assert response.headers["content-length"] == "2"
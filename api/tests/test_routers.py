@@ -1,6 +1,11 @@
+import csv
+import io
+from fastapi import HTTPException
 from ..main import app
-from ..utils.auth import get_current_user
+from ..utils.auth import get_current_user, get_password_hash, create_access_token, principal_cache
+from ..utils.async_auth import get_current_user_async
 from ..schemas import schemas
+from ..models import models
 
 
 class TestChargingStationTypeRouter:
@@ -79,6 +84,64 @@ class TestChargingStationTypeRouter:
 
         assert response.status_code == 200
 
+    def test_update_charging_station_type_invalidates_cached_read(self, client, create_station_type):
+        test_data = {
+            "name": "Test Station Type Updated",
+            "plug_count": 2,
+            "efficiency": 80.1,
+            "current_type": "AC"
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        first_read = client.get(f"/charging_station_types/{create_station_type.id}")
+        cached_read = client.get(f"/charging_station_types/{create_station_type.id}")
+        client.put(f"/charging_station_types/{create_station_type.id}", json=test_data)
+        updated_read = client.get(f"/charging_station_types/{create_station_type.id}")
+
+        assert first_read.json() == cached_read.json()
+        assert updated_read.json()["name"] == "Test Station Type Updated"
+
+    def test_read_charging_station_type_not_modified(self, client, create_station_type):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        first_read = client.get(f"/charging_station_types/{create_station_type.id}")
+        response = client.get(
+            f"/charging_station_types/{create_station_type.id}",
+            headers={"If-None-Match": first_read.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == first_read.headers["etag"]
+        assert response.content == b""
+
+    def test_update_charging_station_type_changes_etag(self, client, create_station_type):
+        test_data = {
+            "name": "Test Station Type Updated",
+            "plug_count": 2,
+            "efficiency": 80.1,
+            "current_type": "AC"
+        }
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        first_read = client.get(f"/charging_station_types/{create_station_type.id}")
+        client.put(f"/charging_station_types/{create_station_type.id}", json=test_data)
+        response = client.get(
+            f"/charging_station_types/{create_station_type.id}",
+            headers={"If-None-Match": first_read.headers["etag"]}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != first_read.headers["etag"]
+        assert response.json()["name"] == "Test Station Type Updated"
+
     def test_update_charging_station_type_unauthorized(self, client, create_station_type):
         test_data = {
             "name": "Test Station Type Updated",
@@ -150,6 +213,137 @@ class TestChargingStationRouter:
         assert response.status_code == 401
         assert "Not authenticated" in response.json()["detail"]
 
+    def test_create_charging_station_bulk_success(self, client, create_station_type):
+        test_data = [
+            {
+                "name": "Test Station",
+                "ip_address": "192.168.1.2",
+                "firmware_version": "v1.2.4",
+                "type_id": f"urn:uuid:{create_station_type.id}",
+                "connectors": [
+                    {
+                        "name": "Test Connector",
+                        "priority": True
+                    }
+                ]
+            }
+        ]
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.post("/charging_stations/bulk", json=test_data)
+
+        assert response.status_code == 201
+        assert len(response.json()["created"]) == 1
+
+    def test_create_charging_station_bulk_unauthorized(self, client):
+        response = client.post("/charging_stations/bulk", json=[])
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
+    def test_export_charging_station_list_ndjson(self, client, create_station, create_connector):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.get("/charging_stations/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert len(response.text.splitlines()) == 1
+
+    def test_export_charging_station_list_csv(self, client, create_station, create_connector):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.get("/charging_stations/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert len(response.text.splitlines()) == 2
+
+    def test_import_charging_station_list_success(self, client, create_station_type):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        content = (
+            '{"name": "Imported Station", "ip_address": "10.0.0.1", "firmware_version": "1.0", '
+            f'"type_id": "{create_station_type.id}", '
+            '"connectors": [{"name": "Imported Connector", "priority": true}]}\n'
+        )
+        response = client.post("/charging_stations/import", files={"file": ("stations.ndjson", content)})
+
+        assert response.status_code == 200
+        assert response.headers["x-imported-count"] == "1"
+        assert response.headers["x-rejected-count"] == "0"
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.text.splitlines() == ["line,name,detail"]
+
+    def test_import_charging_station_list_rejects(self, client, create_station_type):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        content = (
+            '{"name": "Imported Station", "ip_address": "not an ip", "firmware_version": "1.0", '
+            f'"type_id": "{create_station_type.id}", '
+            '"connectors": [{"name": "Imported Connector", "priority": true}]}\n'
+        )
+        response = client.post("/charging_stations/import", files={"file": ("stations.ndjson", content)})
+
+        rejects = list(csv.DictReader(io.StringIO(response.text)))
+        assert response.status_code == 200
+        assert response.headers["x-imported-count"] == "0"
+        assert response.headers["x-rejected-count"] == "1"
+        assert rejects[0]["line"] == "1"
+        assert rejects[0]["name"] == "Imported Station"
+        assert "Invalid IP address format" in rejects[0]["detail"]
+
+    def test_import_charging_station_list_keeps_http_errors(self, client, mocker):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        mocker.patch(
+            "api.routers.charging_station_router.import_charging_stations",
+            side_effect=HTTPException(status_code=400, detail="Bad import.")
+        )
+        response = client.post("/charging_stations/import", files={"file": ("stations.ndjson", "")})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Bad import."
+
+    def test_import_charging_station_list_unexpected_error(self, client, mocker):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        mocker.patch(
+            "api.routers.charging_station_router.import_charging_stations",
+            side_effect=RuntimeError("Disk full.")
+        )
+        response = client.post("/charging_stations/import", files={"file": ("stations.ndjson", "")})
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "An unexpected error occurred."
+
+    def test_import_charging_station_list_unauthorized(self, client):
+        response = client.post("/charging_stations/import", files={"file": ("stations.ndjson", "")})
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
+    def test_export_charging_station_list_unauthorized(self, client):
+        response = client.get("/charging_stations/export")
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
     def test_read_charging_station_success(self, client, create_station, create_connector):
         app.dependency_overrides[get_current_user] = lambda: schemas.User(
             id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
@@ -230,6 +424,40 @@ class TestChargingStationRouter:
 
         assert response.status_code == 204
 
+    def test_read_charging_station_etag_changes_with_connectors(
+            self,
+            client,
+            create_station,
+            create_connector
+    ):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        first_read = client.get(f"/charging_stations/{create_station.id}")
+        client.put(
+            f"/connectors/{create_connector.id}",
+            json={"name": "Renamed Connector", "priority": True, "charging_station_id": str(create_station.id)}
+        )
+        response = client.get(
+            f"/charging_stations/{create_station.id}",
+            headers={"If-None-Match": first_read.headers["etag"]}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != first_read.headers["etag"]
+
+    def test_read_charging_station_list_not_modified(self, client, create_station, create_connector):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        first_read = client.get("/charging_stations/")
+        response = client.get("/charging_stations/", headers={"If-None-Match": first_read.headers["etag"]})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == first_read.headers["etag"]
+
     def test_delete_charging_station_unauthorized(self, client, create_station):
         response = client.delete(f"/charging_stations/{create_station.id}")
 
@@ -252,6 +480,29 @@ class TestConnectorRouter:
 
         assert response.status_code == 201
 
+    def test_upsert_connector_bulk_success(self, client):
+        test_data = [
+            {
+                "name": "Test Connector",
+                "priority": True
+            }
+        ]
+
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.post("/connectors/bulk", json=test_data)
+
+        assert response.status_code == 200
+        assert response.json()[0]["name"] == "Test Connector"
+
+    def test_upsert_connector_bulk_unauthorized(self, client):
+        response = client.post("/connectors/bulk", json=[])
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
     def test_create_connector_unauthorized(self, client):
         test_data = {
             "name": "Test Connector",
@@ -409,3 +660,183 @@ class TestUserRouter:
 
         assert response.status_code == 403
         assert "Cannot delete other user's credentials." in response.json()["detail"]
+
+
+class TestTokenRouter:
+    def test_login_for_access_token_success(self, client, db_session):
+        db_session.add(models.User(username="admin", hashed_password=get_password_hash("admin")))
+        db_session.commit()
+        response = client.post("/token/", data={"username": "admin", "password": "admin"})
+
+        assert response.status_code == 200
+        assert response.json()["token_type"] == "bearer"
+
+    def test_login_for_access_token_wrong_password(self, client, db_session):
+        db_session.add(models.User(username="admin", hashed_password=get_password_hash("admin")))
+        db_session.commit()
+        response = client.post("/token/", data={"username": "admin", "password": "wrong"})
+
+        assert response.status_code == 401
+        assert "Wrong password." in response.json()["detail"]
+
+
+class TestInternalRouter:
+    def test_read_password_hashing_stats_success(self, client):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.get("/internal/password_hashing")
+
+        assert response.status_code == 200
+        assert "queued" in response.json()
+
+    def test_read_password_hashing_stats_unauthorized(self, client):
+        response = client.get("/internal/password_hashing")
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
+    def test_read_database_pool_stats_success(self, client):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.get("/internal/database_pool")
+
+        assert response.status_code == 200
+        assert "checked_out" in response.json()["sync"]
+        assert "checkout_wait_seconds" in response.json()["sync"]
+
+    def test_read_database_pool_stats_unauthorized(self, client):
+        response = client.get("/internal/database_pool")
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
+    def test_read_cache_stats_success(self, client):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = client.get("/internal/caches")
+
+        assert response.status_code == 200
+        assert "hits" in response.json()["responses"]
+
+    def test_read_cache_stats_unauthorized(self, client):
+        response = client.get("/internal/caches")
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
+    def test_read_metrics_success(self, client, create_station_type):
+        app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        client.get(f"/charging_station_types/{create_station_type.id}")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'route="/charging_station_types/{charging_station_type_id}"' in response.text
+        assert "db_statement_duration_seconds_count" in response.text
+
+
+class TestAsyncReadRouter:
+    def test_read_charging_station_type_success(self, async_app, async_client, create_station_type):
+        async_app.dependency_overrides[get_current_user_async] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get(f"/charging_station_types/{create_station_type.id}")
+
+        assert response.status_code == 200
+        assert response.json()["name"] == create_station_type.name
+
+    def test_read_charging_station_type_list_success(self, async_app, async_client, create_station_type):
+        async_app.dependency_overrides[get_current_user_async] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get("/charging_station_types/")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_read_charging_station_success(self, async_app, async_client, create_station, create_connector):
+        async_app.dependency_overrides[get_current_user_async] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get(f"/charging_stations/{create_station.id}")
+
+        assert response.status_code == 200
+        assert response.json()["connectors"][0]["id"] == str(create_connector.id)
+
+    def test_read_charging_station_list_success(self, async_app, async_client, create_station, create_connector):
+        async_app.dependency_overrides[get_current_user_async] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get("/charging_stations/")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_read_connector_success(self, async_app, async_client, create_connector):
+        async_app.dependency_overrides[get_current_user_async] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get(f"/connectors/{create_connector.id}")
+
+        assert response.status_code == 200
+
+    def test_read_connector_list_success(self, async_app, async_client, create_connector):
+        async_app.dependency_overrides[get_current_user_async] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get("/connectors/")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_export_charging_station_list(self, async_app, async_client, create_station, create_connector):
+        async_app.dependency_overrides[get_current_user] = lambda: schemas.User(
+            id="ac1fdd79-5f47-4ec1-8ab4-ea8daf7a45d3",
+            username="new_user"
+        )
+        response = async_client.get("/charging_stations/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert len(response.text.splitlines()) == 1
+
+    def test_read_charging_station_unauthorized(self, async_client, create_station, create_connector):
+        response = async_client.get(f"/charging_stations/{create_station.id}")
+
+        assert response.status_code == 401
+        assert "Not authenticated" in response.json()["detail"]
+
+    def test_read_charging_station_with_token(self, async_client, create_user, create_station, create_connector):
+        principal_cache.clear()
+        token = create_access_token(data={"sub": create_user.username})
+        response = async_client.get(
+            f"/charging_stations/{create_station.id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        principal_cache.clear()
+
+    def test_read_charging_station_invalid_token(self, async_client, create_station, create_connector):
+        response = async_client.get(
+            f"/charging_stations/{create_station.id}",
+            headers={"Authorization": "Bearer invalid_token"}
+        )
+
+        assert response.status_code == 401
+        assert "Invalid token." in response.json()["detail"]
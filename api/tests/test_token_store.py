@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime, timezone, timedelta
+import pytest
+from sqlalchemy.orm import sessionmaker
+from ..utils.token_store import TokenStore, InMemoryTokenStore, DatabaseTokenStore
+
+
+def test_in_memory_token_store():
+    store = InMemoryTokenStore()
+    expiry = datetime.now(timezone.utc) + timedelta(minutes=5)
+    store.add("token", expiry)
+
+    assert store.get("token") == expiry
+    assert store.get("missing") is None
+
+
+def test_in_memory_token_store_clear_expired():
+    store = InMemoryTokenStore()
+    store.add("expired", datetime.now(timezone.utc) - timedelta(minutes=5))
+    store.add("valid", datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert store.clear_expired() == 1
+    assert store.get("expired") is None
+    assert store.get("valid") is not None
+
+
+def test_in_memory_token_store_clear_expired_keeps_readded_token():
+    store = InMemoryTokenStore()
+    store.add("token", datetime.now(timezone.utc) - timedelta(minutes=5))
+    store.add("token", datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert store.clear_expired() == 0
+    assert store.get("token") is not None
+
+
+def test_in_memory_token_store_max_tokens():
+    store = InMemoryTokenStore(max_tokens=2)
+    current_time = datetime.now(timezone.utc)
+    store.add("token1", current_time + timedelta(minutes=1))
+    store.add("token2", current_time + timedelta(minutes=2))
+    store.add("token3", current_time + timedelta(minutes=3))
+
+    assert store.get("token1") is None
+    assert store.get("token2") is not None
+    assert store.get("token3") is not None
+
+
+def test_database_token_store(db_session):
+    store = DatabaseTokenStore(sessionmaker(bind=db_session.get_bind()))
+    expiry = datetime.now(timezone.utc) + timedelta(minutes=5)
+    store.add("token", expiry)
+
+    assert store.get("token") == expiry
+    assert store.get("missing") is None
+
+
+def test_database_token_store_add_existing_token(db_session):
+    store = DatabaseTokenStore(sessionmaker(bind=db_session.get_bind()))
+    expiry = datetime.now(timezone.utc) + timedelta(minutes=5)
+    store.add("token", expiry)
+    store.add("token", expiry)
+
+    assert store.get("token") == expiry
+
+
+def test_database_token_store_async(db_session, async_session_factory):
+    store = DatabaseTokenStore(
+        sessionmaker(bind=db_session.get_bind()),
+        purge_interval=0,
+        async_session_factory=async_session_factory
+    )
+    expiry = datetime.now(timezone.utc) + timedelta(minutes=5)
+    store.add("expired", datetime.now(timezone.utc) - timedelta(minutes=5))
+    store.add("valid", expiry)
+
+    assert asyncio.run(store.clear_expired_async()) == 1
+    assert asyncio.run(store.get_async("valid")) == expiry
+    assert asyncio.run(store.get_async("expired")) is None
+
+
+def test_database_token_store_clear_expired(db_session):
+    store = DatabaseTokenStore(sessionmaker(bind=db_session.get_bind()), purge_interval=0)
+    store.add("expired", datetime.now(timezone.utc) - timedelta(minutes=5))
+    store.add("valid", datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert store.clear_expired() == 1
+    assert store.get("expired") is None
+    assert store.get("valid") is not None
+
+
+def test_token_store_missing_method():
+    class IncompleteTokenStore(TokenStore):
+        def add(self, token: str, expiry: datetime):
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteTokenStore()
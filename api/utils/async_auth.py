@@ -0,0 +1,61 @@
+import logging
+from datetime import datetime, timezone
+from typing import Annotated
+from jose import JWTError, jwt
+from fastapi import HTTPException, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models import models
+from ..schemas import schemas
+from ..database.async_database import get_async_db
+from .auth import token_store, principal_cache, oauth2_scheme, SECRET_KEY, ALGORITHM
+
+logger = logging.getLogger(__name__)
+
+
+async def get_user_async(db: AsyncSession, username: str):
+    return await db.scalar(select(models.User).filter(models.User.username == username))
+
+
+async def clear_expired_tokens_async():
+    removed = await token_store.clear_expired_async()
+    if removed:
+        logger.info("Cleared %s expired tokens.", removed)
+
+
+async def validate_token_async(token: Annotated[str, Depends(oauth2_scheme)]):
+    await clear_expired_tokens_async()
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        username: str = payload.get("sub")
+        if not username:
+            logger.warning("Token validation failed - no username found in token.")
+            raise HTTPException(status_code=401, detail="Invalid token.")
+        token_expiry = await token_store.get_async(token)
+        if not token_expiry or token_expiry < datetime.now(timezone.utc):
+            logger.warning("Token validation failed - token expired.")
+            raise HTTPException(status_code=401, detail="Expired token.")
+        logger.info("Token validated successfully for user '%s'.", username)
+        return username
+    except JWTError:
+        logger.error("Token validation failed - JWT Error.")
+        raise HTTPException(status_code=401, detail="Invalid token.")
+
+
+async def get_current_user_async(
+        db: AsyncSession = Depends(get_async_db),
+        token: str = Depends(oauth2_scheme)
+) -> schemas.User:
+    """Async counterpart of get_current_user, so authenticating async requests doesn't take a threadpool thread."""
+    username = await validate_token_async(token)
+    user = principal_cache.get(username)
+    if user is None:
+        db_user = await get_user_async(db, username)
+        if not db_user:
+            logger.error("User '%s' not found.", username)
+            raise HTTPException(status_code=404, detail=f"User '{username}' not found.")
+        user = schemas.User.model_validate(db_user)
+        principal_cache.set(username, user)
+    logger.info("Successfully retrieved user '%s' from the token.", username)
+    return user
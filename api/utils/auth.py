@@ -1,14 +1,18 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Annotated
+from typing import Annotated
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from ..models import models
 from ..schemas import schemas
 from ..database.database import get_db
+from .token_store import create_token_store
+from .cache import TTLCache
+from .hashing import password_hasher
 import os
 from dotenv import load_dotenv
 
@@ -19,8 +23,12 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = 2
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024"))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
 
-token_cache: Dict[str, datetime] = {}
+token_store = create_token_store()
+
+principal_cache = TTLCache(maxsize=PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -28,11 +36,19 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password, hashed_password):
+    return await password_hasher.run_async(pwd_context.verify, plain_password, hashed_password)
 
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return password_hasher.run(pwd_context.hash, password)
+
+
+async def get_password_hash_async(password):
+    return await password_hasher.run_async(pwd_context.hash, password)
 
 
 def get_user(db: Session, username: str):
@@ -40,7 +56,7 @@ def get_user(db: Session, username: str):
 
 
 def authenticate_user(db: Session, username: str, password: str):
-    logger.info(f"Authenticating user '{username}'.")
+    logger.info("Authenticating user '%s'.", username)
     user = get_user(db, username)
     if not user:
         logger.warning("Authentication failed - nonexistent user.")
@@ -48,7 +64,20 @@ def authenticate_user(db: Session, username: str, password: str):
     if not verify_password(password, user.hashed_password):
         logger.warning("Authentication failed - wrong user.")
         raise HTTPException(status_code=401, detail="Wrong password.")
-    logger.info(f"User '{username}' authenticated successfully.")
+    logger.info("User '%s' authenticated successfully.", username)
+    return user
+
+
+async def authenticate_user_async(db: Session, username: str, password: str):
+    logger.info("Authenticating user '%s'.", username)
+    user = await run_in_threadpool(get_user, db, username)
+    if not user:
+        logger.warning("Authentication failed - nonexistent user.")
+        raise HTTPException(status_code=404, detail="User not found.")
+    if not await verify_password_async(password, user.hashed_password):
+        logger.warning("Authentication failed - wrong user.")
+        raise HTTPException(status_code=401, detail="Wrong password.")
+    logger.info("User '%s' authenticated successfully.", username)
     return user
 
 
@@ -57,18 +86,15 @@ def create_access_token(data: dict):
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    token_cache[encoded_jwt] = expire
-    logger.info(f"Created a new token for user '{data.get('sub')}'.")
+    token_store.add(encoded_jwt, expire)
+    logger.info("Created a new token for user '%s'.", data.get("sub"))
     return encoded_jwt
 
 
 def clear_expired_tokens():
-    current_time = datetime.now(timezone.utc)
-    keys_to_remove = [key for key, expiry in token_cache.items() if expiry < current_time]
-    for key in keys_to_remove:
-        del token_cache[key]
-    if keys_to_remove:
-        logger.info(f"Cleared {len(keys_to_remove)} expired tokens.")
+    removed = token_store.clear_expired()
+    if removed:
+        logger.info("Cleared %s expired tokens.", removed)
 
 
 def validate_token(token: Annotated[str, Depends(oauth2_scheme)]):
@@ -80,22 +106,30 @@ def validate_token(token: Annotated[str, Depends(oauth2_scheme)]):
         if not username:
             logger.warning("Token validation failed - no username found in token.")
             raise HTTPException(status_code=401, detail="Invalid token.")
-        token_expiry = token_cache.get(token)
+        token_expiry = token_store.get(token)
         if not token_expiry or token_expiry < datetime.now(timezone.utc):
             logger.warning("Token validation failed - token expired.")
             raise HTTPException(status_code=401, detail="Expired token.")
-        logger.info(f"Token validated successfully for user '{username}'.")
+        logger.info("Token validated successfully for user '%s'.", username)
         return username
     except JWTError:
         logger.error("Token validation failed - JWT Error.")
         raise HTTPException(status_code=401, detail="Invalid token.")
 
 
+def invalidate_principal(username: str):
+    principal_cache.delete(username)
+
+
 def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> schemas.User:
     username = validate_token(token)
-    user = get_user(db, username)
-    if not user:
-        logger.error(f"User '{username}' not found.")
-        raise HTTPException(status_code=404, detail=f"User '{username}' not found.")
-    logger.info(f"Successfully retrieved user '{username}' from the token.")
+    user = principal_cache.get(username)
+    if user is None:
+        db_user = get_user(db, username)
+        if not db_user:
+            logger.error("User '%s' not found.", username)
+            raise HTTPException(status_code=404, detail=f"User '{username}' not found.")
+        user = schemas.User.model_validate(db_user)
+        principal_cache.set(username, user)
+    logger.info("Successfully retrieved user '%s' from the token.", username)
     return user
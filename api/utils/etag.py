@@ -0,0 +1,68 @@
+from sqlalchemy import Select, String, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from fastapi import Response
+from pydantic import UUID4
+import hashlib
+from ..models import models
+
+
+def _digest(expression, order_by):
+    return func.md5(func.coalesce(func.string_agg(expression, aggregate_order_by(literal(","), order_by)), ""))
+
+
+def charging_station_type_etag_statement(charging_station_type_id: UUID4) -> Select:
+    # The type's version is also bumped whenever a charging station joins or leaves it.
+    return select(models.ChargingStationType.version).filter(models.ChargingStationType.id == charging_station_type_id)
+
+
+def charging_station_etag_statement(charging_station_id: UUID4) -> Select:
+    return select(
+        models.ChargingStation.version,
+        models.ChargingStationType.version,
+        _digest(
+            cast(models.Connector.id, String) + ":" + cast(models.Connector.version, String),
+            models.Connector.id
+        )
+    )\
+        .join(models.ChargingStation.type)\
+        .outerjoin(models.ChargingStation.connectors)\
+        .filter(models.ChargingStation.id == charging_station_id)\
+        .group_by(models.ChargingStation.id, models.ChargingStationType.version)
+
+
+def connector_etag_statement(connector_id: UUID4) -> Select:
+    return select(models.Connector.version).filter(models.Connector.id == connector_id)
+
+
+def make_etag(*parts) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def body_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    if not if_none_match or etag is None:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def with_etag(response: Response, etag: str | None) -> Response:
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return response
+
+
+def conditional_response(response: Response, if_none_match: str | None) -> Response:
+    """Tags the response with a strong ETag of its body, or answers 304 if the client already has it."""
+    etag = response.headers.get("etag") or body_etag(response.body)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return response
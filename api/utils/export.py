@@ -0,0 +1,122 @@
+from sqlalchemy.orm import sessionmaker
+from typing import Iterable, Iterator
+import csv
+import enum
+import io
+import logging
+import os
+import orjson
+from dotenv import load_dotenv
+from ..crud import crud
+from ..models import models
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+CSV_COLUMNS = [
+    "id",
+    "name",
+    "device_id",
+    "ip_address",
+    "firmware_version",
+    "type_id",
+    "type_name",
+    "plug_count",
+    "current_type",
+    "connectors",
+    "priority_connector",
+]
+
+
+class ExportFormatEnum(str, enum.Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormatEnum.ndjson: "application/x-ndjson",
+    ExportFormatEnum.csv: "text/csv",
+}
+
+
+def charging_station_row(charging_station: models.ChargingStation) -> dict:
+    return {
+        "id": str(charging_station.id),
+        "name": charging_station.name,
+        "device_id": str(charging_station.device_id),
+        "ip_address": charging_station.ip_address,
+        "firmware_version": charging_station.firmware_version,
+        "type": {
+            "id": str(charging_station.type.id),
+            "name": charging_station.type.name,
+            "plug_count": charging_station.type.plug_count,
+            "efficiency": charging_station.type.efficiency,
+            "current_type": charging_station.type.current_type.value,
+        },
+        "connectors": [
+            {"id": str(connector.id), "name": connector.name, "priority": connector.priority}
+            for connector in charging_station.connectors
+        ],
+    }
+
+
+def _csv_values(charging_station: models.ChargingStation) -> list:
+    return [
+        charging_station.id,
+        charging_station.name,
+        charging_station.device_id,
+        charging_station.ip_address,
+        charging_station.firmware_version,
+        charging_station.type.id,
+        charging_station.type.name,
+        charging_station.type.plug_count,
+        charging_station.type.current_type.value,
+        ";".join(connector.name for connector in charging_station.connectors),
+        next((connector.name for connector in charging_station.connectors if connector.priority), ""),
+    ]
+
+
+def iter_ndjson(charging_stations: Iterable[models.ChargingStation], chunk_size: int) -> Iterator[bytes]:
+    chunk = []
+    for charging_station in charging_stations:
+        chunk.append(orjson.dumps(charging_station_row(charging_station), option=orjson.OPT_APPEND_NEWLINE))
+        if len(chunk) >= chunk_size:
+            yield b"".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield b"".join(chunk)
+
+
+def iter_csv(charging_stations: Iterable[models.ChargingStation], chunk_size: int) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    rows = 0
+    for charging_station in charging_stations:
+        writer.writerow(_csv_values(charging_station))
+        rows += 1
+        if rows % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_charging_stations(
+        session_factory: sessionmaker,
+        export_format: ExportFormatEnum,
+        batch_size: int = EXPORT_BATCH_SIZE
+):
+    """Yield the whole charging station inventory in export_format, one chunk per fetched batch.
+
+    The generator opens its own session because the response is streamed after the request's
+    dependencies have been closed.
+    """
+    serializer = iter_ndjson if export_format == ExportFormatEnum.ndjson else iter_csv
+    with session_factory() as db:
+        yield from serializer(crud.stream_charging_stations(db, batch_size), batch_size)
+    logger.info("Finished exporting charging stations as %s.", export_format.value)
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from fastapi import HTTPException
+import os
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+
+
+class PasswordHashExecutor:
+    """Runs bcrypt on its own bounded thread pool so it can't take over the shared request threadpool.
+
+    bcrypt releases the GIL, so the worker count is the number of cores hashing may use at once.
+    Calls beyond max_workers + max_queue are rejected with 503 instead of piling up.
+    """
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.max_pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, fn, *args) -> Future:
+        with self.lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                logger.warning("Password hashing queue is full - rejecting the request.")
+                raise HTTPException(status_code=503, detail="Too many password hashing requests. Try again later.")
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+        return self.executor.submit(self._call, fn, *args)
+
+    def run(self, fn, *args):
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": min(self.pending, self.max_workers),
+                "queued": max(self.pending - self.max_workers, 0),
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def _call(self, fn, *args):
+        # Accounted for on the worker thread, before the future resolves and wakes up the caller.
+        try:
+            return fn(*args)
+        finally:
+            with self.lock:
+                self.pending -= 1
+                self.completed += 1
+
+
+password_hasher = PasswordHashExecutor()
@@ -1,7 +1,10 @@
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from pydantic import UUID4
 from fastapi import HTTPException
-from typing import List
+from typing import List, Set, Tuple
+from ipaddress import ip_address
 import logging
 from ..schemas import schemas
 from ..models import models
@@ -9,15 +12,9 @@ from ..models import models
 logger = logging.getLogger(__name__)
 
 
-def check_priority_constraint_connector(db: Session, charging_station_id: UUID4):
-    priority_count = db.query(models.Connector).filter(
-        models.Connector.charging_station_id == charging_station_id,
-        models.Connector.priority.is_(True)
-    ).count()
-
-    logger.debug(f"Number of connectors with priority found: {priority_count}.")
-
-    if priority_count > 0:
+def check_priority_constraint_violation(error: IntegrityError):
+    constraint_name = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint_name == models.CONNECTOR_PRIORITY_INDEX:
         logger.error("Connector priority constraint violation.")
         raise HTTPException(
             status_code=400,
@@ -25,29 +22,25 @@ def check_priority_constraint_connector(db: Session, charging_station_id: UUID4)
         )
 
 
-def check_priority_constraint_connector_update(db: Session, charging_station_id: UUID4):
-    priority_count = db.query(models.Connector).filter(
-        models.Connector.charging_station_id == charging_station_id,
-        models.Connector.priority.is_(True)
-    ).count()
+def check_priority_constraint_station(connectors_data: List[schemas.ConnectorCreate]):
+    priority_count = sum(1 for connector in connectors_data if connector.priority)
 
-    logger.debug(f"Number of connectors with priority found: {priority_count}.")
+    logger.debug("Number of connectors with priority found: %s.", priority_count)
 
     if priority_count > 1:
         logger.error("Connector priority constraint violation.")
-        db.rollback()
         raise HTTPException(
             status_code=400,
-            detail="This charging station already has a connector with priority."
+            detail="Only one connector in each Charging Station can have priority."
         )
 
 
-def check_priority_constraint_station(connectors_data: List[schemas.ConnectorCreate]):
-    priority_count = sum(1 for connector in connectors_data if connector.priority)
-
-    logger.debug(f"Number of connectors with priority found: {priority_count}.")
-
-    if priority_count > 1:
+def check_priority_constraint_batch(connectors_data: List[schemas.ConnectorCreate]):
+    priority_station_ids = [
+        connector.charging_station_id for connector in connectors_data
+        if connector.priority and connector.charging_station_id is not None
+    ]
+    if len(priority_station_ids) != len(set(priority_station_ids)):
         logger.error("Connector priority constraint violation.")
         raise HTTPException(
             status_code=400,
@@ -55,60 +48,178 @@ def check_priority_constraint_station(connectors_data: List[schemas.ConnectorCre
         )
 
 
-def check_connector_count_connector(db: Session, charging_station_id: UUID4):
-    charging_station = db.query(models.ChargingStation)\
+def get_connector_count(db: Session, charging_station_id: UUID4):
+    return db.query(models.ChargingStation.connector_count, models.ChargingStationType.plug_count)\
+        .join(models.ChargingStation.type)\
         .filter(models.ChargingStation.id == charging_station_id)\
-        .join(models.ChargingStationType)\
         .one_or_none()
-    if not charging_station:
+
+
+def check_connector_count_connector(db: Session, charging_station_id: UUID4):
+    connector_count = get_connector_count(db, charging_station_id)
+    if not connector_count:
         logger.error("Charging station not found.")
         raise HTTPException(status_code=404, detail="ChargingStation not found.")
 
-    current_connector_count = len(charging_station.connectors)
-    logger.debug(f"Current number of connectors in the charging station: {current_connector_count}.")
-    if current_connector_count >= charging_station.type.plug_count:
+    current_connector_count, plug_count = connector_count
+    logger.debug("Current number of connectors in the charging station: %s.", current_connector_count)
+    if current_connector_count >= plug_count:
         logger.error("Connector count constraint violation.")
         raise HTTPException(
             status_code=400,
-            detail=f"The number of connectors cannot exceed {charging_station.type.plug_count} "
+            detail=f"The number of connectors cannot exceed {plug_count} "
                    f"in this Charging Station."
         )
 
 
 def check_connector_count_connector_update(db: Session, charging_station_id: UUID4):
-    charging_station = db.query(models.ChargingStation)\
-        .filter(models.ChargingStation.id == charging_station_id)\
-        .join(models.ChargingStationType)\
-        .one_or_none()
-    if not charging_station:
+    connector_count = get_connector_count(db, charging_station_id)
+    if not connector_count:
         logger.error("Charging station not found.")
         raise HTTPException(status_code=404, detail="ChargingStation not found.")
 
-    current_connector_count = len(charging_station.connectors)
-    logger.debug(f"Current number of connectors in the charging station: {current_connector_count}.")
-    if current_connector_count > charging_station.type.plug_count:
+    current_connector_count, plug_count = connector_count
+    logger.debug("Current number of connectors in the charging station: %s.", current_connector_count)
+    if current_connector_count > plug_count:
         logger.error("Connector count constraint violation.")
         db.rollback()
         raise HTTPException(
             status_code=400,
-            detail=f"The number of connectors cannot exceed {charging_station.type.plug_count} "
+            detail=f"The number of connectors cannot exceed {plug_count} "
                    f"in this Charging Station."
         )
 
 
+def check_charging_stations_exist(db: Session, charging_station_ids: Set[UUID4]):
+    found = {
+        charging_station_id for charging_station_id, in
+        db.query(models.ChargingStation.id).filter(models.ChargingStation.id.in_(charging_station_ids))
+    }
+    missing = charging_station_ids - found
+    if missing:
+        logger.error("Charging stations not found: %s.", missing)
+        raise HTTPException(status_code=404, detail="ChargingStation not found.")
+
+
+def check_connector_count_station_batch(db: Session, charging_station_ids: Set[UUID4]):
+    violation = db.query(models.ChargingStation.id, models.ChargingStationType.plug_count)\
+        .join(models.ChargingStation.type)\
+        .filter(models.ChargingStation.id.in_(charging_station_ids))\
+        .filter(models.ChargingStation.connector_count > models.ChargingStationType.plug_count)\
+        .first()
+    if violation:
+        logger.error("Connector count constraint violation.")
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"The number of connectors cannot exceed {violation.plug_count} "
+                   f"in Charging Station with id={violation.id}."
+        )
+
+
 def check_connector_count_station(db: Session, charging_station_data: schemas.ChargingStationCreate):
     charging_station_type = db.query(models.ChargingStationType).\
         filter(models.ChargingStationType.id == charging_station_data.type_id).\
         one_or_none()
-    if not charging_station_type:
+    check_connector_count_plug_count(
+        len(charging_station_data.connectors),
+        charging_station_type.plug_count if charging_station_type else None
+    )
+
+
+def check_connector_count_plug_count(connector_count: int, plug_count: int | None):
+    if plug_count is None:
         logger.error("Charging station not found.")
         raise HTTPException(status_code=404, detail="ChargingStationType not found.")
 
-    connector_count = len(charging_station_data.connectors)
-    logger.debug(f"Current number of connectors in the charging station: {connector_count}.")
-    if connector_count != charging_station_type.plug_count:
+    logger.debug("Current number of connectors in the charging station: %s.", connector_count)
+    if connector_count != plug_count:
         logger.error("Connector count constraint violation.")
         raise HTTPException(
             status_code=400,
-            detail=f"The number of connectors must equal {charging_station_type.plug_count} in this Charging Station."
+            detail=f"The number of connectors must equal {plug_count} in this Charging Station."
         )
+
+
+def check_connector_count_station_list(charging_stations: List[models.ChargingStation]):
+    for station in charging_stations:
+        if station.connector_count != station.type.plug_count:
+            logger.error("Connector count constraint violation.")
+            raise HTTPException(
+                status_code=400,
+                detail=f"Charging station with id={station.id} has {station.connector_count} "
+                       f"connectors instead of {station.type.plug_count}."
+            )
+
+
+def validate_charging_station_batch(
+        db: Session,
+        charging_stations_data: List[schemas.ChargingStationCreate]
+) -> Tuple[List[Tuple[int, schemas.ChargingStationCreate]], List[dict]]:
+    type_ids = {charging_station_data.type_id for charging_station_data in charging_stations_data}
+    plug_counts = dict(
+        db.query(models.ChargingStationType.id, models.ChargingStationType.plug_count)
+        .filter(models.ChargingStationType.id.in_(type_ids))
+        .all()
+    )
+
+    names = {charging_station_data.name for charging_station_data in charging_stations_data}
+    device_ids = {charging_station_data.device_id for charging_station_data in charging_stations_data}
+    ip_addresses = {charging_station_data.ip_address for charging_station_data in charging_stations_data}
+    connector_names = {
+        connector.name
+        for charging_station_data in charging_stations_data
+        for connector in charging_station_data.connectors
+    }
+
+    taken_names, taken_device_ids, taken_ip_addresses = set(), set(), set()
+    for name, device_id, address in db.query(
+            models.ChargingStation.name,
+            models.ChargingStation.device_id,
+            models.ChargingStation.ip_address
+    ).filter(or_(
+        models.ChargingStation.name.in_(names),
+        models.ChargingStation.device_id.in_(device_ids),
+        models.ChargingStation.ip_address.in_(ip_addresses)
+    )):
+        taken_names.add(name)
+        taken_device_ids.add(device_id)
+        taken_ip_addresses.add(str(ip_address(address)))
+    taken_connector_names = {
+        name for name, in db.query(models.Connector.name).filter(models.Connector.name.in_(connector_names))
+    }
+
+    valid, errors = [], []
+    for index, charging_station_data in enumerate(charging_stations_data):
+        address = str(ip_address(charging_station_data.ip_address))
+        station_connector_names = [connector.name for connector in charging_station_data.connectors]
+        try:
+            check_connector_count_plug_count(
+                len(charging_station_data.connectors),
+                plug_counts.get(charging_station_data.type_id)
+            )
+            check_priority_constraint_station(charging_station_data.connectors)
+        except HTTPException as e:
+            detail = e.detail
+        else:
+            if charging_station_data.name in taken_names:
+                detail = f"Charging station name {charging_station_data.name} is already taken."
+            elif charging_station_data.device_id in taken_device_ids:
+                detail = f"Charging station device_id {charging_station_data.device_id} is already taken."
+            elif address in taken_ip_addresses:
+                detail = f"Charging station ip_address {charging_station_data.ip_address} is already taken."
+            elif len(set(station_connector_names)) != len(station_connector_names) \
+                    or taken_connector_names.intersection(station_connector_names):
+                detail = "Connector names must be unique."
+            else:
+                taken_names.add(charging_station_data.name)
+                taken_device_ids.add(charging_station_data.device_id)
+                taken_ip_addresses.add(address)
+                taken_connector_names.update(station_connector_names)
+                valid.append((index, charging_station_data))
+                continue
+
+        logger.error("Charging station at index %s of the batch is invalid: %s", index, detail)
+        errors.append({"index": index, "detail": detail})
+
+    return valid, errors
@@ -0,0 +1,296 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from pydantic import ValidationError
+from typing import BinaryIO, Iterator, TextIO, Tuple
+import csv
+import io
+import logging
+import os
+import uuid
+import orjson
+from dotenv import load_dotenv
+from ..models import models
+from ..schemas import schemas
+from .export import ExportFormatEnum
+from .helpers import check_priority_constraint_station, check_connector_count_plug_count
+from .response_cache import response_cache, CHARGING_STATIONS, CONNECTORS
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "50000"))
+
+REJECT_COLUMNS = ["line", "name", "detail"]
+REJECTS_CHUNK_SIZE = 64 * 1024
+IMPORTED_COUNT_HEADER = "X-Imported-Count"
+REJECTED_COUNT_HEADER = "X-Rejected-Count"
+
+STAGING_TABLES = [
+    """
+    CREATE TEMPORARY TABLE import_charging_stations (
+        line_no integer PRIMARY KEY,
+        id uuid NOT NULL,
+        name varchar NOT NULL,
+        device_id uuid NOT NULL,
+        ip_address inet NOT NULL,
+        firmware_version varchar NOT NULL,
+        type_id uuid NOT NULL,
+        connector_count integer NOT NULL,
+        reject_reason varchar
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMPORARY TABLE import_connectors (
+        id uuid NOT NULL,
+        name varchar NOT NULL,
+        priority boolean NOT NULL,
+        charging_station_id uuid NOT NULL
+    ) ON COMMIT DROP
+    """,
+]
+
+STAGING_INDEXES = [
+    "CREATE INDEX ON import_charging_stations (id)",
+    "CREATE INDEX ON import_charging_stations (name)",
+    "CREATE INDEX ON import_charging_stations (device_id)",
+    "CREATE INDEX ON import_charging_stations (ip_address)",
+    "CREATE INDEX ON import_connectors (name)",
+    "CREATE INDEX ON import_connectors (charging_station_id)",
+    "ANALYZE import_charging_stations",
+    "ANALYZE import_connectors",
+]
+
+COPY_CHARGING_STATIONS = """
+    COPY import_charging_stations (line_no, id, name, device_id, ip_address, firmware_version, type_id, connector_count)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+COPY_CONNECTORS = """
+    COPY import_connectors (id, name, priority, charging_station_id)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+UNIQUE_COLUMNS = ["name", "device_id", "ip_address"]
+
+# The rules below run in order and only look at rows that are not rejected yet, so each row keeps the first reason.
+TAKEN_IN_DATABASE = """
+    UPDATE import_charging_stations s
+    SET reject_reason = 'Charging station {column} ' || s.{column} || ' is already taken.'
+    WHERE s.reject_reason IS NULL
+      AND EXISTS (SELECT 1 FROM charging_stations c WHERE c.{column} = s.{column})
+"""
+
+TAKEN_IN_FILE = """
+    UPDATE import_charging_stations s
+    SET reject_reason = 'Charging station {column} ' || s.{column} || ' is already taken.'
+    FROM (
+        SELECT line_no, row_number() OVER (PARTITION BY {column} ORDER BY line_no) AS rank
+        FROM import_charging_stations
+        WHERE reject_reason IS NULL
+    ) duplicates
+    WHERE duplicates.line_no = s.line_no AND duplicates.rank > 1
+"""
+
+CONNECTOR_NAME_TAKEN_IN_DATABASE = """
+    UPDATE import_charging_stations s
+    SET reject_reason = 'Connector names must be unique.'
+    WHERE s.reject_reason IS NULL
+      AND EXISTS (
+        SELECT 1 FROM import_connectors ic
+        JOIN connectors c ON c.name = ic.name
+        WHERE ic.charging_station_id = s.id
+      )
+"""
+
+CONNECTOR_NAME_TAKEN_IN_FILE = """
+    UPDATE import_charging_stations s
+    SET reject_reason = 'Connector names must be unique.'
+    FROM (
+        SELECT ic.charging_station_id, row_number() OVER (PARTITION BY ic.name ORDER BY st.line_no) AS rank
+        FROM import_connectors ic
+        JOIN import_charging_stations st ON st.id = ic.charging_station_id
+        WHERE st.reject_reason IS NULL
+    ) duplicates
+    WHERE duplicates.charging_station_id = s.id AND duplicates.rank > 1 AND s.reject_reason IS NULL
+"""
+
+MERGE_CHARGING_STATIONS = """
+    INSERT INTO charging_stations (id, name, device_id, ip_address, firmware_version, type_id, connector_count)
+    SELECT id, name, device_id, ip_address, firmware_version, type_id, connector_count
+    FROM import_charging_stations
+    WHERE reject_reason IS NULL
+"""
+
+MERGE_CONNECTORS = """
+    INSERT INTO connectors (id, name, priority, charging_station_id)
+    SELECT ic.id, ic.name, ic.priority, ic.charging_station_id
+    FROM import_connectors ic
+    JOIN import_charging_stations s ON s.id = ic.charging_station_id
+    WHERE s.reject_reason IS NULL
+"""
+
+BUMP_CHARGING_STATION_TYPE_VERSIONS = """
+    UPDATE charging_station_types SET version = version + 1
+    WHERE id IN (SELECT type_id FROM import_charging_stations WHERE reject_reason IS NULL)
+"""
+
+SELECT_REJECTS = """
+    SELECT line_no, name, reject_reason
+    FROM import_charging_stations
+    WHERE reject_reason IS NOT NULL
+    ORDER BY line_no
+"""
+
+
+def _read_ndjson(source: BinaryIO) -> Iterator[Tuple[int, dict]]:
+    for line_no, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield line_no, None
+            continue
+        if isinstance(record, dict) and "type_id" not in record and isinstance(record.get("type"), dict):
+            record["type_id"] = record["type"].get("id")
+        yield line_no, record
+
+
+def _read_csv(source: BinaryIO) -> Iterator[Tuple[int, dict]]:
+    reader = csv.DictReader(io.TextIOWrapper(source, encoding="utf-8", newline=""))
+    for row in reader:
+        connector_names = [name for name in (row.get("connectors") or "").split(";") if name]
+        priority_connector = row.get("priority_connector")
+        yield reader.line_num, {
+            "name": row.get("name"),
+            "device_id": row.get("device_id") or None,
+            "ip_address": row.get("ip_address"),
+            "firmware_version": row.get("firmware_version"),
+            "type_id": row.get("type_id"),
+            "connectors": [{"name": name, "priority": name == priority_connector} for name in connector_names],
+        }
+
+
+def _validate_record(record: dict | None, plug_counts: dict) -> schemas.ChargingStationCreate:
+    if record is None:
+        raise ValueError("Malformed record.")
+    try:
+        charging_station_data = schemas.ChargingStationCreate.model_validate(record)
+    except ValidationError as e:
+        raise ValueError("; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()))
+    try:
+        check_priority_constraint_station(charging_station_data.connectors)
+        check_connector_count_plug_count(
+            len(charging_station_data.connectors),
+            plug_counts.get(charging_station_data.type_id)
+        )
+    except HTTPException as e:
+        raise ValueError(e.detail)
+    if charging_station_data.device_id is None:
+        charging_station_data.device_id = uuid.uuid4()
+    return charging_station_data
+
+
+def _copy(cursor, statement: str, rows: list):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(statement, buffer)
+
+
+def import_charging_stations(
+        db: Session,
+        source: BinaryIO,
+        import_format: ExportFormatEnum,
+        rejects_file: TextIO,
+        batch_size: int = IMPORT_BATCH_SIZE
+) -> dict:
+    """Load charging stations from an NDJSON or CSV stream and merge the valid ones in a single transaction.
+
+    Records are validated against the schema, the priority rule and the type's plug count while they are
+    read, then copied into temporary staging tables in batches. Uniqueness of names, device ids, IP addresses
+    and connector names is checked set-wise in the staging tables. Every rejected record is written to
+    rejects_file with its line number and reason.
+    """
+    rejects = csv.writer(rejects_file)
+    rejects.writerow(REJECT_COLUMNS)
+    rejected = 0
+
+    records = _read_ndjson(source) if import_format == ExportFormatEnum.ndjson else _read_csv(source)
+
+    try:
+        plug_counts = dict(db.query(models.ChargingStationType.id, models.ChargingStationType.plug_count).all())
+        for statement in STAGING_TABLES:
+            db.execute(text(statement))
+        cursor = db.connection().connection.cursor()
+
+        charging_station_rows, connector_rows = [], []
+        for line_no, record in records:
+            try:
+                charging_station_data = _validate_record(record, plug_counts)
+            except ValueError as e:
+                rejected += 1
+                rejects.writerow([line_no, record.get("name", "") if isinstance(record, dict) else "", str(e)])
+                continue
+
+            charging_station_id = uuid.uuid4()
+            charging_station_rows.append([
+                line_no,
+                charging_station_id,
+                charging_station_data.name,
+                charging_station_data.device_id,
+                charging_station_data.ip_address,
+                charging_station_data.firmware_version,
+                charging_station_data.type_id,
+                len(charging_station_data.connectors),
+            ])
+            connector_rows.extend(
+                [uuid.uuid4(), connector_data.name, connector_data.priority, charging_station_id]
+                for connector_data in charging_station_data.connectors
+            )
+            if len(charging_station_rows) >= batch_size:
+                _copy(cursor, COPY_CHARGING_STATIONS, charging_station_rows)
+                _copy(cursor, COPY_CONNECTORS, connector_rows)
+                charging_station_rows.clear()
+                connector_rows.clear()
+        if charging_station_rows:
+            _copy(cursor, COPY_CHARGING_STATIONS, charging_station_rows)
+            _copy(cursor, COPY_CONNECTORS, connector_rows)
+        logger.info("Staged the import file, %s records rejected during parsing.", rejected)
+
+        for statement in STAGING_INDEXES:
+            db.execute(text(statement))
+        for column in UNIQUE_COLUMNS:
+            db.execute(text(TAKEN_IN_DATABASE.format(column=column)))
+            db.execute(text(TAKEN_IN_FILE.format(column=column)))
+        db.execute(text(CONNECTOR_NAME_TAKEN_IN_DATABASE))
+        db.execute(text(CONNECTOR_NAME_TAKEN_IN_FILE))
+
+        for row in db.execute(text(SELECT_REJECTS), execution_options={"yield_per": batch_size}):
+            rejected += 1
+            rejects.writerow(row)
+
+        imported = db.execute(text(MERGE_CHARGING_STATIONS)).rowcount
+        db.execute(text(MERGE_CONNECTORS))
+        db.execute(text(BUMP_CHARGING_STATION_TYPE_VERSIONS))
+        db.commit()
+        response_cache.invalidate(CHARGING_STATIONS, CONNECTORS)
+    except Exception:
+        logger.error("An error occurred while importing charging stations.", exc_info=True)
+        db.rollback()
+        raise
+
+    logger.info("Imported %s charging stations, rejected %s.", imported, rejected)
+    return {"imported": imported, "rejected": rejected}
+
+
+def stream_rejects(rejects_file: TextIO) -> Iterator[str]:
+    """Yield the rejects written by import_charging_stations in chunks, closing the file once it is read."""
+    try:
+        rejects_file.seek(0)
+        while chunk := rejects_file.read(REJECTS_CHUNK_SIZE):
+            yield chunk
+    finally:
+        rejects_file.close()
@@ -1,9 +1,115 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+import orjson
+from dotenv import load_dotenv
 
+load_dotenv()
 
-def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format='[%(asctime)s [%(levelname)s] [%(name)s]]: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_MODE = os.getenv("LOG_MODE", "sync")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_INFO_SAMPLE_RATE = float(os.getenv("LOG_INFO_SAMPLE_RATE", "1"))
+
+TEXT_FORMAT = '[%(asctime)s [%(levelname)s] [%(name)s]]: %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in every 1 / rate INFO and DEBUG records of each logging function. Warnings and errors always pass.
+
+    Records are counted per logger and function, so a chatty route is thinned out without hiding the quiet ones.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.interval = max(1, round(1 / rate)) if rate > 0 else 0
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        if not self.interval:
+            return False
+        key = (record.name, record.funcName)
+        with self.lock:
+            count = self.counters.get(key, 0)
+            self.counters[key] = count + 1
+        return count % self.interval == 0
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records as they are, so the message is formatted on the listener thread instead of the caller's.
+
+    Logging arguments must therefore not be mutated after the logging call, which holds for the request data
+    and ids logged by the API.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def create_formatter(log_format: str = LOG_FORMAT) -> logging.Formatter:
+    if log_format == "json":
+        return JsonFormatter()
+    if log_format == "text":
+        return logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+    raise RuntimeError(f"Unknown log format: {log_format}")
+
+
+def stop_logging():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def setup_logging(log_mode: str = LOG_MODE, log_format: str = LOG_FORMAT, sample_rate: float = LOG_INFO_SAMPLE_RATE):
+    """Configures the root logger.
+
+    In sync mode records are formatted and written on the calling thread. In queue mode the calling thread only
+    puts the record on a queue and a listener thread formats and writes it, so slow output doesn't add to request
+    latency.
+    """
+    global _listener
+    stop_logging()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(create_formatter(log_format))
+
+    if log_mode == "queue":
+        handler = LazyQueueHandler(queue.SimpleQueue())
+        _listener = logging.handlers.QueueListener(handler.queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+    elif log_mode == "sync":
+        handler = stream_handler
+    else:
+        raise RuntimeError(f"Unknown log mode: {log_mode}")
+
+    if sample_rate < 1:
+        handler.addFilter(SamplingFilter(sample_rate))
+
+    logging.basicConfig(level=LOG_LEVEL, handlers=[handler], force=True)
@@ -0,0 +1,162 @@
+import atexit
+import contextvars
+import os
+import time
+import anyio.to_thread
+from prometheus_client import (CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, CONTENT_TYPE_LATEST,
+                               generate_latest, multiprocess)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# prometheus_client switches every metric to files in this directory when it is set, so that the /metrics endpoint
+# of any worker can aggregate the values of all of them.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+NO_ROUTE = "unmatched"
+NO_REQUEST = "background"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Handled HTTP requests.",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests.",
+    ["method", "route"]
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing SQL statements, by the route that executed them.",
+    ["route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool.",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections opened above the pool size.",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection to be returned to the pool, excluding connection setup.",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Pool checkouts that timed out.",
+    ["pool"]
+)
+THREADPOOL_IN_USE = Gauge(
+    "threadpool_threads_in_use",
+    "Worker threads running synchronous endpoints and dependencies.",
+    multiprocess_mode="livesum"
+)
+THREADPOOL_SIZE = Gauge(
+    "threadpool_threads",
+    "Size of the worker thread pool.",
+    multiprocess_mode="livesum"
+)
+
+_request_scope = contextvars.ContextVar("request_scope", default=None)
+
+if MULTIPROCESS:
+    atexit.register(multiprocess.mark_process_dead, os.getpid())
+
+
+def route_label(scope: dict) -> str:
+    route = scope.get("route")
+    return route.path if route is not None else NO_ROUTE
+
+
+def current_route() -> str:
+    scope = _request_scope.get()
+    return route_label(scope) if scope is not None else NO_REQUEST
+
+
+def observe_threadpool():
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    THREADPOOL_IN_USE.set(limiter.borrowed_tokens)
+    THREADPOOL_SIZE.set(limiter.total_tokens)
+
+
+class MetricsMiddleware:
+    """Records the count, status and duration of every HTTP request by method and route template.
+
+    The request scope is kept in a context variable, so database statements executed while handling the request,
+    including the ones run in the threadpool, are attributed to its route.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = _request_scope.set(scope)
+        observe_threadpool()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = route_label(scope)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(scope["method"], route, str(status)).inc()
+            observe_threadpool()
+            _request_scope.reset(token)
+
+
+def instrument_engine(engine: Engine, pool_name: str, pool_metrics):
+    """Times the statements and tracks the pool usage of a (synchronous, or an async engine's sync_engine) engine."""
+
+    # The start time is kept on the execution context, not on the pooled connection, because a statement that
+    # fails never reaches after_cursor_execute and would leave its start time behind for the next statements.
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        context._metrics_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        DB_STATEMENT_DURATION.labels(current_route()).observe(time.perf_counter() - context._metrics_start)
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKED_OUT.labels(pool_name).inc()
+        DB_POOL_OVERFLOW.labels(pool_name).set(max(engine.pool.overflow(), 0))
+
+    @event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.labels(pool_name).dec()
+        DB_POOL_OVERFLOW.labels(pool_name).set(max(engine.pool.overflow(), 0))
+
+    pool_metrics.observers.append(DB_POOL_CHECKOUT_WAIT.labels(pool_name).observe)
+    pool_metrics.timeout_observers.append(DB_POOL_TIMEOUTS.labels(pool_name).inc)
+
+
+def metrics_registry() -> CollectorRegistry:
+    if not MULTIPROCESS:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
@@ -0,0 +1,38 @@
+from sqlalchemy import Select
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from fastapi import HTTPException, Response
+from typing import List
+from uuid import UUID
+import base64
+import binascii
+import logging
+
+logger = logging.getLogger(__name__)
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: UUID) -> str:
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> UUID:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        return UUID(base64.urlsafe_b64decode(cursor + padding).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        logger.error("Invalid pagination cursor: %s.", cursor)
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def apply_keyset(query: Query | Select, id_column: InstrumentedAttribute, cursor: str) -> Query | Select:
+    query = query.order_by(id_column)
+    if cursor:
+        query = query.filter(id_column > decode_cursor(cursor))
+    return query
+
+
+def set_next_cursor(response: Response, result: List, limit: int | None):
+    if limit and len(result) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(result[-1].id)
@@ -0,0 +1,119 @@
+import contextvars
+import logging
+import os
+from typing import List
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from dotenv import load_dotenv
+from .metrics import route_label
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Maximum number of SQL statements a single request may execute, 0 disables the check.
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", "0"))
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "log")
+QUERY_COUNT_HEADER = os.getenv("QUERY_COUNT_HEADER", "false").lower() == "true"
+
+QUERY_COUNT_HEADER_NAME = b"x-query-count"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class RequestQueries:
+    __slots__ = ("count", "scope")
+
+    def __init__(self, scope: dict):
+        self.count = 0
+        self.scope = scope
+
+
+_request_queries = contextvars.ContextVar("request_queries", default=None)
+
+
+def count_request_queries(engine: Engine, budget: int = QUERY_BUDGET, mode: str = QUERY_BUDGET_MODE):
+    """Counts the statements executed by the engine against the request that is being handled.
+
+    In raise mode the statement that goes over the budget fails with QueryBudgetExceeded, so query fan-out such as
+    lazy loads in a loop breaks the request instead of slowing it down.
+    """
+    if mode not in ("log", "raise"):
+        raise RuntimeError(f"Unknown query budget mode: {mode}")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        queries = _request_queries.get()
+        if queries is None:
+            return
+        queries.count += 1
+        if mode == "raise" and budget and queries.count > budget:
+            logger.error(
+                "Route %s went over the budget of %s queries: %s",
+                route_label(queries.scope), budget, statement
+            )
+            raise QueryBudgetExceeded(f"Route {route_label(queries.scope)} went over the budget of {budget} queries.")
+
+
+class QueryCounterMiddleware:
+    """Starts a query count for every HTTP request and logs the requests that went over the budget.
+
+    With QUERY_COUNT_HEADER enabled the count is also returned in the X-Query-Count header. Statements executed
+    after the response has started, like streamed exports, are only included in the log.
+    """
+
+    def __init__(self, app, budget: int = QUERY_BUDGET, header: bool = QUERY_COUNT_HEADER):
+        self.app = app
+        self.budget = budget
+        self.header = header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries(scope)
+
+        async def send_with_count(message):
+            if self.header and message["type"] == "http.response.start":
+                header = (QUERY_COUNT_HEADER_NAME, str(queries.count).encode())
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        token = _request_queries.set(queries)
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _request_queries.reset(token)
+            if self.budget and queries.count > self.budget:
+                logger.warning(
+                    "Route %s %s executed %s queries, over the budget of %s.",
+                    scope["method"], route_label(scope), queries.count, self.budget
+                )
+
+
+class QueryCounter:
+    """Context manager that records every statement the engine executes inside the block, from any thread.
+
+    Meant for tests and benchmarks that run one request or call at a time.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, connection, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
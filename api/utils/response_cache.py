@@ -0,0 +1,159 @@
+"""Cache of serialized read responses, invalidated through per-kind version counters.
+
+Versions are kept per entity kind, not per row. A write to any connector, charging station or type bumps the
+version of the kinds it touches and so drops every cached response that depends on them, including pages and
+rows the write didn't change. That is coarse, but a write costs a single counter update and no dependency can
+be missed, since a charging station response embeds its type and connectors and a type response lists its
+stations. Under a steady stream of writes the hit rate drops accordingly. The versions are read through the
+session the request already holds, so with RESPONSE_CACHE=database a hit adds one small query on that
+connection, not a second pool checkout.
+"""
+from abc import ABC, abstractmethod
+import logging
+import threading
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+from fastapi import Response
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from ..models import models
+from ..database.database import SessionLocal
+from .cache import TTLCache
+import os
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+RESPONSE_CACHE = os.getenv("RESPONSE_CACHE", "memory")
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "4096"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+
+CHARGING_STATION_TYPES = "charging_station_types"
+CHARGING_STATIONS = "charging_stations"
+CONNECTORS = "connectors"
+
+# Entity kinds whose writes change the responses of each group of read endpoints.
+CHARGING_STATION_TYPE_READS = (CHARGING_STATION_TYPES, CHARGING_STATIONS)
+CHARGING_STATION_READS = (CHARGING_STATIONS, CHARGING_STATION_TYPES, CONNECTORS)
+CONNECTOR_READS = (CONNECTORS,)
+
+
+class VersionStore(ABC):
+    @abstractmethod
+    def get(self, kinds: Sequence[str], db: Session) -> Tuple[int, ...]:
+        pass
+
+    async def get_async(self, kinds: Sequence[str], db: AsyncSession) -> Tuple[int, ...]:
+        return await db.run_sync(lambda session: self.get(kinds, session))
+
+    @abstractmethod
+    def bump(self, kinds: Sequence[str]):
+        pass
+
+
+class InMemoryVersionStore(VersionStore):
+    def __init__(self):
+        self.versions: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def get(self, kinds: Sequence[str], db: Session) -> Tuple[int, ...]:
+        with self.lock:
+            return tuple(self.versions.get(kind, 0) for kind in kinds)
+
+    async def get_async(self, kinds: Sequence[str], db: AsyncSession) -> Tuple[int, ...]:
+        return self.get(kinds, db)
+
+    def bump(self, kinds: Sequence[str]):
+        with self.lock:
+            for kind in kinds:
+                self.versions[kind] = self.versions.get(kind, 0) + 1
+
+
+class DatabaseVersionStore(VersionStore):
+    """Keeps the version counters in the cache_versions table so that every worker sees the same versions.
+
+    Versions are read through the request's session, bumps are committed in their own session.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def get(self, kinds: Sequence[str], db: Session) -> Tuple[int, ...]:
+        versions = dict(
+            db.query(models.CacheVersion.kind, models.CacheVersion.version)
+            .filter(models.CacheVersion.kind.in_(kinds))
+            .all()
+        )
+        return tuple(versions.get(kind, 0) for kind in kinds)
+
+    def bump(self, kinds: Sequence[str]):
+        statement = pg_insert(models.CacheVersion).values([{"kind": kind, "version": 1} for kind in kinds])
+        statement = statement.on_conflict_do_update(
+            index_elements=[models.CacheVersion.kind],
+            set_={"version": models.CacheVersion.version + 1}
+        )
+        with self.session_factory() as db:
+            db.execute(statement)
+            db.commit()
+
+
+class ResponseCache:
+    """Caches serialized read responses under keys that include the versions of the entity kinds they depend on.
+
+    Writes bump the versions of the kinds they touch, so stale entries are never looked up again and age out
+    through the TTL and LRU bounds of the underlying TTLCache.
+    """
+
+    def __init__(self, version_store: VersionStore, maxsize: int, ttl: float):
+        self.version_store = version_store
+        self.entries = TTLCache(maxsize, ttl)
+
+    def key(self, name: str, params: tuple, kinds: Sequence[str], db: Session) -> Hashable:
+        return name, params, self.version_store.get(kinds, db)
+
+    async def key_async(self, name: str, params: tuple, kinds: Sequence[str], db: AsyncSession) -> Hashable:
+        return name, params, await self.version_store.get_async(kinds, db)
+
+    def get(self, key: Hashable) -> Optional[Response]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        content, headers = entry
+        return Response(content=content, media_type="application/json", headers=headers)
+
+    def set(self, key: Hashable, response: Response) -> Response:
+        headers = {
+            header: value for header, value in response.headers.items()
+            if header not in ("content-length", "content-type")
+        }
+        self.entries.set(key, (response.body, headers))
+        return response
+
+    def invalidate(self, *kinds: str):
+        try:
+            self.version_store.bump(kinds)
+        except Exception:
+            logger.error("Failed to invalidate cached responses for %s.", kinds, exc_info=True)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {"backend": RESPONSE_CACHE, **self.entries.stats()}
+
+
+def create_response_cache() -> ResponseCache:
+    if RESPONSE_CACHE == "database":
+        logger.info("Using the database response cache version store.")
+        version_store = DatabaseVersionStore(SessionLocal)
+    elif RESPONSE_CACHE == "memory":
+        logger.info("Using the in-memory response cache version store.")
+        version_store = InMemoryVersionStore()
+    else:
+        raise RuntimeError(f"Unknown response cache: {RESPONSE_CACHE}")
+    return ResponseCache(version_store, RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = create_response_cache()
@@ -0,0 +1,21 @@
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, List, Type
+
+
+def list_response(adapter: TypeAdapter, items: List, response: Response) -> Response:
+    """Validate ORM rows once and dump them straight to JSON bytes.
+
+    Skips FastAPI's response_model pass, which validates the rows and then encodes the result a second time.
+    Headers already set on the endpoint's Response parameter (e.g. the next cursor) are carried over.
+    """
+    content = adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def model_response(model: Type[BaseModel], item: Any) -> Response:
+    return Response(
+        content=model.model_validate(item, from_attributes=True).model_dump_json(),
+        media_type="application/json"
+    )
@@ -0,0 +1,182 @@
+from abc import ABC, abstractmethod
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from ..models import models
+from ..database.database import SessionLocal, DATABASE_MODE
+import os
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+TOKEN_STORE = os.getenv("TOKEN_STORE", "memory")
+TOKEN_STORE_PURGE_INTERVAL_SECONDS = int(os.getenv("TOKEN_STORE_PURGE_INTERVAL_SECONDS", "60"))
+TOKEN_STORE_MAX_TOKENS = int(os.getenv("TOKEN_STORE_MAX_TOKENS", "100000"))
+
+
+class TokenStore(ABC):
+    @abstractmethod
+    def add(self, token: str, expiry: datetime):
+        pass
+
+    @abstractmethod
+    def get(self, token: str) -> Optional[datetime]:
+        pass
+
+    async def get_async(self, token: str) -> Optional[datetime]:
+        return await run_in_threadpool(self.get, token)
+
+    @abstractmethod
+    def clear_expired(self) -> int:
+        pass
+
+    async def clear_expired_async(self) -> int:
+        return await run_in_threadpool(self.clear_expired)
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+
+class InMemoryTokenStore(TokenStore):
+    """Keeps tokens in a dict and their expiry times in a min-heap.
+
+    Purging pops only the expired entries off the top of the heap, and once max_tokens is reached
+    the tokens closest to expiring are evicted first.
+    """
+
+    def __init__(self, max_tokens: int = TOKEN_STORE_MAX_TOKENS):
+        self.max_tokens = max_tokens
+        self.tokens: Dict[str, datetime] = {}
+        self.expiry_heap: List[Tuple[datetime, str]] = []
+        self.lock = threading.Lock()
+
+    def add(self, token: str, expiry: datetime):
+        with self.lock:
+            self.tokens[token] = expiry
+            heapq.heappush(self.expiry_heap, (expiry, token))
+            while len(self.tokens) > self.max_tokens:
+                if self._pop():
+                    logger.warning("Token store is full - evicted the token closest to expiring.")
+
+    def get(self, token: str) -> Optional[datetime]:
+        return self.tokens.get(token)
+
+    async def get_async(self, token: str) -> Optional[datetime]:
+        return self.get(token)
+
+    def clear_expired(self) -> int:
+        current_time = datetime.now(timezone.utc)
+        removed = 0
+        with self.lock:
+            while self.expiry_heap and self.expiry_heap[0][0] < current_time:
+                removed += self._pop()
+        return removed
+
+    async def clear_expired_async(self) -> int:
+        return self.clear_expired()
+
+    def clear(self):
+        with self.lock:
+            self.tokens.clear()
+            self.expiry_heap.clear()
+
+    def _pop(self) -> bool:
+        expiry, token = heapq.heappop(self.expiry_heap)
+        if self.tokens.get(token) != expiry:
+            return False
+        del self.tokens[token]
+        return True
+
+
+class DatabaseTokenStore(TokenStore):
+    """Keeps tokens in the issued_tokens table, so that every worker accepts the tokens issued by the others.
+
+    With an async_session_factory, the async lookups and purges run on the event loop instead of the threadpool.
+    """
+
+    def __init__(
+            self,
+            session_factory: sessionmaker,
+            purge_interval: int = TOKEN_STORE_PURGE_INTERVAL_SECONDS,
+            async_session_factory: Optional[async_sessionmaker] = None
+    ):
+        self.session_factory = session_factory
+        self.async_session_factory = async_session_factory
+        self.purge_interval = purge_interval
+        self.last_purge = 0.0
+
+    def add(self, token: str, expiry: datetime):
+        # Logins of the same user within the same second produce the same token.
+        statement = pg_insert(models.IssuedToken).values(token=token, expires_at=expiry)
+        statement = statement.on_conflict_do_update(
+            index_elements=[models.IssuedToken.token],
+            set_={"expires_at": statement.excluded.expires_at}
+        )
+        with self.session_factory() as db:
+            db.execute(statement)
+            db.commit()
+
+    def get(self, token: str) -> Optional[datetime]:
+        with self.session_factory() as db:
+            return db.query(models.IssuedToken.expires_at)\
+                .filter(models.IssuedToken.token == token)\
+                .scalar()
+
+    async def get_async(self, token: str) -> Optional[datetime]:
+        if self.async_session_factory is None:
+            return await super().get_async(token)
+        async with self.async_session_factory() as db:
+            return await db.scalar(select(models.IssuedToken.expires_at).filter(models.IssuedToken.token == token))
+
+    def clear_expired(self) -> int:
+        if time.monotonic() - self.last_purge < self.purge_interval:
+            return 0
+        self.last_purge = time.monotonic()
+        with self.session_factory() as db:
+            removed = db.query(models.IssuedToken)\
+                .filter(models.IssuedToken.expires_at < datetime.now(timezone.utc))\
+                .delete(synchronize_session=False)
+            db.commit()
+        return removed
+
+    async def clear_expired_async(self) -> int:
+        if self.async_session_factory is None:
+            return await super().clear_expired_async()
+        if time.monotonic() - self.last_purge < self.purge_interval:
+            return 0
+        self.last_purge = time.monotonic()
+        async with self.async_session_factory() as db:
+            result = await db.execute(
+                delete(models.IssuedToken).filter(models.IssuedToken.expires_at < datetime.now(timezone.utc))
+            )
+            await db.commit()
+        return result.rowcount
+
+    def clear(self):
+        with self.session_factory() as db:
+            db.query(models.IssuedToken).delete(synchronize_session=False)
+            db.commit()
+
+
+def create_token_store() -> TokenStore:
+    if TOKEN_STORE == "database":
+        logger.info("Using the database token store.")
+        if DATABASE_MODE == "async":
+            from ..database.async_database import AsyncSessionLocal
+            return DatabaseTokenStore(SessionLocal, async_session_factory=AsyncSessionLocal)
+        return DatabaseTokenStore(SessionLocal)
+    if TOKEN_STORE != "memory":
+        raise RuntimeError(f"Unknown token store: {TOKEN_STORE}")
+    logger.info("Using the in-memory token store.")
+    return InMemoryTokenStore()
@@ -0,0 +1,382 @@
+import argparse
+import itertools
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload, selectinload
+from dotenv import load_dotenv
+from api.crud import crud
+from api.models import models
+from api.schemas import schemas
+from api.utils import helpers
+from api.utils.pagination import encode_cursor
+from api.utils.query_counter import QueryCounter
+from .seed import seed
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+BENCHMARK_DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL")
+DEFAULT_SCALES = [10_000, 100_000, 1_000_000]
+PAGE_SIZE = 100
+BATCH_SIZE = 100
+
+
+class Samples:
+    """Rows picked from the seeded database that the benchmark cases read and modify."""
+
+    def __init__(self, db: Session, count: int):
+        charging_station = db.query(models.ChargingStation)\
+            .options(joinedload(models.ChargingStation.type), selectinload(models.ChargingStation.connectors))\
+            .order_by(models.ChargingStation.id)\
+            .offset(count // 2)\
+            .first()
+        self.count = count
+        self.charging_station_id = charging_station.id
+        self.charging_station_type_id = charging_station.type_id
+        self.connector_id = charging_station.connectors[0].id
+        self.cursor = encode_cursor(charging_station.id)
+        self.charging_station_ids = {
+            charging_station_id for charging_station_id, in db.query(models.ChargingStation.id).limit(BATCH_SIZE)
+        }
+        self.charging_station_type_data = schemas.ChargingStationTypeCreate(
+            name=f"{charging_station.type.name} Updated",
+            plug_count=charging_station.type.plug_count,
+            efficiency=charging_station.type.efficiency,
+            current_type=charging_station.type.current_type
+        )
+        self.charging_station_data = schemas.ChargingStationCreate(
+            name=f"{charging_station.name} Updated",
+            device_id=charging_station.device_id,
+            ip_address=str(charging_station.ip_address),
+            firmware_version=charging_station.firmware_version,
+            type_id=charging_station.type_id,
+            connectors=[
+                {
+                    "name": f"{connector.name} Updated" if connector.priority else connector.name,
+                    "priority": connector.priority
+                }
+                for connector in charging_station.connectors
+            ]
+        )
+        self.new_station_type_id = db.query(models.ChargingStationType.id)\
+            .filter(models.ChargingStationType.plug_count == 2)\
+            .order_by(models.ChargingStationType.name)\
+            .limit(1)\
+            .scalar()
+
+    def new_charging_station(self, index: int) -> schemas.ChargingStationCreate:
+        return schemas.ChargingStationCreate(
+            name=f"New Benchmark Station {index}",
+            ip_address=f"192.168.{index // 256}.{index % 256}",
+            firmware_version="2.0",
+            type_id=self.new_station_type_id,
+            connectors=[
+                {"name": f"New Benchmark Connector {index}-1", "priority": True},
+                {"name": f"New Benchmark Connector {index}-2", "priority": False},
+            ]
+        )
+
+
+class Case:
+    def __init__(
+            self,
+            name: str,
+            run: Callable[[Session, Samples, Any], Any],
+            setup: Optional[Callable[[Session, Samples], Any]] = None
+    ):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+def list_stations(db: Session, samples: Samples, **filters):
+    arguments = {
+        "plug_count": None,
+        "min_efficiency": None,
+        "max_efficiency": None,
+        "current_type": None,
+        "firmware_version": None,
+        "skip": 0,
+        "limit": PAGE_SIZE,
+        **filters,
+    }
+    return crud.get_charging_station_list(db, **arguments)
+
+
+def list_types(db: Session, **filters):
+    arguments = {
+        "plug_count": None,
+        "min_efficiency": None,
+        "max_efficiency": None,
+        "current_type": None,
+        "skip": 0,
+        "limit": PAGE_SIZE,
+        **filters,
+    }
+    return crud.get_charging_station_type_list(db, **arguments)
+
+
+def list_connectors(db: Session, **filters):
+    arguments = {"priority": None, "charging_station_id": None, "skip": 0, "limit": PAGE_SIZE, **filters}
+    return crud.get_connector_list(db, **arguments)
+
+
+def create_disposable_type(db: Session, samples: Samples):
+    return crud.create_charging_station_type(db, schemas.ChargingStationTypeCreate(
+        name="Disposable Benchmark Type",
+        plug_count=1,
+        efficiency=50,
+        current_type="AC"
+    )).id
+
+
+CASES: List[Case] = [
+    Case("get_charging_station_type", lambda db, s, _: crud.get_charging_station_type(db, s.charging_station_type_id)),
+    Case(
+        "get_charging_station_type_etag",
+        lambda db, s, _: crud.get_charging_station_type_etag(db, s.charging_station_type_id)
+    ),
+    Case("get_charging_station_type_list", lambda db, s, _: list_types(db)),
+    Case("get_charging_station_type_list[plug_count]", lambda db, s, _: list_types(db, plug_count=2)),
+    Case(
+        "get_charging_station_type_list[current_type,min_efficiency]",
+        lambda db, s, _: list_types(db, current_type="DC", min_efficiency=85)
+    ),
+    Case("get_charging_station", lambda db, s, _: crud.get_charging_station(db, s.charging_station_id)),
+    Case("get_charging_station_etag", lambda db, s, _: crud.get_charging_station_etag(db, s.charging_station_id)),
+    Case("get_charging_station_list", lambda db, s, _: list_stations(db, s)),
+    Case("get_charging_station_list[plug_count]", lambda db, s, _: list_stations(db, s, plug_count=2)),
+    Case("get_charging_station_list[min_efficiency]", lambda db, s, _: list_stations(db, s, min_efficiency=88)),
+    Case("get_charging_station_list[max_efficiency]", lambda db, s, _: list_stations(db, s, max_efficiency=85)),
+    Case("get_charging_station_list[current_type]", lambda db, s, _: list_stations(db, s, current_type="DC")),
+    Case(
+        "get_charging_station_list[firmware_version]",
+        lambda db, s, _: list_stations(db, s, firmware_version="1.5")
+    ),
+    Case(
+        "get_charging_station_list[all filters]",
+        lambda db, s, _: list_stations(
+            db, s, plug_count=2, min_efficiency=80, max_efficiency=90, current_type="AC", firmware_version="1.5"
+        )
+    ),
+    Case("get_charging_station_list[deep skip]", lambda db, s, _: list_stations(db, s, skip=s.count - PAGE_SIZE)),
+    Case("get_charging_station_list[cursor]", lambda db, s, _: list_stations(db, s, cursor=s.cursor)),
+    Case(
+        f"stream_charging_stations[{PAGE_SIZE * 10} rows]",
+        lambda db, s, _: list(itertools.islice(crud.stream_charging_stations(db, PAGE_SIZE), PAGE_SIZE * 10))
+    ),
+    Case("get_connector", lambda db, s, _: crud.get_connector(db, s.connector_id)),
+    Case("get_connector_etag", lambda db, s, _: crud.get_connector_etag(db, s.connector_id)),
+    Case("get_connector_list", lambda db, s, _: list_connectors(db)),
+    Case("get_connector_list[priority]", lambda db, s, _: list_connectors(db, priority=True)),
+    Case(
+        "get_connector_list[charging_station_id]",
+        lambda db, s, _: list_connectors(db, charging_station_id=s.charging_station_id)
+    ),
+    Case("get_connector_list[deep skip]", lambda db, s, _: list_connectors(db, skip=s.count - PAGE_SIZE)),
+    Case(
+        "create_charging_station_type",
+        lambda db, s, _: crud.create_charging_station_type(db, schemas.ChargingStationTypeCreate(
+            name="New Benchmark Type",
+            plug_count=2,
+            efficiency=90,
+            current_type="DC"
+        ))
+    ),
+    Case(
+        "update_charging_station_type",
+        lambda db, s, _: crud.update_charging_station_type(
+            db, s.charging_station_type_id, s.charging_station_type_data
+        )
+    ),
+    Case(
+        "delete_charging_station_type",
+        lambda db, s, charging_station_type_id: crud.delete_charging_station_type(db, charging_station_type_id),
+        setup=create_disposable_type
+    ),
+    Case("create_charging_station", lambda db, s, _: crud.create_charging_station(db, s.new_charging_station(0))),
+    Case(
+        f"create_charging_station_bulk[{BATCH_SIZE}]",
+        lambda db, s, _: crud.create_charging_station_bulk(db, [s.new_charging_station(i) for i in range(BATCH_SIZE)])
+    ),
+    Case(
+        "update_charging_station",
+        lambda db, s, _: crud.update_charging_station(db, s.charging_station_id, s.charging_station_data)
+    ),
+    Case("delete_charging_station", lambda db, s, _: crud.delete_charging_station(db, s.charging_station_id)),
+    Case(
+        "create_connector",
+        lambda db, s, _: crud.create_connector(
+            db, schemas.ConnectorCreate(name="New Benchmark Connector", priority=False)
+        )
+    ),
+    Case(
+        "update_connector",
+        lambda db, s, _: crud.update_connector(db, s.connector_id, schemas.ConnectorCreate(
+            name="Updated Benchmark Connector",
+            priority=True,
+            charging_station_id=s.charging_station_id
+        ))
+    ),
+    Case(
+        f"upsert_connector_bulk[{BATCH_SIZE}]",
+        lambda db, s, _: crud.upsert_connector_bulk(db, [
+            schemas.ConnectorCreate(name=f"Upserted Benchmark Connector {i}", priority=False) for i in range(BATCH_SIZE)
+        ])
+    ),
+    Case("delete_connector", lambda db, s, _: crud.delete_connector(db, s.connector_id)),
+    Case("helpers.get_connector_count", lambda db, s, _: helpers.get_connector_count(db, s.charging_station_id)),
+    Case(
+        "helpers.check_connector_count_station",
+        lambda db, s, _: helpers.check_connector_count_station(db, s.new_charging_station(0))
+    ),
+    Case(
+        f"helpers.check_charging_stations_exist[{BATCH_SIZE}]",
+        lambda db, s, _: helpers.check_charging_stations_exist(db, s.charging_station_ids)
+    ),
+    Case(
+        f"helpers.validate_charging_station_batch[{BATCH_SIZE}]",
+        lambda db, s, _: helpers.validate_charging_station_batch(
+            db, [s.new_charging_station(i) for i in range(BATCH_SIZE)]
+        )
+    ),
+    Case(
+        f"helpers.check_connector_count_station_list[{PAGE_SIZE}]",
+        lambda db, s, charging_stations: helpers.check_connector_count_station_list(charging_stations),
+        setup=lambda db, s: list_stations(db, s)
+    ),
+]
+
+
+def execute(engine: Engine, case: Case, samples: Samples, trace: bool = False) -> dict:
+    """Run a case once inside a transaction that is rolled back afterwards, so writes don't change the dataset.
+
+    The crud functions commit through a savepoint of that transaction.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            argument = case.setup(db, samples) if case.setup else None
+            # Opens the savepoint now, so that it is not counted as one of the case's queries.
+            db.connection()
+            if trace:
+                tracemalloc.start()
+                with QueryCounter(engine) as counter:
+                    case.run(db, samples, argument)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                return {"queries": counter.count, "peak_bytes": peak}
+            start = time.perf_counter()
+            case.run(db, samples, argument)
+            return {"seconds": time.perf_counter() - start}
+        finally:
+            db.close()
+            transaction.rollback()
+
+
+def benchmark(engine: Engine, case: Case, samples: Samples, repeat: int) -> dict:
+    execute(engine, case, samples)
+    timings = [execute(engine, case, samples)["seconds"] for _ in range(repeat)]
+    return {
+        "median_seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        **execute(engine, case, samples, trace=True),
+    }
+
+
+def compare(result: dict, baseline: Optional[dict], threshold: float) -> str:
+    if baseline is None:
+        return ""
+    ratio = result["median_seconds"] / baseline["median_seconds"]
+    notes = [f"{ratio:.2f}x"]
+    if ratio > 1 + threshold:
+        notes.append("SLOWER")
+    if result["queries"] != baseline["queries"]:
+        notes.append(f"queries {baseline['queries']} -> {result['queries']}")
+    return " ".join(notes)
+
+
+def is_regression(result: dict, baseline: Optional[dict], threshold: float) -> bool:
+    return baseline is not None and (
+        result["median_seconds"] > baseline["median_seconds"] * (1 + threshold)
+        or result["queries"] > baseline["queries"]
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the crud layer against a seeded Postgres database.")
+    parser.add_argument(
+        "--database-url",
+        default=BENCHMARK_DATABASE_URL,
+        help="Database to seed and benchmark. All charging station data in it is replaced. "
+             "Defaults to BENCHMARK_DATABASE_URL."
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Numbers of stations to seed.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs of every case.")
+    parser.add_argument("--filter", help="Only run the cases whose name contains this text.")
+    parser.add_argument("--reseed", action="store_true", help="Seed the database even if it has the right size.")
+    parser.add_argument("--baseline", help="JSON file with results of an earlier run to compare against.")
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown over the baseline median reported as a regression, 0.2 means 20%%."
+    )
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("Provide --database-url or set BENCHMARK_DATABASE_URL.")
+    if args.database_url == os.getenv("DATABASE_URL"):
+        parser.error("The benchmark replaces all charging station data, use a database other than DATABASE_URL.")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    engine = create_engine(args.database_url)
+    cases = [case for case in CASES if not args.filter or args.filter in case.name]
+    results, regressions = {}, []
+    for scale in args.scales:
+        seed(engine, scale, args.reseed)
+        with Session(engine) as db:
+            samples = Samples(db, scale)
+
+        print(f"\n{scale} charging stations")
+        print(f"{'case':<62} {'median ms':>10} {'min ms':>10} {'queries':>8} {'peak KiB':>10}  baseline")
+        results[str(scale)] = {}
+        for case in cases:
+            result = benchmark(engine, case, samples, args.repeat)
+            case_baseline = baseline.get(str(scale), {}).get(case.name)
+            results[str(scale)][case.name] = result
+            if is_regression(result, case_baseline, args.threshold):
+                regressions.append(f"{scale} {case.name}")
+            print(
+                f"{case.name:<62} {result['median_seconds'] * 1000:>10.2f} {result['min_seconds'] * 1000:>10.2f} "
+                f"{result['queries']:>8} {result['peak_bytes'] / 1024:>10.1f}  "
+                f"{compare(result, case_baseline, args.threshold)}"
+            )
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        print(f"\nSaved the results to {args.save_baseline}.")
+    if regressions:
+        print("\nRegressions against the baseline:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,358 @@
+import argparse
+import asyncio
+import contextlib
+import ipaddress
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List
+import httpx
+
+SCENARIOS = ["login", "read_station", "list_stations", "update_connector", "update_station"]
+DEFAULT_MIX = "login=5,read_station=45,list_stations=30,update_connector=10,update_station=10"
+LIST_FILTERS = [
+    {},
+    {"plug_count": 2},
+    {"current_type": "DC"},
+    {"min_efficiency": 85, "max_efficiency": 95},
+    {"firmware_version": "load-test"},
+]
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(percent / 100 * len(sorted_values)) - 1))]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}. Choose from {', '.join(SCENARIOS)}.")
+        weights[name] = float(weight)
+    return weights
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses = Counter()
+        self.errors = 0
+
+    def record(self, seconds: float, status: int | None):
+        self.latencies.append(seconds)
+        self.statuses[status or "error"] += 1
+        if status is None or status >= 400:
+            self.errors += 1
+
+
+class Recorder:
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.dropped = 0
+
+    def record(self, name: str, seconds: float, status: int | None):
+        self.endpoints.setdefault(name, EndpointStats()).record(seconds, status)
+
+    def summarize(self, name: str, stats: List[EndpointStats], duration: float) -> dict:
+        latencies = sorted(latency for endpoint in stats for latency in endpoint.latencies)
+        requests = len(latencies)
+        errors = sum(endpoint.errors for endpoint in stats)
+        statuses = sum((endpoint.statuses for endpoint in stats), Counter())
+        return {
+            "endpoint": name,
+            "requests": requests,
+            "throughput": requests / duration,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "error_rate": errors / requests if requests else 0.0,
+            "statuses": dict(sorted(statuses.items(), key=str)),
+        }
+
+    def report(self, duration: float) -> List[dict]:
+        rows = [self.summarize(name, [stats], duration) for name, stats in sorted(self.endpoints.items())]
+        rows.append(self.summarize("total", list(self.endpoints.values()), duration))
+        return rows
+
+
+class Workload:
+    """Mixed workload of one load-test user: logins, station reads, filtered list pages and writes.
+
+    setup creates the user and a fleet of charging stations tagged with a run id, so the writes only touch rows
+    created by this run.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, stations: int, token_ttl: float):
+        self.client = client
+        self.recorder = recorder
+        self.station_count = stations
+        self.token_ttl = token_ttl
+        self.run_id = uuid.uuid4().hex[:8]
+        self.username = f"load-test-{self.run_id}"
+        self.password = uuid.uuid4().hex
+        self.token = None
+        self.token_time = 0.0
+        self.login_lock = asyncio.Lock()
+        self.stations: List[dict] = []
+
+    async def request(self, name: str, method: str, url: str, **kwargs) -> httpx.Response | None:
+        if name != "login" and time.monotonic() - self.token_time > self.token_ttl:
+            await self.renew_token()
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(name, time.perf_counter() - start, None)
+            return None
+        self.recorder.record(name, time.perf_counter() - start, response.status_code)
+        if response.status_code == 401 and name != "login":
+            await self.renew_token()
+        return response
+
+    async def login(self):
+        response = await self.request("login", "POST", "/token/", data={
+            "username": self.username,
+            "password": self.password,
+        })
+        if response is not None and response.status_code == 200:
+            self.token = response.json()["access_token"]
+            self.token_time = time.monotonic()
+
+    async def renew_token(self):
+        # Only the first of the virtual users that find the token stale logs in again, the rest wait for it.
+        token = self.token
+        async with self.login_lock:
+            if self.token == token:
+                await self.login()
+
+    async def setup(self):
+        response = await self.client.post("/users/", json={"username": self.username, "password": self.password})
+        response.raise_for_status()
+        await self.login()
+        if self.token is None:
+            raise RuntimeError("Unable to log in the load test user.")
+        headers = {"Authorization": f"Bearer {self.token}"}
+
+        types = (await self.client.get("/charging_station_types/", headers=headers)).raise_for_status().json()
+        first_address = ipaddress.IPv4Address("10.0.0.0") + random.randrange(2 ** 24 - self.station_count)
+        payload = []
+        for i in range(self.station_count):
+            charging_station_type = types[i % len(types)]
+            payload.append({
+                "name": f"Load Test {self.run_id} Station {i}",
+                "ip_address": str(first_address + i),
+                "firmware_version": "load-test",
+                "type_id": charging_station_type["id"],
+                "connectors": [
+                    {"name": f"Load Test {self.run_id} Connector {i}-{plug}", "priority": plug == 0}
+                    for plug in range(charging_station_type["plug_count"])
+                ],
+            })
+        response = await self.client.post("/charging_stations/bulk", json=payload, headers=headers)
+        result = response.raise_for_status().json()
+        for charging_station_id in result["created"]:
+            response = await self.client.get(f"/charging_stations/{charging_station_id}", headers=headers)
+            self.stations.append(response.raise_for_status().json())
+        if not self.stations:
+            raise RuntimeError(f"Unable to create charging stations for the load test: {result['errors'][:3]}")
+
+    async def read_station(self):
+        station = random.choice(self.stations)
+        await self.request("read_station", "GET", f"/charging_stations/{station['id']}")
+
+    async def list_stations(self):
+        params = {"limit": 50, **random.choice(LIST_FILTERS)}
+        await self.request("list_stations", "GET", "/charging_stations/", params=params)
+
+    async def update_connector(self):
+        station = random.choice(self.stations)
+        connector = random.choice(station["connectors"])
+        await self.request("update_connector", "PUT", f"/connectors/{connector['id']}", json={
+            "name": connector["name"],
+            "priority": connector["priority"],
+            "charging_station_id": station["id"],
+        })
+
+    async def update_station(self):
+        station = random.choice(self.stations)
+        await self.request("update_station", "PUT", f"/charging_stations/{station['id']}", json={
+            "name": station["name"],
+            "device_id": station["device_id"],
+            "ip_address": station["ip_address"],
+            "firmware_version": "load-test",
+            "type_id": station["type"]["id"],
+            "connectors": [
+                {"name": connector["name"], "priority": connector["priority"]} for connector in station["connectors"]
+            ],
+        })
+
+
+async def run_load(base_url: str, args) -> List[dict]:
+    weights = parse_mix(args.mix)
+    names, cumulative = list(weights), list(weights.values())
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        workload = Workload(client, recorder, args.stations, args.token_ttl)
+        await workload.setup()
+        recorder.endpoints.clear()
+
+        async def operation():
+            await getattr(workload, random.choices(names, cumulative)[0])()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        end = start + args.duration
+
+        if args.rate:
+            # Open model: requests arrive as a Poisson process no matter how fast the server answers. Arrivals
+            # that find every slot busy are dropped and reported, like a client that gives up.
+            slots = asyncio.Semaphore(args.concurrency)
+            tasks = set()
+
+            async def arrival():
+                async with slots:
+                    await operation()
+
+            arrival_time = start
+            while True:
+                arrival_time += random.expovariate(args.rate)
+                if arrival_time >= end:
+                    break
+                await asyncio.sleep(max(0.0, arrival_time - loop.time()))
+                if slots.locked():
+                    recorder.dropped += 1
+                    continue
+                task = asyncio.create_task(arrival())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        else:
+            # Closed model: every virtual user sends its next request as soon as the previous one is answered.
+            async def user():
+                while loop.time() < end:
+                    await operation()
+
+            await asyncio.gather(*(user() for _ in range(args.concurrency)))
+
+        duration = loop.time() - start
+    rows = recorder.report(duration)
+    rows[-1]["dropped"] = recorder.dropped
+    return rows
+
+
+def print_report(rows: List[dict], title: str, concurrency: int):
+    print(f"\n{title}")
+    print(
+        f"{'endpoint':<18} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}"
+        "  statuses"
+    )
+    for row in rows:
+        print(
+            f"{row['endpoint']:<18} {row['requests']:>9} {row['throughput']:>9.1f} {row['p50_ms']:>9.1f} "
+            f"{row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['error_rate']:>8.2%}  {row['statuses']}"
+        )
+    if rows[-1].get("dropped"):
+        print(f"{rows[-1]['dropped']} arrivals were dropped because all {concurrency} slots were busy.")
+
+
+@contextlib.contextmanager
+def serve(workers: int, port: int, startup_timeout: float):
+    """Start uvicorn with the given number of workers on the local port and stop it afterwards.
+
+    Tokens and cache versions have to be shared between workers, so TOKEN_STORE and RESPONSE_CACHE default to
+    database when there is more than one.
+    """
+    env = dict(os.environ)
+    if workers > 1:
+        env.setdefault("TOKEN_STORE", "database")
+        env.setdefault("RESPONSE_CACHE", "database")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--no-access-log"],
+        env=env
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}.")
+            try:
+                if httpx.get(f"{base_url}/docs", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn did not start within {startup_timeout} seconds.")
+            time.sleep(0.5)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a mixed, token-authenticated HTTP workload against the API.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="API to load when --workers is not set.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        help="Start a local uvicorn with each of these worker counts in turn and load it, instead of --base-url."
+    )
+    parser.add_argument("--port", type=int, default=8100, help="Port of the uvicorn started for --workers.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load per run.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Virtual users, or in-flight requests with --rate.")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="Requests per second arriving as a Poisson process. 0 runs a closed loop of --concurrency users."
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights. Scenarios: {', '.join(SCENARIOS)}.")
+    parser.add_argument("--stations", type=int, default=200, help="Charging stations created for the run.")
+    parser.add_argument("--token-ttl", type=float, default=90, help="Seconds after which a token is renewed.")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds.")
+    parser.add_argument("--startup-timeout", type=float, default=60, help="Seconds to wait for uvicorn to start.")
+    args = parser.parse_args(argv)
+
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not args.workers:
+        print_report(asyncio.run(run_load(args.base_url, args)), args.base_url, args.concurrency)
+        return
+
+    sweep = {}
+    for workers in args.workers:
+        with serve(workers, args.port, args.startup_timeout) as base_url:
+            rows = asyncio.run(run_load(base_url, args))
+        print_report(rows, f"{workers} uvicorn worker(s)", args.concurrency)
+        sweep[workers] = rows[-1]
+
+    print(f"\n{'workers':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>8} {'speedup':>8}")
+    for workers, total in sweep.items():
+        speedup = total["throughput"] / sweep[args.workers[0]]["throughput"]
+        print(
+            f"{workers:>7} {total['throughput']:>9.1f} {total['p50_ms']:>9.1f} {total['p99_ms']:>9.1f} "
+            f"{total['error_rate']:>8.2%} {speedup:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+import logging
+import time
+from api.database.base import Base
+from api.database.seed import seed_charging_station_types
+
+logger = logging.getLogger(__name__)
+
+TRUNCATE = "TRUNCATE connectors, charging_stations, charging_station_types"
+
+# Ids, names and addresses are derived from the row number, so every seeded database of a given size holds the
+# same rows and benchmark runs stay comparable. The version and variant digits make the ids valid UUID4s.
+UUID4 = "overlay(overlay(md5({}) placing '4' from 13) placing '8' from 17)::uuid"
+
+SEED_CHARGING_STATIONS = f"""
+    INSERT INTO charging_stations (id, name, device_id, ip_address, firmware_version, type_id, connector_count)
+    SELECT {UUID4.format("'station-' || i")}, 'Benchmark Station ' || i, {UUID4.format("'device-' || i")},
+           '10.0.0.0'::inet + i, '1.' || (i % 10), t.id, t.plug_count
+    FROM generate_series(1, :count) AS i
+    JOIN (
+        SELECT id, plug_count, row_number() OVER (ORDER BY name) - 1 AS position
+        FROM charging_station_types
+    ) t ON t.position = i % :type_count
+"""
+
+SEED_CONNECTORS = f"""
+    INSERT INTO connectors (id, name, priority, charging_station_id)
+    SELECT {UUID4.format("'connector-' || s.id || '-' || c")}, 'Benchmark Connector ' || s.id || '-' || c, c = 1, s.id
+    FROM charging_stations s, generate_series(1, s.connector_count) AS c
+"""
+
+
+def seeded_count(engine: Engine) -> int:
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT count(*) FROM charging_stations")).scalar_one()
+
+
+def seed(engine: Engine, count: int, reseed: bool = False):
+    """Fill the database with count charging stations of the default types, each with a full set of connectors."""
+    Base.metadata.create_all(bind=engine)
+    if not reseed and seeded_count(engine) == count:
+        logger.info(f"The database already holds {count} charging stations.")
+        return
+
+    start = time.perf_counter()
+    with Session(engine) as db:
+        db.execute(text(TRUNCATE))
+        db.commit()
+        seed_charging_station_types(db)
+        type_count = db.execute(text("SELECT count(*) FROM charging_station_types")).scalar_one()
+        db.execute(text(SEED_CHARGING_STATIONS), {"count": count, "type_count": type_count})
+        db.execute(text(SEED_CONNECTORS))
+        db.commit()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE charging_station_types, charging_stations, connectors"))
+    logger.info(f"Seeded {count} charging stations in {time.perf_counter() - start:.1f}s.")
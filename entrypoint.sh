@@ -7,5 +7,12 @@ echo "Migrate"
 alembic upgrade head
 echo "============================="
 
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+  echo "Clear metrics directory"
+  rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+  echo "============================="
+fi
+
 echo "Start server"
 uvicorn api.main:app --reload --port=8000 --host=0.0.0.0
\ No newline at end of file